@@ -1,12 +1,33 @@
 """
-PostgreSQL Database Connection Test
-Tests connection to Render.com hosted PostgreSQL database
+PostgreSQL Database Connection Test & Latency Probe
+Tests connection to Render.com hosted PostgreSQL database and measures where time goes
+
+Modes:
+    check    - connect once, print server version and check Django tables
+    probe    - cold connect vs. pooled checkout, query round-trip percentiles,
+               concurrency sweep to find the saturation point (default)
+    indexes  - duplicate/prefix-redundant, unused and bloated indexes on the
+               invitations tables plus per-table write amplification
+
+Usage:
+    python test_db_connection.py                          # probe, table output
+    python test_db_connection.py --mode check
+    python test_db_connection.py --samples 200 --workers 1,2,4,8,16,32 --format json
+    python test_db_connection.py --mode indexes [--tables 'evaluation_invitations%,participant_permissions']
+    DB_HOST=localhost DB_NAME=ahp_app DB_USER=postgres python test_db_connection.py
 """
 
+import argparse
+import json
 import os
+import statistics
+import sys
+import threading
+import time
+
 import psycopg2
 from psycopg2 import OperationalError
-import sys
+from psycopg2 import pool as pg_pool
 
 # Database connection parameters from environment variables
 DB_CONFIG = {
@@ -17,6 +38,120 @@ DB_CONFIG = {
     'port': int(os.environ.get('DB_PORT', 5432))
 }
 
+# Representative queries: (name, required table, sample query, query)
+# The sample query picks real parameter values so the query hits actual rows/indexes.
+PROBE_QUERIES = [
+    ('select_1', None, None, "SELECT 1"),
+    (
+        'invitation_by_token',
+        'evaluation_invitations',
+        "SELECT token_hash FROM evaluation_invitations WHERE token_hash IS NOT NULL LIMIT 1",
+        "SELECT id, project_id, status, expires_at FROM evaluation_invitations WHERE token_hash = %s"
+    ),
+    (
+        'project_pending_page',
+        'evaluation_invitations',
+        "SELECT project_id FROM evaluation_invitations WHERE status = 'pending' LIMIT 1",
+        """
+            SELECT id, invitee_email, invitee_name, created_at
+            FROM evaluation_invitations
+            WHERE project_id = %s AND status = 'pending'
+            ORDER BY created_at DESC, id DESC
+            LIMIT 20
+        """
+    ),
+    (
+        'permission_lookup',
+        'participant_permissions',
+        "SELECT user_id, project_id FROM participant_permissions LIMIT 1",
+        "SELECT * FROM participant_permissions WHERE user_id = %s AND project_id = %s"
+    )
+]
+
+# Query used by concurrency sweep workers (first available of these)
+SWEEP_QUERY_PREFERENCE = ['project_pending_page', 'invitation_by_token', 'select_1']
+
+# A level is "saturated" when throughput grows less than this vs. the previous level
+SATURATION_GAIN = 1.10
+
+# Index inspector: tables of the invitations app (LIKE patterns, partitions included)
+INSPECT_TABLE_PATTERNS = [
+    'evaluation_invitations%',
+    'participant_permissions',
+    'permission_templates',
+    'invitation_%'
+]
+
+# Flag an index as bloated above this actual/estimated size ratio (and min size)
+BLOAT_RATIO = 2.0
+BLOAT_MIN_BYTES = 1024 * 1024
+
+# All index facts in one catalog round trip: definition, key columns, usage,
+# sizes, estimated key width (pg_stats) and the owning table's write counters.
+# Partitioned parent indexes (relkind 'I') have no storage or usage stats of their
+# own; they are skipped and every partition's index is reported on its own instead.
+INDEX_INSPECT_SQL = """
+    SELECT
+        ct.relname AS table_name,
+        ci.relname AS index_name,
+        am.amname AS method,
+        pg_get_indexdef(i.indexrelid) AS definition,
+        ARRAY(
+            SELECT COALESCE(a.attname, 'expr')
+            FROM unnest(i.indkey) WITH ORDINALITY AS k(attnum, ord)
+            LEFT JOIN pg_attribute a ON a.attrelid = i.indrelid AND a.attnum = k.attnum
+            WHERE k.ord <= i.indnkeyatts
+            ORDER BY k.ord
+        ) AS columns,
+        ARRAY(
+            SELECT COALESCE(oc.opcname, '')
+            FROM unnest(i.indclass::oid[]) WITH ORDINALITY AS k(opclass, ord)
+            LEFT JOIN pg_opclass oc ON oc.oid = k.opclass
+            WHERE k.ord <= i.indnkeyatts
+            ORDER BY k.ord
+        ) AS opclasses,
+        ARRAY(
+            SELECT COALESCE(co.collname, '')
+            FROM unnest(i.indcollation::oid[]) WITH ORDINALITY AS k(collid, ord)
+            LEFT JOIN pg_collation co ON co.oid = k.collid
+            WHERE k.ord <= i.indnkeyatts
+            ORDER BY k.ord
+        ) AS collations,
+        pg_get_expr(i.indexprs, i.indrelid) AS expressions,
+        pg_get_expr(i.indpred, i.indrelid) AS predicate,
+        i.indisunique AS is_unique,
+        i.indisprimary AS is_primary,
+        EXISTS (SELECT 1 FROM pg_constraint c WHERE c.conindid = i.indexrelid) AS backs_constraint,
+        COALESCE(s.idx_scan, 0) AS idx_scan,
+        COALESCE(s.idx_tup_read, 0) AS idx_tup_read,
+        pg_relation_size(i.indexrelid) AS index_bytes,
+        ci.relpages AS index_pages,
+        ct.reltuples AS table_rows,
+        (
+            SELECT SUM(st.avg_width)
+            FROM unnest(i.indkey) WITH ORDINALITY AS k(attnum, ord)
+            JOIN pg_attribute a ON a.attrelid = i.indrelid AND a.attnum = k.attnum
+            JOIN pg_stats st ON st.schemaname = n.nspname AND st.tablename = ct.relname AND st.attname = a.attname
+            WHERE k.ord <= i.indnkeyatts
+        ) AS key_width,
+        pg_relation_size(ct.oid) AS table_bytes,
+        COALESCE(t.n_tup_ins, 0) AS n_tup_ins,
+        COALESCE(t.n_tup_upd, 0) AS n_tup_upd,
+        COALESCE(t.n_tup_hot_upd, 0) AS n_tup_hot_upd,
+        COALESCE(t.n_tup_del, 0) AS n_tup_del,
+        (SELECT stats_reset FROM pg_stat_database WHERE datname = current_database()) AS stats_reset
+    FROM pg_index i
+    JOIN pg_class ci ON ci.oid = i.indexrelid
+    JOIN pg_class ct ON ct.oid = i.indrelid
+    JOIN pg_namespace n ON n.oid = ct.relnamespace
+    JOIN pg_am am ON am.oid = ci.relam
+    LEFT JOIN pg_stat_user_indexes s ON s.indexrelid = i.indexrelid
+    LEFT JOIN pg_stat_user_tables t ON t.relid = i.indrelid
+    WHERE n.nspname = 'public' AND ct.relname LIKE ANY(%s) AND ci.relkind <> 'I'
+    ORDER BY ct.relname, ci.relname
+"""
+
+
 def test_connection():
     """Test PostgreSQL database connection"""
     try:
@@ -26,13 +161,7 @@ def test_connection():
         print(f"User: {DB_CONFIG['user']}")
         
         # Establish connection
-        connection = psycopg2.connect(
-            host=DB_CONFIG['host'],
-            database=DB_CONFIG['database'],
-            user=DB_CONFIG['user'],
-            password=DB_CONFIG['password'],
-            port=DB_CONFIG['port']
-        )
+        connection = psycopg2.connect(**DB_CONFIG)
         
         # Create cursor
         cursor = connection.cursor()
@@ -45,9 +174,9 @@ def test_connection():
         
         # List all tables
         cursor.execute("""
-            SELECT table_name 
-            FROM information_schema.tables 
-            WHERE table_schema = 'public' 
+            SELECT table_name
+            FROM information_schema.tables
+            WHERE table_schema = 'public'
             ORDER BY table_name;
         """)
         tables = cursor.fetchall()
@@ -63,8 +192,8 @@ def test_connection():
         print("\n🔍 Checking Django tables:")
         for table_name in django_tables:
             cursor.execute(f"""
-                SELECT COUNT(*) 
-                FROM information_schema.tables 
+                SELECT COUNT(*)
+                FROM information_schema.tables
                 WHERE table_name = %s;
             """, (table_name,))
             exists = cursor.fetchone()[0] > 0
@@ -77,7 +206,7 @@ def test_connection():
         
         print("\n✅ Database connection test completed successfully!")
         return True
-        
+    
     except OperationalError as e:
         print(f"\n❌ Failed to connect to database: {e}")
         return False
@@ -85,6 +214,483 @@ def test_connection():
         print(f"\n❌ An error occurred: {e}")
         return False
 
+
+def summarize(samples):
+    """Latency summary in milliseconds (samples are seconds)"""
+    if not samples:
+        return {'count': 0}
+    ordered = sorted(samples)
+    
+    def percentile(fraction):
+        return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))] * 1000
+    
+    return {
+        'count': len(ordered),
+        'min_ms': ordered[0] * 1000,
+        'p50_ms': percentile(0.50),
+        'p95_ms': percentile(0.95),
+        'p99_ms': percentile(0.99),
+        'max_ms': ordered[-1] * 1000,
+        'mean_ms': statistics.fmean(ordered) * 1000
+    }
+
+
+def measure_cold_connect(samples):
+    """New connection per sample: TCP/TLS handshake + auth + first round trip"""
+    connect_times, first_query_times = [], []
+    for _ in range(samples):
+        started = time.perf_counter()
+        connection = psycopg2.connect(**DB_CONFIG)
+        connected = time.perf_counter()
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT 1")
+            cursor.fetchone()
+        first_query_times.append(time.perf_counter() - connected)
+        connect_times.append(connected - started)
+        connection.close()
+    return {'connect': summarize(connect_times), 'first_query': summarize(first_query_times)}
+
+
+def measure_pool_checkout(connection_pool, samples):
+    """Warm checkout from a pool: getconn/putconn plus a SELECT 1 round trip"""
+    checkout_times, round_trip_times = [], []
+    for _ in range(samples):
+        started = time.perf_counter()
+        connection = connection_pool.getconn()
+        checked_out = time.perf_counter()
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT 1")
+                cursor.fetchone()
+            round_trip_times.append(time.perf_counter() - checked_out)
+        finally:
+            connection_pool.putconn(connection)
+        checkout_times.append(checked_out - started)
+    return {'checkout': summarize(checkout_times), 'select_1': summarize(round_trip_times)}
+
+
+def prepare_queries(connection):
+    """Resolve sample parameters for each probe query, skipping missing tables/rows"""
+    prepared, skipped = {}, {}
+    with connection.cursor() as cursor:
+        for name, table, sample_sql, sql in PROBE_QUERIES:
+            if table:
+                cursor.execute("SELECT to_regclass(%s)", (table,))
+                if cursor.fetchone()[0] is None:
+                    skipped[name] = f'table {table} not found'
+                    continue
+            params = ()
+            if sample_sql:
+                cursor.execute(sample_sql)
+                row = cursor.fetchone()
+                if row is None:
+                    skipped[name] = 'no sample row'
+                    continue
+                params = tuple(row)
+            prepared[name] = (sql, params)
+    connection.rollback()
+    return prepared, skipped
+
+
+def measure_queries(connection_pool, queries, samples):
+    """Round-trip latency per query on one warm pooled connection"""
+    results = {}
+    connection = connection_pool.getconn()
+    try:
+        with connection.cursor() as cursor:
+            for name, (sql, params) in queries.items():
+                # One unmeasured execution so plans/caches are warm
+                cursor.execute(sql, params)
+                cursor.fetchall()
+                timings = []
+                for _ in range(samples):
+                    started = time.perf_counter()
+                    cursor.execute(sql, params)
+                    cursor.fetchall()
+                    timings.append(time.perf_counter() - started)
+                results[name] = summarize(timings)
+        connection.rollback()
+    finally:
+        connection_pool.putconn(connection)
+    return results
+
+
+def run_sweep_level(workers, sql, params, duration):
+    """Run `workers` threads against a pool of the same size for `duration` seconds"""
+    try:
+        connection_pool = pg_pool.ThreadedConnectionPool(workers, workers, **DB_CONFIG)
+    except psycopg2.Error as e:
+        # Typically max_connections reached: record it as this level's result
+        return {
+            'workers': workers,
+            'requests': 0,
+            'throughput_rps': 0.0,
+            'latency': summarize([]),
+            'errors': [f"pool creation failed: {str(e).strip()}"],
+            'pool_failed': True
+        }
+    timings, errors = [], []
+    lock = threading.Lock()
+    start_barrier = threading.Barrier(workers + 1)
+    
+    def worker():
+        local = []
+        start_barrier.wait()
+        deadline = time.perf_counter() + duration
+        while time.perf_counter() < deadline:
+            started = time.perf_counter()
+            connection = connection_pool.getconn()
+            try:
+                with connection.cursor() as cursor:
+                    cursor.execute(sql, params)
+                    cursor.fetchall()
+                connection.rollback()
+            except psycopg2.Error as e:
+                with lock:
+                    errors.append(str(e).strip())
+                break
+            finally:
+                connection_pool.putconn(connection)
+            local.append(time.perf_counter() - started)
+        with lock:
+            timings.extend(local)
+    
+    threads = [threading.Thread(target=worker) for _ in range(workers)]
+    for thread in threads:
+        thread.start()
+    start_barrier.wait()
+    started = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+    connection_pool.closeall()
+    
+    return {
+        'workers': workers,
+        'requests': len(timings),
+        'throughput_rps': len(timings) / elapsed if elapsed else 0.0,
+        'latency': summarize(timings),
+        'errors': errors[:3]
+    }
+
+
+def run_concurrency_sweep(levels, queries, duration):
+    name = next(query for query in SWEEP_QUERY_PREFERENCE if query in queries)
+    sql, params = queries[name]
+    results, saturation, connect_failed = [], None, None
+    for workers in levels:
+        level = run_sweep_level(workers, sql, params, duration)
+        results.append(level)
+        if saturation is None and len(results) > 1:
+            previous = results[-2]
+            if level['errors'] or level['throughput_rps'] < previous['throughput_rps'] * SATURATION_GAIN:
+                saturation = previous['workers']
+        if level.get('pool_failed'):
+            # Higher levels cannot connect either
+            connect_failed = workers
+            break
+    return {
+        'query': name,
+        'duration_sec': duration,
+        'levels': results,
+        'saturation_workers': saturation,
+        'connect_failed_workers': connect_failed
+    }
+
+
+def run_probe(samples, pool_size, levels, duration):
+    report = {
+        'target': {key: value for key, value in DB_CONFIG.items() if key != 'password'},
+        'samples': samples
+    }
+    report['cold_connect'] = measure_cold_connect(samples)
+    
+    connection_pool = pg_pool.ThreadedConnectionPool(1, pool_size, **DB_CONFIG)
+    try:
+        report['pool_checkout'] = measure_pool_checkout(connection_pool, samples)
+        connection = connection_pool.getconn()
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute("SHOW server_version")
+                report['server_version'] = cursor.fetchone()[0]
+                cursor.execute("SHOW max_connections")
+                report['max_connections'] = int(cursor.fetchone()[0])
+            queries, report['skipped_queries'] = prepare_queries(connection)
+        finally:
+            connection_pool.putconn(connection)
+        report['queries'] = measure_queries(connection_pool, queries, samples)
+    finally:
+        connection_pool.closeall()
+    
+    if levels:
+        report['concurrency'] = run_concurrency_sweep(levels, queries, duration)
+    return report
+
+
+def format_latency_row(label, summary):
+    if not summary.get('count'):
+        return f"  {label:<28} {'-':>9}"
+    return (
+        f"  {label:<28} {summary['p50_ms']:>9.2f} {summary['p95_ms']:>9.2f} "
+        f"{summary['p99_ms']:>9.2f} {summary['max_ms']:>9.2f}"
+    )
+
+
+def print_report(report):
+    header = f"  {'':<28} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'max ms':>9}"
+    target = report['target']
+    print(f"🔌 {target['user']}@{target['host']}:{target['port']}/{target['database']} "
+          f"(PostgreSQL {report.get('server_version', '?')}, max_connections {report.get('max_connections', '?')})")
+    
+    print("\n⏱  Connection cost")
+    print(header)
+    print(format_latency_row('cold connect', report['cold_connect']['connect']))
+    print(format_latency_row('cold first query', report['cold_connect']['first_query']))
+    print(format_latency_row('pool checkout', report['pool_checkout']['checkout']))
+    print(format_latency_row('pooled SELECT 1', report['pool_checkout']['select_1']))
+    
+    print("\n📊 Query round trip (warm pooled connection)")
+    print(header)
+    for name, summary in report['queries'].items():
+        print(format_latency_row(name, summary))
+    for name, reason in report['skipped_queries'].items():
+        print(f"  {name:<28} skipped ({reason})")
+    
+    sweep = report.get('concurrency')
+    if sweep:
+        print(f"\n🚦 Concurrency sweep ({sweep['query']}, {sweep['duration_sec']}s per level)")
+        print(f"  {'workers':>7} {'req/s':>9} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}  errors")
+        for level in sweep['levels']:
+            latency = level['latency']
+            if latency.get('count'):
+                print(f"  {level['workers']:>7} {level['throughput_rps']:>9.0f} {latency['p50_ms']:>9.2f} "
+                      f"{latency['p95_ms']:>9.2f} {latency['p99_ms']:>9.2f}  {len(level['errors'])}")
+            else:
+                print(f"  {level['workers']:>7} {'-':>9}  {'; '.join(level['errors'])}")
+        if sweep['connect_failed_workers']:
+            print(f"  ⚠️  could not open {sweep['connect_failed_workers']} connections "
+                  f"(max_connections {report['max_connections']}), remaining levels skipped")
+        if sweep['saturation_workers']:
+            print(f"  ➜ throughput stops scaling beyond ~{sweep['saturation_workers']} concurrent connections")
+        elif not sweep['connect_failed_workers']:
+            print("  ➜ no saturation within the tested range")
+
+
+def estimate_btree_pages(table_rows, key_width, fillfactor=0.9):
+    """Rough ideal size of a freshly built btree (leaf pages + metapage)"""
+    if table_rows is None or table_rows < 0 or key_width is None:
+        return None
+    # index tuple header (8) + line pointer (4) + key padded to 8 bytes
+    tuple_bytes = 12 + ((int(key_width) + 7) // 8) * 8
+    usable_bytes = (8192 - 24 - 16) * fillfactor
+    return int(table_rows * tuple_bytes / usable_bytes) + 2
+
+
+def index_shape(index):
+    """Key that makes two indexes interchangeable (same method, columns, opclasses, collations, expressions, predicate)"""
+    return (
+        index['method'], tuple(index['columns']), tuple(index['opclasses']), tuple(index['collations']),
+        index['expressions'], index['predicate']
+    )
+
+
+def key_prefix(index, length):
+    """(column, opclass, collation) of the first `length` key columns"""
+    return list(zip(index['columns'], index['opclasses'], index['collations']))[:length]
+
+
+def find_redundant(indexes):
+    """Map index name -> reason for duplicate or prefix-redundant btree indexes on the same table"""
+    reasons = {}
+    by_table = {}
+    for index in indexes:
+        by_table.setdefault(index['table_name'], []).append(index)
+    
+    for table_indexes in by_table.values():
+        for index in table_indexes:
+            # Indexes backing PK/unique constraints cannot simply be dropped
+            if index['is_primary'] or index['backs_constraint']:
+                continue
+            for other in table_indexes:
+                if other is index:
+                    continue
+                if index_shape(index) == index_shape(other):
+                    # Keep the one enforcing something, otherwise the alphabetically first
+                    keep_other = other['is_unique'] or other['backs_constraint'] or other['index_name'] < index['index_name']
+                    if keep_other and not (index['is_unique'] and not other['is_unique']):
+                        reasons[index['index_name']] = f"duplicate of {other['index_name']}"
+                        break
+                elif (
+                    index['method'] == other['method'] == 'btree'
+                    and not index['is_unique']
+                    and not index['expressions'] and not other['expressions']
+                    and index['predicate'] == other['predicate']
+                    and len(index['columns']) < len(other['columns'])
+                    # varchar_pattern_ops (_like) or another collation serves different queries
+                    and key_prefix(other, len(index['columns'])) == key_prefix(index, len(index['columns']))
+                ):
+                    reasons[index['index_name']] = f"prefix of {other['index_name']} ({', '.join(other['columns'])})"
+                    break
+    return reasons
+
+
+def inspect_indexes(connection, patterns, bloat_ratio=BLOAT_RATIO, bloat_min_bytes=BLOAT_MIN_BYTES):
+    with connection.cursor() as cursor:
+        cursor.execute(INDEX_INSPECT_SQL, (patterns,))
+        names = [column.name for column in cursor.description]
+        indexes = [dict(zip(names, row)) for row in cursor.fetchall()]
+    connection.rollback()
+    
+    redundant = find_redundant(indexes)
+    tables = {}
+    for index in indexes:
+        # Every insert and every non-HOT update adds an entry to every index of the table
+        table = tables.setdefault(index['table_name'], {
+            'table': index['table_name'],
+            'table_bytes': index['table_bytes'],
+            'rows': max(int(index['table_rows']), 0),
+            'inserts': index['n_tup_ins'],
+            'updates': index['n_tup_upd'],
+            'hot_updates': index['n_tup_hot_upd'],
+            'deletes': index['n_tup_del'],
+            'indexes': 0,
+            'index_bytes': 0
+        })
+        table['indexes'] += 1
+        table['index_bytes'] += index['index_bytes']
+        index_writes = index['n_tup_ins'] + index['n_tup_upd'] - index['n_tup_hot_upd']
+        index['index_writes'] = index_writes
+        index['writes_per_scan'] = round(index_writes / index['idx_scan'], 2) if index['idx_scan'] else None
+        
+        flags = []
+        if index['index_name'] in redundant:
+            flags.append(redundant[index['index_name']])
+        if index['idx_scan'] == 0 and not (index['is_primary'] or index['backs_constraint'] or index['is_unique']):
+            flags.append('unused since stats reset')
+        estimated_pages = estimate_btree_pages(index['table_rows'], index['key_width']) if index['method'] == 'btree' else None
+        index['estimated_pages'] = estimated_pages
+        index['bloat_ratio'] = round(index['index_pages'] / estimated_pages, 2) if estimated_pages else None
+        if index['bloat_ratio'] and index['bloat_ratio'] >= bloat_ratio and index['index_bytes'] >= bloat_min_bytes:
+            flags.append(f"bloated (~{index['bloat_ratio']}x estimated size)")
+        index['flags'] = flags
+    
+    for table in tables.values():
+        writes = table['inserts'] + table['updates'] - table['hot_updates']
+        table['heap_writes'] = writes + table['hot_updates']
+        table['index_writes'] = writes * table['indexes']
+        # Page writes per logical row change: 1 heap tuple + one entry per index (non-HOT)
+        table['write_amplification'] = (
+            round((table['heap_writes'] + table['index_writes']) / table['heap_writes'], 2)
+            if table['heap_writes'] else float(1 + table['indexes'])
+        )
+        table['hot_update_ratio'] = round(table['hot_updates'] / table['updates'], 2) if table['updates'] else None
+    
+    for index in indexes:
+        index['stats_reset'] = index['stats_reset'].isoformat() if index['stats_reset'] else None
+        index['table_rows'] = max(int(index['table_rows']), 0)
+        for key in ('n_tup_ins', 'n_tup_upd', 'n_tup_hot_upd', 'n_tup_del', 'table_bytes'):
+            del index[key]
+    
+    flagged_bytes = sum(index['index_bytes'] for index in indexes if index['flags'])
+    return {
+        'patterns': patterns,
+        'stats_reset': indexes[0]['stats_reset'] if indexes else None,
+        'tables': list(tables.values()),
+        'indexes': indexes,
+        'flagged': sum(1 for index in indexes if index['flags']),
+        'flagged_bytes': flagged_bytes
+    }
+
+
+def format_bytes(size):
+    for unit in ('B', 'kB', 'MB', 'GB'):
+        if size < 1024 or unit == 'GB':
+            return f"{size:.0f} {unit}" if unit == 'B' else f"{size:.1f} {unit}"
+        size /= 1024
+
+
+def print_index_report(report):
+    print(f"🗂  Index inspection ({', '.join(report['patterns'])}), stats reset: {report['stats_reset'] or 'never'}")
+    
+    print("\n✍️  Write amplification per table (heap + index entries per row change)")
+    print(f"  {'table':<36} {'rows':>10} {'idx':>4} {'idx size':>10} {'writes':>10} {'HOT %':>6} {'amp':>6}")
+    for table in report['tables']:
+        hot = f"{table['hot_update_ratio'] * 100:.0f}" if table['hot_update_ratio'] is not None else '-'
+        print(f"  {table['table']:<36} {table['rows']:>10} {table['indexes']:>4} "
+              f"{format_bytes(table['index_bytes']):>10} {table['heap_writes']:>10} {hot:>6} "
+              f"{table['write_amplification']:>6.1f}")
+    
+    width = max([len(index['index_name']) for index in report['indexes']] + [5])
+    print("\n🔍 Indexes")
+    print(f"  {'index':<{width}} {'size':>10} {'scans':>10} {'writes':>10}  flags")
+    for index in report['indexes']:
+        flags = '; '.join(index['flags'])
+        marker = '⚠️ ' if index['flags'] else '  '
+        print(f"{marker}{index['index_name']:<{width}} {format_bytes(index['index_bytes']):>10} "
+              f"{index['idx_scan']:>10} {index['index_writes']:>10}  {flags}")
+    
+    print(f"\n➜ {report['flagged']} flagged index(es), {format_bytes(report['flagged_bytes'])} total")
+    for index in report['indexes']:
+        if index['flags']:
+            print(f"  - {index['table_name']}.{index['index_name']}: {index['definition']}")
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='PostgreSQL connection test and latency probe')
+    parser.add_argument('--mode', choices=['check', 'probe', 'indexes'], default='probe')
+    parser.add_argument('--samples', type=int, default=50, help='samples per measurement')
+    parser.add_argument('--pool-size', type=int, default=4, help='max connections for the warm pool')
+    parser.add_argument('--workers', default='1,2,4,8,16',
+                        help="comma separated concurrency levels for the sweep ('' to skip)")
+    parser.add_argument('--duration', type=float, default=5.0, help='seconds per concurrency level')
+    parser.add_argument('--tables', default=','.join(INSPECT_TABLE_PATTERNS),
+                        help='comma separated table name LIKE patterns for --mode indexes')
+    parser.add_argument('--bloat-ratio', type=float, default=BLOAT_RATIO,
+                        help='flag indexes larger than this multiple of their estimated size')
+    parser.add_argument('--format', choices=['table', 'json'], default='table')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.mode == 'check':
+        return test_connection()
+    if args.mode == 'indexes':
+        return run_index_inspection(args)
+    
+    levels = [int(level) for level in args.workers.split(',') if level.strip()]
+    try:
+        report = run_probe(args.samples, args.pool_size, levels, args.duration)
+    except OperationalError as e:
+        print(f"\n❌ Failed to connect to database: {e}", file=sys.stderr)
+        return False
+    
+    if args.format == 'json':
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report)
+    return True
+
+
+def run_index_inspection(args):
+    patterns = [pattern.strip() for pattern in args.tables.split(',') if pattern.strip()]
+    try:
+        connection = psycopg2.connect(**DB_CONFIG)
+    except OperationalError as e:
+        print(f"\n❌ Failed to connect to database: {e}", file=sys.stderr)
+        return False
+    try:
+        report = inspect_indexes(connection, patterns, bloat_ratio=args.bloat_ratio)
+    finally:
+        connection.close()
+    
+    if args.format == 'json':
+        print(json.dumps(report, indent=2, default=str))
+    else:
+        print_index_report(report)
+    return True
+
+
 if __name__ == "__main__":
-    success = test_connection()
-    sys.exit(0 if success else 1)
\ No newline at end of file
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,133 @@
+# invitations/acceptance.py
+"""
+초대 수락 서비스 (동기/비동기)
+
+토큰 해시 조회 → 상태 전이 → 권한 부여 → 활동 로그 → 카운터 갱신을
+하나의 짧은 트랜잭션에서 처리한다. 대기 행은 select_for_update(skip_locked=True)
+로 잠그므로 같은 초대에 대한 동시 수락은 서로 기다리지 않고 한쪽이 즉시
+'busy' 를 받으며, 서로 다른 초대의 수락은 병렬로 진행된다.
+"""
+
+import hmac
+from typing import NamedTuple, Optional
+from asgiref.sync import sync_to_async
+from django.db import close_old_connections, router, transaction
+from django.utils import timezone
+
+from .cache import get_token_negative_cache
+from .models import (
+    EvaluationInvitation,
+    InvitationActivity,
+    ParticipantPermission,
+    adjust_status_counters,
+    hash_invitation_token,
+    invalidate_permissions
+)
+from .permission_registry import permission_field_values
+
+# 수락 시 잠그고 읽는 컬럼
+ACCEPT_FIELDS = ('id', 'project', 'inviter', 'role', 'permissions', 'status', 'expires_at', 'token_hash')
+
+
+class AcceptResult(NamedTuple):
+    """수락 결과 (status: accepted / invalid / busy)"""
+    status: str
+    invitation: Optional[EvaluationInvitation] = None
+    permission: Optional[ParticipantPermission] = None
+    
+    @property
+    def accepted(self):
+        return self.status == 'accepted'
+
+
+def accept_invitation(raw_token, user, actor_ip=None, user_agent=''):
+    """토큰으로 초대 수락
+    
+    invalid: 없는 토큰, 이미 처리되었거나 만료된 초대
+    busy: 같은 초대를 다른 요청이 처리 중 (잠금 건너뜀)
+    """
+    if not raw_token:
+        return AcceptResult('invalid')
+    token_hash = hash_invitation_token(raw_token)
+    negative_cache = get_token_negative_cache()
+    if negative_cache.get(token_hash):
+        return AcceptResult('invalid')
+    
+    using = router.db_for_write(EvaluationInvitation)
+    now = timezone.now()
+    with transaction.atomic(using=using):
+        invitation = (
+            EvaluationInvitation.objects.using(using)
+            .select_for_update(skip_locked=True, of=('self',))
+            .only(*ACCEPT_FIELDS)
+            .filter(token_hash=token_hash, status='pending', expires_at__gt=now)
+            .first()
+        )
+        if invitation is None or not hmac.compare_digest(invitation.token_hash, token_hash):
+            if not EvaluationInvitation.objects.using(using).filter(
+                token_hash=token_hash, status='pending', expires_at__gt=now
+            ).exists():
+                negative_cache.set(token_hash, True)
+                return AcceptResult('invalid')
+            return AcceptResult('busy')
+        
+        # 잠금을 잡은 상태이므로 상태 조건 없이 pk 로 갱신
+        EvaluationInvitation.objects.using(using).filter(pk=invitation.pk).update(
+            status='accepted',
+            accepted_at=now
+        )
+        invitation.status = 'accepted'
+        invitation.accepted_at = now
+        invitation._loaded_status = 'accepted'
+        
+        bits, role_priority = invitation.get_effective_permissions()
+        values = {
+            'role': invitation.role,
+            'invitation_id': invitation.pk,
+            'assigned_by_id': invitation.inviter_id,
+            **permission_field_values(bits, role_priority)
+        }
+        permissions = ParticipantPermission.objects.using(using)
+        existing = permissions.select_for_update().filter(user=user, project_id=invitation.project_id).first()
+        if existing is None:
+            permission = ParticipantPermission(user=user, project_id=invitation.project_id, **values)
+            # 동시에 다른 초대로 권한이 생긴 경우 그 행을 유지 (덮어쓰지 않음)
+            permissions.bulk_create([permission], ignore_conflicts=True)
+        elif role_priority <= existing.role_priority:
+            # 같거나 더 강한 역할만 반영 (role_priority 가 작을수록 강함)
+            permissions.filter(pk=existing.pk).update(updated_at=now, **values)
+            for field, value in values.items():
+                setattr(existing, field, value)
+            permission = existing
+        else:
+            # 수락으로 기존의 더 강한 역할을 강등하지 않음
+            permission = existing
+        InvitationActivity.objects.using(using).bulk_create([InvitationActivity(
+            invitation_id=invitation.pk,
+            action='accepted',
+            actor=user,
+            actor_ip=actor_ip,
+            user_agent=user_agent or '',
+            created_at=now
+        )])
+        adjust_status_counters(invitation.project_id, {'pending': -1, 'accepted': 1}, using=using)
+        
+        # bulk_create 는 post_save 시그널을 보내지 않으므로 권한 캐시를 직접 무효화
+        transaction.on_commit(lambda: invalidate_permissions([permission]), using=using)
+    
+    negative_cache.set(token_hash, True)
+    invitation.raw_token = raw_token
+    return AcceptResult('accepted', invitation, permission)
+
+
+def _accept_in_worker(*args, **kwargs):
+    # 요청 스레드가 아니므로 Django 의 요청 단위 연결 정리를 직접 수행
+    close_old_connections()
+    try:
+        return accept_invitation(*args, **kwargs)
+    finally:
+        close_old_connections()
+
+
+# 스레드 풀에서 실행해 동시 수락이 각자의 DB 연결로 병렬 처리되도록 thread_sensitive=False
+aaccept_invitation = sync_to_async(_accept_in_worker, thread_sensitive=False)
@@ -0,0 +1,231 @@
+# invitations/activity_log.py
+"""
+InvitationActivity 버퍼링 기록기
+"""
+
+import atexit
+import logging
+import random
+import threading
+import time
+from django.conf import settings
+from django.db import IntegrityError, close_old_connections, connections
+from django.utils import timezone
+
+from .bulk_copy import write_instances
+from .cache import LRUCache
+from .models import EvaluationInvitation, InvitationActivity
+
+log = logging.getLogger(__name__)
+
+# 기본 설정 (settings.INVITATIONS_ACTIVITY_LOGGER 로 재정의)
+DEFAULT_ACTIVITY_LOGGER = {
+    'MAX_BUFFER': 1000,          # 이 건수가 쌓이면 즉시 flush
+    'FLUSH_INTERVAL': 2.0,       # 초
+    'VIEW_DEDUP_WINDOW': 300,    # 같은 행위자의 반복 'viewed' 무시 구간(초), 0 이면 사용 안 함
+    'VIEW_SAMPLE_RATE': 1.0,     # 'viewed' 이벤트 기록 비율
+    'USING': 'default'
+}
+
+
+def write_activities(activities, using='default'):
+    """활동 로그 일괄 기록 (PostgreSQL 은 COPY, 그 외 bulk_create)
+    
+    bulk_create 경로에서는 auto_now_add 로 created_at 이 flush 시각이 된다.
+    """
+    write_instances(InvitationActivity, activities, using)
+
+
+class ActivityLogger:
+    """크기/주기 기준으로 flush 하는 InvitationActivity 버퍼
+    
+    버퍼가 MAX_BUFFER 에 도달하면 호출 스레드에서 즉시 flush 하고,
+    그렇지 않으면 백그라운드 스레드가 FLUSH_INTERVAL 마다 flush 한다.
+    프로세스 종료 시 남은 로그를 기록한다.
+    """
+    
+    def __init__(self, max_buffer=1000, flush_interval=2.0, view_dedup_window=300,
+                 view_sample_rate=1.0, using='default'):
+        self.max_buffer = max_buffer
+        self.flush_interval = flush_interval
+        self.view_sample_rate = view_sample_rate
+        self.using = using
+        self.recent_views = LRUCache(maxsize=100000, ttl=view_dedup_window) if view_dedup_window else None
+        self.buffer = []
+        self.lock = threading.Lock()
+        self.flush_lock = threading.Lock()
+        self.stop_event = threading.Event()
+        self.thread = None
+        self.written = 0
+        self.dropped = 0
+        self.lost = 0
+        self.rejected = 0
+        self.retry_at = 0.0
+        atexit.register(self.close)
+    
+    @classmethod
+    def from_settings(cls):
+        config = {**DEFAULT_ACTIVITY_LOGGER, **getattr(settings, 'INVITATIONS_ACTIVITY_LOGGER', {})}
+        return cls(
+            max_buffer=config['MAX_BUFFER'],
+            flush_interval=config['FLUSH_INTERVAL'],
+            view_dedup_window=config['VIEW_DEDUP_WINDOW'],
+            view_sample_rate=config['VIEW_SAMPLE_RATE'],
+            using=config['USING']
+        )
+    
+    def should_skip_view(self, invitation_id, actor_id, actor_ip):
+        """샘플링/중복 제거 대상인 'viewed' 이벤트 여부"""
+        if self.view_sample_rate < 1.0 and random.random() >= self.view_sample_rate:
+            return True
+        if self.recent_views is not None:
+            key = (invitation_id, actor_id or actor_ip)
+            if self.recent_views.get(key):
+                return True
+            self.recent_views.set(key, True)
+        return False
+    
+    def log(self, invitation, action, actor=None, actor_ip=None, user_agent='', metadata=None):
+        """활동 로그 적재, 기록 대상이면 True"""
+        invitation_id = getattr(invitation, 'pk', invitation)
+        actor_id = getattr(actor, 'pk', actor)
+        if action == 'viewed' and self.should_skip_view(invitation_id, actor_id, actor_ip):
+            self.dropped += 1
+            return False
+        
+        activity = InvitationActivity(
+            invitation_id=invitation_id,
+            action=action,
+            actor_id=actor_id,
+            actor_ip=actor_ip,
+            user_agent=user_agent or '',
+            metadata=metadata or {},
+            created_at=timezone.now()
+        )
+        with self.lock:
+            self.buffer.append(activity)
+            full = len(self.buffer) >= self.max_buffer
+        
+        # 기록 실패 직후에는 호출 스레드에서 재시도하지 않고 백그라운드 flush 에 맡김
+        if full and time.monotonic() >= self.retry_at:
+            self.flush()
+        else:
+            self.ensure_thread()
+        return True
+    
+    def flush(self):
+        """버퍼 기록, 기록한 건수 반환
+        
+        IntegrityError 면 기록할 수 없는 행(보관/삭제된 초대 등)만 rejected 로 버리고
+        나머지를 기록한다. 그 밖의 오류는 일시적 장애로 보고 로그를 남긴 뒤 행을 버퍼
+        앞에 되돌리며, 되돌린 뒤 MAX_BUFFER 를 넘는 가장 오래된 행은 버리고 lost 로 집계한다.
+        """
+        with self.flush_lock:
+            with self.lock:
+                pending, self.buffer = self.buffer, []
+            if not pending:
+                return 0
+            try:
+                try:
+                    write_activities(pending, self.using)
+                    written = len(pending)
+                except IntegrityError:
+                    written = self.write_valid(pending)
+            except Exception:
+                log.exception('활동 로그 %d건 기록 실패', len(pending))
+                connections[self.using].close_if_unusable_or_obsolete()
+                self.retry_at = time.monotonic() + self.flush_interval
+                with self.lock:
+                    self.buffer = pending + self.buffer
+                    overflow = len(self.buffer) - self.max_buffer
+                    if overflow > 0:
+                        del self.buffer[:overflow]
+                        self.lost += overflow
+                        log.error('활동 로그 버퍼 초과로 %d건 폐기', overflow)
+                return 0
+            self.written += written
+            return written
+    
+    def write_valid(self, activities):
+        """없는 초대를 가리키는 행을 버리고 나머지 기록, 기록한 건수 반환"""
+        invitation_ids = {activity.invitation_id for activity in activities}
+        existing = set(
+            EvaluationInvitation.objects.using(self.using)
+            .filter(pk__in=invitation_ids).values_list('pk', flat=True)
+        )
+        valid = [activity for activity in activities if activity.invitation_id in existing]
+        if len(valid) < len(activities):
+            self.rejected += len(activities) - len(valid)
+            log.warning('삭제된 초대의 활동 로그 %d건 폐기', len(activities) - len(valid))
+        return self.write_bisect(valid)
+    
+    def write_bisect(self, activities):
+        """IntegrityError 를 일으키는 행을 반씩 나눠 찾아 버리고 나머지 기록"""
+        if not activities:
+            return 0
+        try:
+            write_activities(activities, self.using)
+            return len(activities)
+        except IntegrityError:
+            if len(activities) == 1:
+                self.rejected += 1
+                log.warning('기록할 수 없는 활동 로그 폐기 (초대 %s)', activities[0].invitation_id, exc_info=True)
+                return 0
+        middle = len(activities) // 2
+        return self.write_bisect(activities[:middle]) + self.write_bisect(activities[middle:])
+    
+    def ensure_thread(self):
+        if self.thread is None or not self.thread.is_alive():
+            with self.lock:
+                if self.thread is None or not self.thread.is_alive():
+                    self.stop_event.clear()
+                    self.thread = threading.Thread(
+                        target=self.run, name='invitation-activity-logger', daemon=True
+                    )
+                    self.thread.start()
+    
+    def run(self):
+        try:
+            while not self.stop_event.wait(self.flush_interval):
+                try:
+                    self.flush()
+                except Exception:
+                    # 예외로 백그라운드 flush 스레드가 끝나지 않도록 함
+                    log.exception('활동 로그 flush 실패')
+        finally:
+            close_old_connections()
+    
+    def close(self):
+        """백그라운드 flush 중지 후 남은 로그 기록"""
+        self.stop_event.set()
+        if self.thread is not None and self.thread is not threading.current_thread():
+            self.thread.join(timeout=self.flush_interval + 1)
+        self.flush()
+    
+    def stats(self):
+        return {
+            'buffered': len(self.buffer),
+            'written': self.written,
+            'dropped': self.dropped,
+            'lost': self.lost,
+            'rejected': self.rejected
+        }
+
+
+_logger = None
+_logger_lock = threading.Lock()
+
+
+def get_activity_logger():
+    """프로세스 공용 ActivityLogger"""
+    global _logger
+    if _logger is None:
+        with _logger_lock:
+            if _logger is None:
+                _logger = ActivityLogger.from_settings()
+    return _logger
+
+
+def log_activity(invitation, action, **kwargs):
+    """버퍼링 기록기로 활동 로그 적재"""
+    return get_activity_logger().log(invitation, action, **kwargs)
@@ -0,0 +1,120 @@
+# invitations/admin.py
+from django.contrib import admin
+
+from .models import (
+    ArchivedInvitation,
+    EvaluationInvitation,
+    InvitationActivity,
+    InvitationPool,
+    InvitationStatusCounter,
+    ParticipantPermission,
+    PermissionTemplate,
+    normalize_email
+)
+from .pagination import EstimatedCountPaginator
+
+
+@admin.register(PermissionTemplate)
+class PermissionTemplateAdmin(admin.ModelAdmin):
+    list_display = ('name', 'is_system', 'updated_at')
+    list_filter = ('is_system',)
+    search_fields = ('name',)
+
+
+@admin.register(EvaluationInvitation)
+class EvaluationInvitationAdmin(admin.ModelAdmin):
+    list_display = ('invitee_email', 'project_name', 'role', 'status', 'reminder_count', 'expires_at', 'created_at')
+    list_filter = ('status', 'role')
+    list_select_related = ('project',)
+    search_fields = ('=invitee_email',)
+    raw_id_fields = ('project', 'inviter')
+    exclude = ('token',)
+    readonly_fields = ('token_hash', 'accepted_at', 'rejected_at', 'revoked_at', 'created_at')
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+    
+    def get_queryset(self, request):
+        return super().get_queryset(request).with_related()
+    
+    def get_search_results(self, request, queryset, search_term):
+        # iexact(UPPER) 대신 정규화 컬럼 일치로 검색해 인덱스를 사용
+        if not search_term:
+            return queryset, False
+        return queryset.filter(invitee_email_normalized=normalize_email(search_term)), False
+    
+    @admin.display(description='프로젝트', ordering='project__name')
+    def project_name(self, obj):
+        return obj.project.name
+
+
+@admin.register(ParticipantPermission)
+class ParticipantPermissionAdmin(admin.ModelAdmin):
+    list_display = ('user_email', 'project_name', 'role', 'role_priority', 'expires_at', 'created_at')
+    list_filter = ('role',)
+    list_select_related = ('user', 'project')
+    search_fields = ('=user__email',)
+    raw_id_fields = ('user', 'project', 'invitation', 'archived_invitation', 'assigned_by')
+    readonly_fields = ('permission_bits', 'created_at', 'updated_at')
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+    
+    def get_queryset(self, request):
+        return super().get_queryset(request).with_related()
+    
+    @admin.display(description='사용자', ordering='user__email')
+    def user_email(self, obj):
+        return obj.user.email
+    
+    @admin.display(description='프로젝트', ordering='project__name')
+    def project_name(self, obj):
+        return obj.project.name
+
+
+@admin.register(InvitationActivity)
+class InvitationActivityAdmin(admin.ModelAdmin):
+    list_display = ('action', 'invitee_email', 'actor', 'actor_ip', 'created_at')
+    list_filter = ('action',)
+    list_select_related = ('invitation', 'actor')
+    raw_id_fields = ('invitation', 'actor')
+    readonly_fields = ('created_at',)
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+    
+    def get_queryset(self, request):
+        return super().get_queryset(request).with_related()
+    
+    @admin.display(description='초대 대상')
+    def invitee_email(self, obj):
+        return obj.invitation.invitee_email
+
+
+@admin.register(InvitationStatusCounter)
+class InvitationStatusCounterAdmin(admin.ModelAdmin):
+    list_display = ('project', 'status', 'shard', 'count')
+    list_filter = ('status',)
+    list_select_related = ('project',)
+    raw_id_fields = ('project',)
+
+
+@admin.register(ArchivedInvitation)
+class ArchivedInvitationAdmin(admin.ModelAdmin):
+    list_display = ('invitee_email', 'project', 'status', 'created_at', 'archived_at')
+    list_filter = ('status',)
+    list_select_related = ('project',)
+    raw_id_fields = ('project',)
+    readonly_fields = ('status', 'created_at', 'payload', 'activities', 'activity_summaries', 'archived_at')
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+    
+    @admin.display(description='초대 대상')
+    def invitee_email(self, obj):
+        return obj.payload.get('invitee_email')
+
+
+@admin.register(InvitationPool)
+class InvitationPoolAdmin(admin.ModelAdmin):
+    list_display = ('project', 'role', 'target_size', 'low_water', 'enabled', 'last_refilled_at')
+    list_filter = ('enabled', 'role')
+    list_select_related = ('project',)
+    raw_id_fields = ('project',)
+    readonly_fields = ('last_refilled_at', 'created_at')
@@ -0,0 +1,10 @@
+# invitations/apps.py
+from django.apps import AppConfig
+
+
+class InvitationsConfig(AppConfig):
+    name = 'invitations'
+    verbose_name = '평가 초대'
+    
+    def ready(self):
+        from . import signals  # noqa: F401
@@ -0,0 +1,214 @@
+# invitations/archive.py
+"""
+종료된 프로젝트 초대의 보관(cold)/복원
+
+보관은 프로젝트 초대를 배치 단위로 ArchivedInvitation 에 JSON 으로 옮기고
+활동 로그/월별 요약과 함께 원본 테이블에서 삭제한다. 이 초대를 가리키던
+ParticipantPermission 은 archived_invitation 으로 참조를 옮기고, 복원 시 되돌린다.
+상태 카운터는 보관된 초대를 포함한 프로젝트 전체 건수이므로 보관/복원 시 바꾸지 않는다.
+"""
+
+from collections import defaultdict
+from datetime import datetime, timedelta
+from django.db import connections, models, router, transaction
+from django.utils import timezone
+
+from .bulk_copy import copy_instances
+from .models import (
+    ArchivedInvitation,
+    EvaluationInvitation,
+    InvitationActivity,
+    InvitationActivitySummary,
+    InvitationPool,
+    ParticipantPermission,
+    adjust_status_counters
+)
+from .partitions import create_partition, is_partitioned, month_start
+
+ARCHIVE_BATCH_SIZE = 500
+
+
+def to_payload(instance):
+    payload = {}
+    for field in instance._meta.concrete_fields:
+        value = field.value_from_object(instance)
+        # DjangoJSONEncoder 는 datetime 을 밀리초로 자르므로 직접 직렬화
+        payload[field.attname] = value.isoformat() if isinstance(value, datetime) else value
+    return payload
+
+
+def from_payload(model, payload):
+    return model(**{
+        field.attname: field.to_python(payload[field.attname])
+        for field in model._meta.concrete_fields
+        if field.attname in payload
+    })
+
+
+def insert_preserving_timestamps(model, instances, using):
+    """원래 created_at 등을 유지한 채 일괄 삽입
+    
+    PostgreSQL 은 COPY 로 값을 그대로 넣고, 그 외에는 bulk_create 가 auto_now_add
+    필드를 현재 시각으로 덮어쓰므로 삽입 후 되돌린다.
+    """
+    if connections[using].vendor == 'postgresql':
+        copy_instances(model, instances, using)
+        return
+    
+    auto_fields = [field.name for field in model._meta.concrete_fields if getattr(field, 'auto_now_add', False)]
+    saved = [[getattr(instance, name) for name in auto_fields] for instance in instances]
+    model._default_manager.db_manager(using).bulk_create(instances)
+    if auto_fields:
+        for instance, values in zip(instances, saved):
+            for name, value in zip(auto_fields, values):
+                setattr(instance, name, value)
+        model._default_manager.db_manager(using).bulk_update(instances, auto_fields)
+
+
+def find_archivable_projects(inactive_days=180, now=None):
+    """대기 초대가 없고 inactive_days 동안 새 초대가 없는 프로젝트 id 목록"""
+    cutoff = (now or timezone.now()) - timedelta(days=inactive_days)
+    return list(
+        EvaluationInvitation.objects.values('project_id')
+        .annotate(
+            # 풀 보충 시각은 초대 활동이 아니므로 제외
+            last_invited=models.Max('created_at', filter=~models.Q(status='pooled')),
+            pending=models.Count('pk', filter=models.Q(status='pending'))
+        )
+        .filter(last_invited__lt=cutoff, pending=0)
+        .order_by('project_id')
+        .values_list('project_id', flat=True)
+    )
+
+
+def archive_project(project_id, batch_size=ARCHIVE_BATCH_SIZE):
+    """프로젝트 초대를 보관 테이블로 이동, 통계 반환
+    
+    대기중 초대가 남아 있으면 ValueError (expire_invitations 를 먼저 실행).
+    확인 이후 새로 생긴 대기 초대는 잠근 배치 안에서 다시 확인해 ValueError 로 중단하며,
+    이미 옮긴 배치는 보관된 상태로 남는다 (restore_project 로 되돌릴 수 있음).
+    발급되지 않은 풀(pooled) 행은 보관하지 않고 삭제하며 프로젝트 풀을 비활성화한다.
+    """
+    using = router.db_for_write(EvaluationInvitation)
+    invitations = EvaluationInvitation.objects.using(using).filter(project_id=project_id)
+    if invitations.filter(status='pending').exists():
+        raise ValueError(f'프로젝트 {project_id} 에 대기중 초대가 있어 보관할 수 없습니다')
+    
+    stats = {'invitations': 0, 'activities': 0, 'batches': 0, 'pooled_discarded': 0}
+    with transaction.atomic(using=using):
+        # 발급되지 않은 풀 행은 보관하지 않고 버림 (활동/권한 참조 없음)
+        InvitationPool.objects.using(using).filter(project_id=project_id).update(enabled=False)
+        pooled = invitations.filter(status='pooled')
+        discarded = pooled._raw_delete(using)
+        if discarded:
+            adjust_status_counters(project_id, {'pooled': -discarded}, using=using)
+        stats['pooled_discarded'] = discarded
+    
+    while True:
+        with transaction.atomic(using=using):
+            batch = list(invitations.select_for_update().order_by('pk')[:batch_size])
+            if not batch:
+                break
+            if any(invitation.status == 'pending' for invitation in batch):
+                # 사전 확인 이후 생성/발급된 초대 (보관하면 링크가 끊기고 카운터가 어긋남)
+                raise ValueError(
+                    f'프로젝트 {project_id} 보관 중 대기중 초대가 생겨 중단했습니다 '
+                    f'(이미 보관 {stats["invitations"]}건)'
+                )
+            ids = [invitation.pk for invitation in batch]
+            
+            activities = defaultdict(list)
+            for activity in InvitationActivity.objects.using(using).filter(invitation_id__in=ids):
+                activities[activity.invitation_id].append(to_payload(activity))
+            summaries = defaultdict(list)
+            for summary in InvitationActivitySummary.objects.using(using).filter(invitation_id__in=ids):
+                summaries[summary.invitation_id].append(to_payload(summary))
+            
+            ArchivedInvitation.objects.using(using).bulk_create([
+                ArchivedInvitation(
+                    id=invitation.pk,
+                    project_id=invitation.project_id,
+                    status=invitation.status,
+                    created_at=invitation.created_at,
+                    payload=to_payload(invitation),
+                    activities=activities[invitation.pk],
+                    activity_summaries=summaries[invitation.pk]
+                )
+                for invitation in batch
+            ])
+            ParticipantPermission.objects.using(using).filter(invitation_id__in=ids).update(
+                archived_invitation_id=models.F('invitation_id'),
+                invitation=None
+            )
+            InvitationActivitySummary.objects.using(using).filter(invitation_id__in=ids).delete()
+            InvitationActivity.objects.using(using).filter(invitation_id__in=ids).delete()
+            # 의존 행을 위에서 모두 정리했으므로 post_delete(카운터 감소) 없이 직접 삭제
+            EvaluationInvitation.objects.using(using).filter(pk__in=ids)._raw_delete(using)
+        
+        stats['invitations'] += len(batch)
+        stats['activities'] += sum(len(rows) for rows in activities.values())
+        stats['batches'] += 1
+    return stats
+
+
+def restore_project(project_id, batch_size=ARCHIVE_BATCH_SIZE):
+    """보관된 프로젝트 초대를 원본 테이블로 복원, 통계 반환"""
+    using = router.db_for_write(EvaluationInvitation)
+    archived = ArchivedInvitation.objects.using(using).filter(project_id=project_id)
+    partitioned = connections[using].vendor == 'postgresql' and is_partitioned(using)
+    
+    stats = {'invitations': 0, 'activities': 0, 'batches': 0}
+    while True:
+        with transaction.atomic(using=using):
+            batch = list(archived.select_for_update().order_by('pk')[:batch_size])
+            if not batch:
+                break
+            ids = [row.pk for row in batch]
+            
+            invitations = [from_payload(EvaluationInvitation, row.payload) for row in batch]
+            activities = [from_payload(InvitationActivity, data) for row in batch for data in row.activities]
+            summaries = [
+                from_payload(InvitationActivitySummary, data) for row in batch for data in row.activity_summaries
+            ]
+            
+            if partitioned and activities:
+                # 보존 기간 정리로 삭제된 월 파티션이 있을 수 있음
+                with connections[using].cursor() as cursor:
+                    for month in {month_start(activity.created_at) for activity in activities}:
+                        create_partition(cursor, month)
+            
+            insert_preserving_timestamps(EvaluationInvitation, invitations, using)
+            if activities:
+                insert_preserving_timestamps(InvitationActivity, activities, using)
+            InvitationActivitySummary.objects.using(using).bulk_create(summaries)
+            ParticipantPermission.objects.using(using).filter(archived_invitation_id__in=ids).update(
+                invitation_id=models.F('archived_invitation_id'),
+                archived_invitation=None
+            )
+            ArchivedInvitation.objects.using(using).filter(pk__in=ids)._raw_delete(using)
+        
+        stats['invitations'] += len(batch)
+        stats['activities'] += len(activities)
+        stats['batches'] += 1
+    return stats
+
+
+def get_invitation(pk, include_archived=False):
+    """초대 조회, include_archived=True 면 원본에 없을 때 보관 테이블에서 복원한 인스턴스 반환"""
+    try:
+        return EvaluationInvitation.objects.get(pk=pk)
+    except EvaluationInvitation.DoesNotExist:
+        if not include_archived:
+            raise
+    try:
+        return ArchivedInvitation.objects.get(pk=pk).to_invitation()
+    except ArchivedInvitation.DoesNotExist:
+        raise EvaluationInvitation.DoesNotExist(f'초대 {pk} 가 없습니다')
+
+
+def iter_project_invitations(project, include_archived=False, chunk_size=ARCHIVE_BATCH_SIZE):
+    """프로젝트 초대 순회, include_archived=True 면 보관된 초대(is_archived=True)도 포함"""
+    yield from EvaluationInvitation.objects.filter(project=project).order_by('-created_at').iterator(chunk_size)
+    if include_archived:
+        for row in ArchivedInvitation.objects.filter(project=project).order_by('-created_at').iterator(chunk_size):
+            yield row.to_invitation()
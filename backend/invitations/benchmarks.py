@@ -0,0 +1,242 @@
+# invitations/benchmarks.py
+"""
+초대 앱 규모 벤치마크
+"""
+
+import json
+import platform
+import random
+import statistics
+import time
+from datetime import timedelta
+from django.apps import apps
+from django.contrib.auth import get_user_model
+from django.db import connection, models
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from .expiry import expire_pending_invitations
+from .models import (
+    EvaluationInvitation,
+    InvitationActivity,
+    InvitationStatusCounter,
+    ParticipantPermission
+)
+from .pagination import keyset_paginate
+from .permissions import PermissionResolver, LocalPermissionCache
+
+BENCHMARK_PREFIX = 'bench'
+
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(fraction * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def project_kwargs(index, owner):
+    """projects.Project 필수 필드 채우기 (문자열 필드는 이름, 사용자 FK 는 owner)"""
+    Project = apps.get_model('projects', 'Project')
+    kwargs = {}
+    for field in Project._meta.concrete_fields:
+        if field.primary_key or field.null or field.has_default() or getattr(field, 'auto_now', False) \
+                or getattr(field, 'auto_now_add', False):
+            continue
+        if isinstance(field, models.ForeignKey) and field.related_model is get_user_model():
+            kwargs[field.name] = owner
+        elif isinstance(field, (models.CharField, models.TextField)):
+            kwargs[field.name] = f'{BENCHMARK_PREFIX}-project-{index}'
+    if hasattr(Project, 'name'):
+        kwargs['name'] = f'{BENCHMARK_PREFIX}-project-{index}'
+    return kwargs
+
+
+def seed(projects=10, invitations=1000, activities=3, users=1000):
+    """N 프로젝트 × M 초대 × K 활동 로그 생성, (projects, users, owner) 반환"""
+    User = get_user_model()
+    Project = apps.get_model('projects', 'Project')
+    
+    owner = User.objects.create(**{
+        User.USERNAME_FIELD: f'{BENCHMARK_PREFIX}-owner@example.com',
+        'email': f'{BENCHMARK_PREFIX}-owner@example.com'
+    })
+    User.objects.bulk_create([
+        User(**{User.USERNAME_FIELD: f'{BENCHMARK_PREFIX}-user-{i}@example.com',
+                'email': f'{BENCHMARK_PREFIX}-user-{i}@example.com'})
+        for i in range(users)
+    ], batch_size=1000)
+    user_list = list(User.objects.filter(email__startswith=f'{BENCHMARK_PREFIX}-user-').order_by('pk'))
+    
+    project_list = [Project.objects.create(**project_kwargs(i, owner)) for i in range(projects)]
+    for project in project_list:
+        emails = [user_list[i % len(user_list)].email for i in range(min(invitations, len(user_list)))]
+        emails += [f'{BENCHMARK_PREFIX}-guest-{i}@example.com' for i in range(invitations - len(emails))]
+        results = EvaluationInvitation.objects.bulk_invite(project, emails, inviter=owner)
+        rows = [
+            InvitationActivity(invitation=result['invitation'], action='viewed', actor_ip='127.0.0.1')
+            for result in results if result['invitation']
+            for _ in range(max(activities - 1, 0))
+        ]
+        InvitationActivity.objects.bulk_create(rows, batch_size=2000)
+        ParticipantPermission.bulk_assign_roles(
+            project,
+            [(user, random.choice(['viewer', 'evaluator', 'admin'])) for user in user_list[:invitations // 10]],
+            assigned_by=owner
+        )
+    return project_list, user_list, owner
+
+
+class Benchmark:
+    """시나리오별 지연 시간과 쿼리 수 측정"""
+    
+    def __init__(self, iterations=50):
+        self.iterations = iterations
+        self.results = {}
+    
+    def measure(self, name, operation, iterations=None):
+        timings = []
+        queries = []
+        for index in range(iterations or self.iterations):
+            with CaptureQueriesContext(connection) as captured:
+                started = time.perf_counter()
+                operation(index)
+                timings.append((time.perf_counter() - started) * 1000)
+            queries.append(len(captured.captured_queries))
+        self.results[name] = {
+            'iterations': len(timings),
+            'mean_ms': statistics.fmean(timings),
+            'p50_ms': percentile(timings, 0.50),
+            'p95_ms': percentile(timings, 0.95),
+            'max_ms': max(timings),
+            'queries_per_op': max(queries)
+        }
+        return self.results[name]
+
+
+def run_scenarios(projects, users, owner, iterations=50):
+    """초대/수락/거절/철회/리마인더/만료/권한/대시보드 시나리오 실행"""
+    bench = Benchmark(iterations)
+    now = timezone.now()
+    project = projects[0]
+    
+    pending = list(
+        EvaluationInvitation.objects.filter(project__in=projects, status='pending')
+        .select_related('project')[:iterations * 3]
+    )
+    tokens = {}
+    for invitation in pending:
+        tokens[invitation.pk] = invitation.issue_token()
+    EvaluationInvitation.objects.bulk_update(pending, ['token', 'token_hash'])
+    to_accept = pending[:iterations]
+    to_reject = pending[iterations:iterations * 2]
+    to_revoke = pending[iterations * 2:iterations * 3]
+    users_by_email = {user.email: user for user in users}
+    
+    bench.measure('invite', lambda i: EvaluationInvitation.objects.create(
+        project=project, inviter=owner, invitee_email=f'{BENCHMARK_PREFIX}-invite-{i}@example.com'
+    ))
+    bench.measure('bulk_invite_100', lambda i: EvaluationInvitation.objects.bulk_invite(
+        project, [f'{BENCHMARK_PREFIX}-bulk-{i}-{n}@example.com' for n in range(100)], inviter=owner
+    ), iterations=max(iterations // 5, 1))
+    
+    def accept(i):
+        invitation = EvaluationInvitation.objects.get_acceptable_by_token(tokens[to_accept[i].pk])
+        if invitation and invitation.transition_to('accepted'):
+            user = users_by_email.get(invitation.invitee_email) or users[i]
+            ParticipantPermission.bulk_assign_roles(invitation.project, [(user, invitation.role)])
+    
+    bench.measure('accept', accept, iterations=len(to_accept))
+    bench.measure('reject', lambda i: to_reject[i].transition_to('rejected'), iterations=len(to_reject))
+    bench.measure('revoke', lambda i: to_revoke[i].transition_to('revoked'), iterations=len(to_revoke))
+    bench.measure('reminder_eligibility', lambda i: list(
+        EvaluationInvitation.objects.reminder_eligible().values_list('pk', flat=True)[:500]
+    ))
+    
+    def expire(i):
+        EvaluationInvitation.objects.filter(
+            pk__in=list(
+                EvaluationInvitation.objects.filter(status='pending').values_list('pk', flat=True)[:100]
+            )
+        ).update(expires_at=now - timedelta(days=1))
+        expire_pending_invitations(batch_size=100)
+    
+    bench.measure('expiry_sweep_100', expire, iterations=max(iterations // 5, 1))
+    
+    permissions = list(ParticipantPermission.objects.values_list('user_id', 'project_id')[:iterations])
+    # 권한 행이 없으면 권한 시나리오는 건너뛴다 (결과에 없는 시나리오는 check_thresholds 도 비교하지 않음)
+    if permissions:
+        cold = PermissionResolver(LocalPermissionCache(maxsize=1, ttl=0))
+        warm = PermissionResolver(LocalPermissionCache(maxsize=10000, ttl=300))
+        for user_id, project_id in permissions:
+            warm.get(user_id, project_id)
+        bench.measure('permission_check_uncached', lambda i: cold.has_permission(
+            *permissions[i % len(permissions)], 'can_view_results'
+        ))
+        bench.measure('permission_check_cached', lambda i: warm.has_permission(
+            *permissions[i % len(permissions)], 'can_view_results'
+        ))
+        bench.measure('projects_for_user', lambda i: ParticipantPermission.objects.projects_for(
+            permissions[i % len(permissions)][0], 'can_view_project'
+        ))
+    
+    bench.measure('dashboard_counts', lambda i: InvitationStatusCounter.objects.for_project(
+        projects[i % len(projects)]
+    ))
+    bench.measure('dashboard_counts_group_by', lambda i: dict(
+        EvaluationInvitation.objects.filter(project=projects[i % len(projects)])
+        .values_list('status').annotate(total=models.Count('pk')).order_by()
+    ))
+    bench.measure('invitation_listing', lambda i: [
+        str(invitation) for invitation in keyset_paginate(
+            EvaluationInvitation.objects.filter(project=projects[i % len(projects)]).for_listing()
+        )[0]
+    ])
+    bench.measure('activity_listing', lambda i: [
+        str(activity) for activity in keyset_paginate(InvitationActivity.objects.for_listing())[0]
+    ])
+    return bench.results
+
+
+def check_thresholds(results, thresholds=None, baseline=None, tolerance=0.2, min_delta_ms=1.0):
+    """임계값/기준 결과 대비 회귀 목록 반환
+    
+    thresholds: {시나리오: {'max_queries': n, 'p95_ms': ms}}
+    baseline: 이전 실행 결과(JSON), p95 는 tolerance 비율까지, 쿼리 수는 증가 불허.
+    min_delta_ms 미만의 p95 증가는 측정 잡음으로 보고 무시한다.
+    """
+    failures = []
+    for name, limits in (thresholds or {}).items():
+        result = results.get(name)
+        if result is None:
+            continue
+        if 'max_queries' in limits and result['queries_per_op'] > limits['max_queries']:
+            failures.append(f"{name}: 쿼리 {result['queries_per_op']} > {limits['max_queries']}")
+        if 'p95_ms' in limits and result['p95_ms'] > limits['p95_ms']:
+            failures.append(f"{name}: p95 {result['p95_ms']:.2f}ms > {limits['p95_ms']}ms")
+    
+    for name, previous in ((baseline or {}).get('scenarios') or {}).items():
+        result = results.get(name)
+        if result is None:
+            continue
+        if result['queries_per_op'] > previous['queries_per_op']:
+            failures.append(f"{name}: 쿼리 {previous['queries_per_op']} → {result['queries_per_op']}")
+        if result['p95_ms'] > max(previous['p95_ms'] * (1 + tolerance), previous['p95_ms'] + min_delta_ms):
+            failures.append(f"{name}: p95 {previous['p95_ms']:.2f}ms → {result['p95_ms']:.2f}ms")
+    return failures
+
+
+def build_report(results, scale):
+    return {
+        'meta': {
+            'timestamp': timezone.now().isoformat(),
+            'vendor': connection.vendor,
+            'python': platform.python_version(),
+            'scale': scale
+        },
+        'scenarios': results
+    }
+
+
+def dump_report(report, path):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
@@ -0,0 +1,63 @@
+# invitations/bulk_copy.py
+"""
+모델 인스턴스 일괄 삽입 (PostgreSQL 은 COPY, 그 외 bulk_create)
+
+bulk_create 는 행마다 필드별 pre_save/get_db_prep_save 를 거쳐 대량 삽입 시
+파이썬 쪽 비용이 크다. COPY 경로는 인스턴스 속성 값을 그대로 CSV 로 직렬화하므로
+auto_now_add 등 pre_save 에서 채워지는 값은 호출자가 미리 설정해야 한다.
+"""
+
+import io
+import json
+from datetime import date, datetime
+from django.db import connections, transaction
+
+
+def serialize(value):
+    """COPY csv 필드 하나: NULL 은 따옴표 없는 빈 필드, 그 외 값은 모두 따옴표로 감싼다
+    
+    따옴표로 감싼 "" 는 빈 문자열, 따옴표 없는 빈 필드만 NULL 로 읽히므로
+    '\\N' 같은 값도 문자열 그대로 저장된다.
+    """
+    if value is None:
+        return ''
+    if isinstance(value, (dict, list)):
+        value = json.dumps(value)
+    elif isinstance(value, (datetime, date)):
+        value = value.isoformat()
+    return '"' + str(value).replace('"', '""') + '"'
+
+
+def copy_instances(model, instances, using='default'):
+    """PostgreSQL COPY 로 인스턴스 일괄 삽입 (모든 concrete 필드)"""
+    fields = model._meta.concrete_fields
+    buffer = io.StringIO()
+    for instance in instances:
+        buffer.write(','.join(serialize(getattr(instance, field.attname)) for field in fields) + '\n')
+    buffer.seek(0)
+    
+    connection = connections[using]
+    columns = ', '.join(connection.ops.quote_name(field.column) for field in fields)
+    sql = f"COPY {model._meta.db_table} ({columns}) FROM STDIN WITH (FORMAT csv)"
+    # 드라이버 커서를 직접 쓰므로 오류를 Django 예외(IntegrityError 등)로 변환
+    with transaction.atomic(using=using), connection.cursor() as cursor, connection.wrap_database_errors:
+        raw_cursor = cursor.cursor
+        if hasattr(raw_cursor, 'copy_expert'):
+            # psycopg2
+            raw_cursor.copy_expert(sql, buffer)
+        else:
+            # psycopg 3
+            with raw_cursor.copy(sql) as copy:
+                copy.write(buffer.getvalue())
+    
+    for instance in instances:
+        instance._state.adding = False
+        instance._state.db = using
+
+
+def write_instances(model, instances, using='default', batch_size=None):
+    """인스턴스 일괄 삽입 (PostgreSQL 은 COPY, 그 외 bulk_create)"""
+    if connections[using].vendor == 'postgresql':
+        copy_instances(model, instances, using)
+    else:
+        model._default_manager.db_manager(using).bulk_create(instances, batch_size=batch_size)
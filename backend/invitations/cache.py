@@ -0,0 +1,77 @@
+# invitations/cache.py
+"""
+초대 앱 공용 인메모리 캐시
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from django.conf import settings
+
+_MISSING = object()
+
+# 토큰 부정 캐시 기본 설정 (settings.INVITATIONS_TOKEN_NEGATIVE_CACHE 로 재정의)
+DEFAULT_TOKEN_NEGATIVE_CACHE = {
+    'MAXSIZE': 100000,
+    'TTL': 600               # 초
+}
+
+
+class LRUCache:
+    """TTL 을 지원하는 스레드 안전 LRU 캐시"""
+    
+    def __init__(self, maxsize=10000, ttl=60):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.data = OrderedDict()
+        self.lock = threading.Lock()
+        self.evictions = 0
+    
+    def get(self, key, default=None):
+        with self.lock:
+            item = self.data.get(key, _MISSING)
+            if item is _MISSING:
+                return default
+            value, expires = item
+            if expires < time.monotonic():
+                del self.data[key]
+                return default
+            self.data.move_to_end(key)
+            return value
+    
+    def set(self, key, value):
+        with self.lock:
+            self.data[key] = (value, time.monotonic() + self.ttl)
+            self.data.move_to_end(key)
+            while len(self.data) > self.maxsize:
+                self.data.popitem(last=False)
+                self.evictions += 1
+    
+    def delete(self, key):
+        with self.lock:
+            self.data.pop(key, None)
+    
+    def clear(self):
+        with self.lock:
+            self.data.clear()
+    
+    def __len__(self):
+        return len(self.data)
+
+
+_token_negative_cache = None
+_token_negative_cache_lock = threading.Lock()
+
+
+def get_token_negative_cache():
+    """수락 불가 토큰 해시의 프로세스 공용 부정 캐시"""
+    global _token_negative_cache
+    if _token_negative_cache is None:
+        with _token_negative_cache_lock:
+            if _token_negative_cache is None:
+                config = {
+                    **DEFAULT_TOKEN_NEGATIVE_CACHE,
+                    **getattr(settings, 'INVITATIONS_TOKEN_NEGATIVE_CACHE', {})
+                }
+                _token_negative_cache = LRUCache(config['MAXSIZE'], config['TTL'])
+    return _token_negative_cache
@@ -0,0 +1,60 @@
+# invitations/counters.py
+"""
+초대 상태 카운터 재계산
+
+카운터는 보관(ArchivedInvitation)된 초대를 포함한 프로젝트 전체 건수이다.
+"""
+
+from django.db import transaction
+from django.db.models import Count, Sum
+
+from .models import ArchivedInvitation, EvaluationInvitation, InvitationStatusCounter
+
+
+def reconcile_status_counters(project_ids=None, fix=False):
+    """실제 초대 수와 카운터를 비교해 차이 목록 반환
+    
+    차이는 [(project_id, status, counted, actual)] 형태이며,
+    fix=True 면 차이가 있는 프로젝트의 카운터를 실제 값으로 다시 만든다.
+    """
+    counter_rows = InvitationStatusCounter.objects.values('project_id', 'status').annotate(total=Sum('count'))
+    if project_ids:
+        counter_rows = counter_rows.filter(project_id__in=project_ids)
+    
+    actual = {}
+    for model in (EvaluationInvitation, ArchivedInvitation):
+        rows = model.objects.values('project_id', 'status').annotate(total=Count('pk'))
+        if project_ids:
+            rows = rows.filter(project_id__in=project_ids)
+        for row in rows.order_by():
+            key = (row['project_id'], row['status'])
+            actual[key] = actual.get(key, 0) + row['total']
+    counted = {(row['project_id'], row['status']): row['total'] for row in counter_rows.order_by()}
+    
+    drift = [
+        (project_id, status, counted.get((project_id, status), 0), actual.get((project_id, status), 0))
+        for project_id, status in sorted(set(actual) | set(counted), key=str)
+        if counted.get((project_id, status), 0) != actual.get((project_id, status), 0)
+    ]
+    
+    if fix:
+        for project_id in {project_id for project_id, _, _, _ in drift}:
+            rebuild_project_counters(project_id)
+    return drift
+
+
+def rebuild_project_counters(project_id):
+    """프로젝트 카운터를 실제 초대 수로 재생성"""
+    with transaction.atomic():
+        # 진행 중인 증분 갱신과 겹치지 않도록 카운터 행 잠금
+        list(InvitationStatusCounter.objects.select_for_update().filter(project_id=project_id).values_list('pk'))
+        InvitationStatusCounter.objects.filter(project_id=project_id).delete()
+        totals = {}
+        for model in (EvaluationInvitation, ArchivedInvitation):
+            rows = model.objects.filter(project_id=project_id).values('status').annotate(total=Count('pk')).order_by()
+            for row in rows:
+                totals[row['status']] = totals.get(row['status'], 0) + row['total']
+        InvitationStatusCounter.objects.bulk_create([
+            InvitationStatusCounter(project_id=project_id, status=status, shard=0, count=total)
+            for status, total in totals.items()
+        ])
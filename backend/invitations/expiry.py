@@ -0,0 +1,77 @@
+# invitations/expiry.py
+"""
+대기중 초대 만료 처리
+"""
+
+import time
+from collections import Counter
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from .models import EvaluationInvitation, InvitationActivity, adjust_status_counters
+
+# 배치당 처리 건수
+DEFAULT_EXPIRY_BATCH_SIZE = 1000
+
+
+def expire_pending_invitations(batch_size=DEFAULT_EXPIRY_BATCH_SIZE, time_budget=None, now=None):
+    """만료 시간이 지난 대기중 초대를 'expired' 로 일괄 전환
+    
+    (status, expires_at) 인덱스를 따라 (expires_at, id) 키셋 페이지 단위로
+    잠금 → UPDATE → 'expired' 활동 로그 bulk_create 를 배치별 트랜잭션으로 수행한다.
+    skip_locked 로 건너뛴 행이 남을 수 있으므로 처음부터 조회한 배치가 빌 때까지 반복한다.
+    스케줄러에서 직접 호출할 수 있으며 time_budget(초)을 넘기면 다음 배치 전에 멈춘다.
+    """
+    now = now or timezone.now()
+    started = time.monotonic()
+    expired = 0
+    batches = 0
+    timed_out = False
+    last_key = None
+    
+    while True:
+        if time_budget is not None and time.monotonic() - started >= time_budget:
+            timed_out = True
+            break
+        
+        with transaction.atomic():
+            queryset = EvaluationInvitation.objects.filter(status='pending', expires_at__lt=now)
+            if last_key:
+                queryset = queryset.filter(
+                    Q(expires_at__gt=last_key[0]) | Q(expires_at=last_key[0], pk__gt=last_key[1])
+                )
+            rows = list(
+                queryset.select_for_update(skip_locked=True)
+                .order_by('expires_at', 'pk')
+                .values_list('pk', 'expires_at', 'project_id')[:batch_size]
+            )
+            if not rows:
+                # 키셋 뒤쪽에서 끝났으면 앞에서 다른 실행이 잠가 건너뛴 행을 다시 확인
+                if last_key is None:
+                    break
+                last_key = None
+                continue
+            
+            ids = [pk for pk, _, _ in rows]
+            EvaluationInvitation.objects.filter(pk__in=ids, status='pending', expires_at__lt=now).update(status='expired')
+            InvitationActivity.objects.bulk_create([
+                InvitationActivity(invitation_id=pk, action='expired', metadata={'expired_at': now.isoformat()})
+                for pk in ids
+            ])
+            # 동시 실행 간 교착을 피하도록 프로젝트 순서로 카운터 갱신
+            for project_id, count in sorted(Counter(project_id for _, _, project_id in rows).items()):
+                adjust_status_counters(project_id, {'pending': -count, 'expired': count})
+        
+        expired += len(rows)
+        batches += 1
+        last_key = rows[-1][1], rows[-1][0]
+    
+    elapsed = time.monotonic() - started
+    return {
+        'expired': expired,
+        'batches': batches,
+        'elapsed': elapsed,
+        'rows_per_sec': expired / elapsed if elapsed > 0 else 0.0,
+        'timed_out': timed_out
+    }
@@ -0,0 +1,145 @@
+# invitations/importer.py
+"""
+대량 초대 명단(CSV/XLSX) 스트리밍 가져오기
+
+파일을 한 행씩 읽어 chunk_size 단위로 EvaluationInvitation.objects.bulk_invite 에
+넘긴다. 청크마다 이메일 검증(invitee_email 필드 검증기), 기존 대기중 초대 확인(1 쿼리),
+일괄 삽입(PostgreSQL 은 COPY)이 이루어지고 청크별로 커밋되므로 메모리 사용량은
+파일 크기와 무관하게 일정하다 (파일 내 중복 제거용 이메일 집합만 유지).
+확인과 삽입 사이에 같은 이메일의 초대가 따로 생기면 그 청크만 다시 확인해 재시도한다.
+XLSX 는 선택 의존성 openpyxl 이 필요하다.
+"""
+
+import csv
+import os
+import time
+from django.db import IntegrityError
+
+from .models import EvaluationInvitation, normalize_email
+
+IMPORT_CHUNK_SIZE = 1000
+
+# 동시 초대와 충돌한 청크의 재시도 횟수
+IMPORT_CHUNK_RETRIES = 3
+
+# 헤더 행에서 인식하는 열 이름
+EMAIL_HEADERS = {'email', 'e-mail', 'invitee_email', '이메일'}
+NAME_HEADERS = {'name', 'invitee_name', '이름', '성명'}
+
+# 보고서에 남길 잘못된 행 최대 개수
+MAX_INVALID_SAMPLES = 20
+
+
+def iter_csv_rows(path, encoding='utf-8-sig'):
+    with open(path, newline='', encoding=encoding) as f:
+        yield from csv.reader(f)
+
+
+def iter_xlsx_rows(path):
+    try:
+        from openpyxl import load_workbook
+    except ImportError:
+        raise ImportError('XLSX 가져오기에는 openpyxl 이 필요합니다 (pip install openpyxl)')
+    
+    workbook = load_workbook(path, read_only=True, data_only=True)
+    try:
+        for row in workbook.active.iter_rows(values_only=True):
+            yield ['' if value is None else str(value) for value in row]
+    finally:
+        workbook.close()
+
+
+def iter_invitee_rows(path, file_format=None):
+    """(행 번호, 이메일, 이름) 생성기
+    
+    첫 행에 이메일/이름 헤더가 있으면 해당 열을, 없으면 첫 두 열을 사용한다.
+    """
+    file_format = file_format or os.path.splitext(path)[1].lstrip('.').lower()
+    if file_format == 'xlsx':
+        rows = iter_xlsx_rows(path)
+    elif file_format in ('csv', 'txt'):
+        rows = iter_csv_rows(path)
+    else:
+        raise ValueError(f'지원하지 않는 파일 형식입니다: {file_format}')
+    
+    email_column, name_column = 0, 1
+    for number, row in enumerate(rows, start=1):
+        if number == 1:
+            headers = [cell.strip().lower() for cell in row]
+            email_index = next((i for i, header in enumerate(headers) if header in EMAIL_HEADERS), None)
+            if email_index is not None:
+                email_column = email_index
+                name_column = next((i for i, header in enumerate(headers) if header in NAME_HEADERS), None)
+                continue
+        
+        if not any(cell.strip() for cell in row):
+            continue
+        email = row[email_column] if email_column < len(row) else ''
+        name = row[name_column] if name_column is not None and name_column < len(row) else ''
+        yield number, email.strip(), name.strip()
+
+
+def import_invitees(project, rows, role='evaluator', inviter=None, custom_message='',
+                    permissions=None, expires_at=None, chunk_size=IMPORT_CHUNK_SIZE, progress=None):
+    """(행 번호, 이메일, 이름) 스트림을 청크 단위로 초대 생성
+    
+    progress(stats) 는 청크 처리 후마다 호출된다.
+    """
+    stats = {
+        'rows': 0,
+        'created': 0,
+        'skipped_duplicate': 0,
+        'invalid_email': 0,
+        'chunks': 0,
+        'invalid_samples': []
+    }
+    started = time.monotonic()
+    # 파일 내 중복 제거 (bulk_invite 호출 간 공유)
+    seen = set()
+    chunk = []
+    
+    def invite_chunk():
+        # 실패 시 이 청크가 seen 에 추가한 이메일만 되돌리기 위해 미리 계산
+        fresh = {normalize_email(email) for _, email, _ in chunk} - seen
+        for attempt in range(IMPORT_CHUNK_RETRIES):
+            try:
+                return EvaluationInvitation.objects.bulk_invite(
+                    project,
+                    [(email, name) for _, email, name in chunk],
+                    role=role,
+                    inviter=inviter,
+                    custom_message=custom_message,
+                    permissions=permissions,
+                    expires_at=expires_at,
+                    batch_size=chunk_size,
+                    seen=seen
+                )
+            except IntegrityError:
+                # 사전 확인 후 같은 이메일의 대기 초대가 동시에 생성됨, 청크를 다시 확인
+                seen.difference_update(fresh)
+                if attempt == IMPORT_CHUNK_RETRIES - 1:
+                    raise
+    
+    def flush():
+        results = invite_chunk()
+        for (number, _, _), result in zip(chunk, results):
+            stats[result['status']] += 1
+            if result['status'] == 'invalid_email' and len(stats['invalid_samples']) < MAX_INVALID_SAMPLES:
+                stats['invalid_samples'].append((number, result['email']))
+        stats['chunks'] += 1
+        stats['elapsed'] = time.monotonic() - started
+        chunk.clear()
+        if progress:
+            progress(stats)
+    
+    for number, email, name in rows:
+        stats['rows'] += 1
+        chunk.append((number, email, name))
+        if len(chunk) >= chunk_size:
+            flush()
+    if chunk:
+        flush()
+    
+    stats['elapsed'] = time.monotonic() - started
+    stats['rows_per_sec'] = stats['rows'] / stats['elapsed'] if stats['elapsed'] else 0
+    return stats
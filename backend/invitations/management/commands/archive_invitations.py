@@ -0,0 +1,45 @@
+# invitations/management/commands/archive_invitations.py
+"""
+종료된 프로젝트 초대 보관 명령
+사용법:
+    python manage.py archive_invitations --project <id> [--project <id> ...]
+    python manage.py archive_invitations --inactive-days 180 [--dry-run]
+"""
+
+from django.core.management.base import BaseCommand, CommandError
+
+from invitations.archive import ARCHIVE_BATCH_SIZE, archive_project, find_archivable_projects
+
+
+class Command(BaseCommand):
+    help = '종료된 프로젝트의 초대와 활동 로그를 보관 테이블로 옮깁니다'
+    
+    def add_arguments(self, parser):
+        parser.add_argument('--project', action='append', dest='projects', help='대상 프로젝트 id (반복 지정 가능)')
+        parser.add_argument('--inactive-days', type=int, default=None,
+                            help='대기 초대가 없고 이 기간 동안 새 초대가 없는 프로젝트를 대상으로 함')
+        parser.add_argument('--batch-size', type=int, default=ARCHIVE_BATCH_SIZE, help='배치당 초대 수')
+        parser.add_argument('--dry-run', action='store_true', help='대상 프로젝트만 출력')
+    
+    def handle(self, *args, **options):
+        project_ids = options['projects'] or []
+        if options['inactive_days'] is not None:
+            project_ids += find_archivable_projects(options['inactive_days'])
+        if not project_ids:
+            raise CommandError('--project 또는 --inactive-days 를 지정하세요')
+        
+        for project_id in project_ids:
+            if options['dry_run']:
+                self.stdout.write(f"  보관 대상: {project_id}")
+                continue
+            try:
+                stats = archive_project(project_id, batch_size=options['batch_size'])
+            except ValueError as e:
+                self.stdout.write(self.style.WARNING(str(e)))
+                continue
+            self.stdout.write(self.style.SUCCESS(
+                f"프로젝트 {project_id}: 초대 {stats['invitations']}건, 활동 {stats['activities']}건 보관 "
+                f"({stats['batches']}배치)"
+            ))
+            if stats['pooled_discarded']:
+                self.stdout.write(f"  발급되지 않은 풀 초대 {stats['pooled_discarded']}건 삭제")
@@ -0,0 +1,80 @@
+# invitations/management/commands/benchmark_invitations.py
+"""
+초대 앱 규모 벤치마크 명령
+사용법:
+    python manage.py benchmark_invitations --projects 10 --invitations 2000 --activities 3 \
+        --output bench.json [--thresholds thresholds.json] [--baseline previous.json]
+
+기본적으로 한 트랜잭션 안에서 실행 후 롤백하므로 로컬 DB 에 데이터가 남지 않는다.
+"""
+
+import json
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from invitations import benchmarks
+
+
+class Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = '초대/수락/리마인더/만료/권한/대시보드 경로의 지연 시간과 쿼리 수를 측정합니다'
+    
+    def add_arguments(self, parser):
+        parser.add_argument('--projects', type=int, default=10, help='프로젝트 수 (N)')
+        parser.add_argument('--invitations', type=int, default=1000, help='프로젝트당 초대 수 (M)')
+        parser.add_argument('--activities', type=int, default=3, help='초대당 활동 로그 수 (K)')
+        parser.add_argument('--users', type=int, default=1000, help='생성할 사용자 수')
+        parser.add_argument('--iterations', type=int, default=50, help='시나리오당 반복 횟수')
+        parser.add_argument('--output', help='결과 JSON 경로')
+        parser.add_argument('--thresholds', help='임계값 JSON 경로 {시나리오: {max_queries, p95_ms}}')
+        parser.add_argument('--baseline', help='비교할 이전 결과 JSON 경로')
+        parser.add_argument('--tolerance', type=float, default=0.2, help='기준 대비 허용 p95 증가 비율')
+        parser.add_argument('--keep-data', action='store_true', help='생성한 데이터를 롤백하지 않음')
+    
+    def handle(self, *args, **options):
+        scale = {key: options[key] for key in ('projects', 'invitations', 'activities', 'users', 'iterations')}
+        
+        try:
+            with transaction.atomic():
+                self.stdout.write(f"데이터 생성: {scale}")
+                projects, users, owner = benchmarks.seed(
+                    options['projects'], options['invitations'], options['activities'], options['users']
+                )
+                results = benchmarks.run_scenarios(projects, users, owner, options['iterations'])
+                if not options['keep_data']:
+                    raise Rollback
+        except Rollback:
+            pass
+        
+        report = benchmarks.build_report(results, scale)
+        self.stdout.write(f"{'시나리오':<28}{'반복':>6}{'p50 ms':>10}{'p95 ms':>10}{'max ms':>10}{'쿼리':>6}")
+        for name, result in results.items():
+            self.stdout.write(
+                f"{name:<28}{result['iterations']:>6}{result['p50_ms']:>10.2f}"
+                f"{result['p95_ms']:>10.2f}{result['max_ms']:>10.2f}{result['queries_per_op']:>6}"
+            )
+        if options['output']:
+            benchmarks.dump_report(report, options['output'])
+            self.stdout.write(f"결과 저장: {options['output']}")
+        
+        thresholds = self.load_json(options['thresholds'])
+        baseline = self.load_json(options['baseline'])
+        # 데이터가 없어 건너뛴 시나리오 (예: 권한 행이 없는 경우) 는 비교에서 빠지므로 알림
+        skipped = sorted(set(thresholds or {}).union((baseline or {}).get('scenarios') or {}) - set(results))
+        if skipped:
+            self.stdout.write(self.style.WARNING(f"결과에 없는 시나리오 (비교 생략): {', '.join(skipped)}"))
+        failures = benchmarks.check_thresholds(results, thresholds, baseline, options['tolerance'])
+        if failures:
+            for failure in failures:
+                self.stderr.write(f"  {failure}")
+            raise CommandError(f'성능 회귀 {len(failures)}건')
+        self.stdout.write(self.style.SUCCESS('임계값 이내입니다.'))
+    
+    def load_json(self, path):
+        if not path:
+            return None
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
@@ -0,0 +1,32 @@
+# invitations/management/commands/expire_invitations.py
+"""
+만료된 대기중 초대 정리 명령
+사용법: python manage.py expire_invitations --batch-size 1000 --time-budget 60
+"""
+
+from django.core.management.base import BaseCommand
+
+from invitations.expiry import DEFAULT_EXPIRY_BATCH_SIZE, expire_pending_invitations
+
+
+class Command(BaseCommand):
+    help = '만료 시간이 지난 대기중 초대를 expired 상태로 일괄 전환합니다'
+    
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=DEFAULT_EXPIRY_BATCH_SIZE,
+                            help='배치당 처리 건수')
+        parser.add_argument('--time-budget', type=float, default=None,
+                            help='최대 실행 시간(초), 초과 시 다음 배치 전에 중단')
+    
+    def handle(self, *args, **options):
+        stats = expire_pending_invitations(
+            batch_size=options['batch_size'],
+            time_budget=options['time_budget']
+        )
+        
+        self.stdout.write(self.style.SUCCESS(
+            f"만료 처리: {stats['expired']}건, {stats['batches']}배치, "
+            f"{stats['elapsed']:.2f}초 ({stats['rows_per_sec']:.0f} rows/sec)"
+        ))
+        if stats['timed_out']:
+            self.stdout.write(self.style.WARNING('시간 제한으로 중단되었습니다. 남은 초대는 다음 실행에서 처리됩니다.'))
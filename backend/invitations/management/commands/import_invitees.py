@@ -0,0 +1,75 @@
+# invitations/management/commands/import_invitees.py
+"""
+초대 명단 가져오기 명령
+사용법: python manage.py import_invitees <project_id> invitees.csv --role evaluator --inviter owner@example.com
+"""
+
+from datetime import timedelta
+from django.apps import apps
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from invitations.importer import IMPORT_CHUNK_SIZE, import_invitees, iter_invitee_rows
+from invitations.models import EvaluationInvitation
+
+
+class Command(BaseCommand):
+    help = 'CSV/XLSX 초대 명단을 스트리밍으로 읽어 청크 단위로 초대를 생성합니다'
+    
+    def add_arguments(self, parser):
+        parser.add_argument('project_id', help='초대할 프로젝트 ID')
+        parser.add_argument('path', help='CSV 또는 XLSX 파일 경로')
+        parser.add_argument('--format', choices=['csv', 'xlsx'], help='파일 형식 (기본: 확장자로 판단)')
+        parser.add_argument('--role', default='evaluator',
+                            choices=[role for role, _ in EvaluationInvitation.ROLE_CHOICES])
+        parser.add_argument('--inviter', help='초대자 이메일')
+        parser.add_argument('--message', default='', help='초대 메시지')
+        parser.add_argument('--expires-days', type=int, default=None, help='유효 기간(일)')
+        parser.add_argument('--chunk-size', type=int, default=IMPORT_CHUNK_SIZE, help='청크당 행 수')
+    
+    def handle(self, *args, **options):
+        Project = apps.get_model('projects', 'Project')
+        try:
+            project = Project.objects.get(pk=options['project_id'])
+        except Project.DoesNotExist:
+            raise CommandError(f"프로젝트 {options['project_id']} 가 없습니다")
+        
+        inviter = None
+        if options['inviter']:
+            inviter = get_user_model().objects.filter(email=options['inviter']).first()
+            if inviter is None:
+                raise CommandError(f"사용자 {options['inviter']} 가 없습니다")
+        
+        expires_at = None
+        if options['expires_days']:
+            expires_at = timezone.now() + timedelta(days=options['expires_days'])
+        
+        try:
+            rows = iter_invitee_rows(options['path'], options['format'])
+            stats = import_invitees(
+                project,
+                rows,
+                role=options['role'],
+                inviter=inviter,
+                custom_message=options['message'],
+                expires_at=expires_at,
+                chunk_size=options['chunk_size'],
+                progress=self.report_progress
+            )
+        except (OSError, ValueError, ImportError) as e:
+            raise CommandError(str(e))
+        
+        self.stdout.write(self.style.SUCCESS(
+            f"가져오기 완료: {stats['rows']}행, 생성 {stats['created']}건, "
+            f"중복 {stats['skipped_duplicate']}건, 잘못된 이메일 {stats['invalid_email']}건, "
+            f"{stats['elapsed']:.2f}초 ({stats['rows_per_sec']:.0f} rows/sec)"
+        ))
+        for number, email in stats['invalid_samples']:
+            self.stdout.write(self.style.WARNING(f"  {number}행: {email!r}"))
+    
+    def report_progress(self, stats):
+        self.stdout.write(
+            f"  {stats['rows']}행 처리 (생성 {stats['created']}, 중복 {stats['skipped_duplicate']}, "
+            f"오류 {stats['invalid_email']}) {stats['elapsed']:.1f}초"
+        )
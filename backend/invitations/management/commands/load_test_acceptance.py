@@ -0,0 +1,124 @@
+# invitations/management/commands/load_test_acceptance.py
+"""
+초대 수락 부하 테스트 명령
+사용법:
+    python manage.py load_test_acceptance --clients 500 --invitations 5000 [--duplicates 2]
+
+동시 클라이언트 N 개가 aaccept_invitation 으로 대기 초대를 수락하고
+초당 수락 수와 지연 분포를 출력한다. --duplicates 로 같은 토큰을 여러
+클라이언트가 동시에 수락하게 해 중복 수락이 한 번만 반영되는지 확인한다.
+동시 쓰기를 지원하는 PostgreSQL/MySQL 에서 실행해야 하며, 작업 스레드가
+연결을 재사용하도록 CONN_MAX_AGE 를 0 보다 크게 두는 것을 권장한다.
+"""
+
+import asyncio
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from django.apps import apps
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+
+from invitations.acceptance import aaccept_invitation
+from invitations.benchmarks import BENCHMARK_PREFIX, percentile, project_kwargs
+from invitations.models import EvaluationInvitation, InvitationStatusCounter, ParticipantPermission
+
+
+class Command(BaseCommand):
+    help = '동시 클라이언트로 초대 수락 처리량(accepts/sec)을 측정합니다'
+    
+    def add_arguments(self, parser):
+        parser.add_argument('--clients', type=int, default=500, help='동시 클라이언트 수')
+        parser.add_argument('--invitations', type=int, default=5000, help='수락할 초대 수')
+        parser.add_argument('--duplicates', type=int, default=1, help='토큰당 동시 수락 시도 수')
+        parser.add_argument('--workers', type=int, default=64, help='DB 작업 스레드 수 (= 최대 DB 연결 수)')
+        parser.add_argument('--keep-data', action='store_true', help='생성한 데이터를 삭제하지 않음')
+    
+    def handle(self, *args, **options):
+        project, users, tokens = self.seed(options['invitations'])
+        attempts = [(token, user) for token, user in zip(tokens, users) for _ in range(options['duplicates'])]
+        random.shuffle(attempts)
+        
+        try:
+            results, elapsed = asyncio.run(self.run(attempts, options['clients'], options['workers']))
+            self.report(project, results, elapsed, len(tokens))
+        finally:
+            if not options['keep_data']:
+                self.cleanup(project)
+    
+    def seed(self, count):
+        User = get_user_model()
+        Project = apps.get_model('projects', 'Project')
+        self.run_id = run_id = f'{BENCHMARK_PREFIX}-load-{int(time.time())}'
+        
+        owner = User.objects.create(**{
+            User.USERNAME_FIELD: f'{run_id}-owner@example.com',
+            'email': f'{run_id}-owner@example.com'
+        })
+        project = Project.objects.create(**project_kwargs(run_id, owner))
+        User.objects.bulk_create([
+            User(**{User.USERNAME_FIELD: f'{run_id}-{i}@example.com', 'email': f'{run_id}-{i}@example.com'})
+            for i in range(count)
+        ], batch_size=1000)
+        users = {
+            user.email: user
+            for user in User.objects.filter(email__startswith=f'{run_id}-').exclude(pk=owner.pk)
+        }
+        
+        results = EvaluationInvitation.objects.bulk_invite(project, list(users), inviter=owner)
+        created = [result['invitation'] for result in results if result['status'] == 'created']
+        self.stdout.write(f"초대 {len(created)}건 생성 (프로젝트 {project.pk})")
+        return project, [users[invitation.invitee_email] for invitation in created], \
+            [invitation.raw_token for invitation in created]
+    
+    async def run(self, attempts, clients, workers):
+        loop = asyncio.get_running_loop()
+        loop.set_default_executor(ThreadPoolExecutor(max_workers=workers))
+        queue = asyncio.Queue()
+        for attempt in attempts:
+            queue.put_nowait(attempt)
+        results = []
+        
+        async def client():
+            while not queue.empty():
+                token, user = queue.get_nowait()
+                started = time.perf_counter()
+                result = await aaccept_invitation(token, user)
+                results.append((result.status, (time.perf_counter() - started) * 1000))
+        
+        started = time.perf_counter()
+        await asyncio.gather(*(client() for _ in range(clients)))
+        return results, time.perf_counter() - started
+    
+    def report(self, project, results, elapsed, expected):
+        statuses = {}
+        for status, _ in results:
+            statuses[status] = statuses.get(status, 0) + 1
+        timings = [ms for _, ms in results]
+        accepted = statuses.get('accepted', 0)
+        
+        self.stdout.write(f"시도 {len(results)}건, {elapsed:.2f}초: {statuses}")
+        self.stdout.write(f"처리량: {accepted / elapsed:.1f} accepts/sec, {len(results) / elapsed:.1f} attempts/sec")
+        self.stdout.write(
+            f"지연(ms): p50 {percentile(timings, 0.5):.1f}, p95 {percentile(timings, 0.95):.1f}, "
+            f"p99 {percentile(timings, 0.99):.1f}, max {max(timings):.1f}"
+        )
+        
+        # 중복 수락/누락 검증
+        rows = EvaluationInvitation.objects.filter(project=project, status='accepted').count()
+        permissions = ParticipantPermission.objects.filter(project=project).count()
+        counters = InvitationStatusCounter.objects.for_project(project)
+        problems = []
+        if accepted != rows or rows != permissions:
+            problems.append(f"수락 {accepted}건, 수락된 초대 {rows}건, 권한 {permissions}건 불일치")
+        if counters['accepted'] != rows:
+            problems.append(f"카운터 accepted={counters['accepted']}, 실제 {rows}")
+        if rows != expected:
+            problems.append(f"수락되지 않은 초대 {expected - rows}건")
+        if problems:
+            raise CommandError('; '.join(problems))
+        self.stdout.write(self.style.SUCCESS('중복 수락 없이 모든 초대가 한 번씩 수락되었습니다.'))
+    
+    def cleanup(self, project):
+        project.delete()
+        get_user_model().objects.filter(email__startswith=f'{self.run_id}-').delete()
@@ -0,0 +1,55 @@
+# invitations/management/commands/manage_activity_partitions.py
+"""
+초대 활동 로그 월별 파티션 관리 명령 (PostgreSQL 전용)
+사용법:
+    python manage.py manage_activity_partitions --convert          # 최초 1회 파티션 테이블 전환
+    python manage.py manage_activity_partitions --ahead 3          # 향후 파티션 생성
+    python manage.py manage_activity_partitions --compact --retain-months 12 [--keep-detached]
+"""
+
+from django.core.management.base import BaseCommand, CommandError
+
+from invitations import partitions
+
+
+class Command(BaseCommand):
+    help = 'invitation_activities 월별 파티션을 생성하고 보존 기간이 지난 파티션을 요약 후 정리합니다'
+    
+    def add_arguments(self, parser):
+        parser.add_argument('--database', default='default', help='대상 데이터베이스 별칭')
+        parser.add_argument('--convert', action='store_true',
+                            help='일반 테이블을 파티션 테이블로 전환 (최초 1회)')
+        parser.add_argument('--ahead', type=int, default=3, help='미리 생성할 개월 수')
+        parser.add_argument('--compact', action='store_true',
+                            help='보존 기간이 지난 파티션을 요약 테이블로 집계 후 분리')
+        parser.add_argument('--retain-months', type=int, default=12, help='상세 로그 보존 개월 수')
+        parser.add_argument('--keep-detached', action='store_true',
+                            help='분리한 파티션을 삭제하지 않고 독립 테이블로 남김')
+    
+    def handle(self, *args, **options):
+        using = options['database']
+        try:
+            if options['convert']:
+                if partitions.convert_to_partitioned(options['ahead'], using):
+                    self.stdout.write(self.style.SUCCESS('파티션 테이블로 전환했습니다.'))
+                else:
+                    self.stdout.write('이미 파티션 테이블입니다.')
+            elif not partitions.is_partitioned(using):
+                raise CommandError('파티션 테이블이 아닙니다. 먼저 --convert 를 실행하세요.')
+            
+            created = partitions.ensure_partitions(options['ahead'], using)
+            self.stdout.write(f"파티션 확인: {created[0]} ~ {created[-1]}")
+            for name, moved in partitions.drain_default_partition(using):
+                self.stdout.write(self.style.WARNING(f'  DEFAULT 파티션의 {moved}행을 {name} 로 옮겼습니다 (파티션 생성 지연)'))
+            
+            if options['compact']:
+                compacted = partitions.compact_partitions(
+                    retain_months=options['retain_months'],
+                    drop=not options['keep_detached'],
+                    using=using
+                )
+                for month, name, summarized in compacted:
+                    self.stdout.write(f"  {name}: 요약 {summarized}행, {'분리' if options['keep_detached'] else '삭제'}")
+                self.stdout.write(self.style.SUCCESS(f'정리한 파티션: {len(compacted)}개'))
+        except NotImplementedError as error:
+            raise CommandError(str(error))
@@ -0,0 +1,30 @@
+# invitations/management/commands/reconcile_invitation_counters.py
+"""
+초대 상태 카운터 정합성 점검 명령
+사용법: python manage.py reconcile_invitation_counters [--project <id> ...] [--fix]
+"""
+
+from django.core.management.base import BaseCommand
+
+from invitations.counters import reconcile_status_counters
+
+
+class Command(BaseCommand):
+    help = '프로젝트별 초대 상태 카운터를 실제 초대 수와 비교하고 필요 시 재생성합니다'
+    
+    def add_arguments(self, parser):
+        parser.add_argument('--project', action='append', dest='projects', help='대상 프로젝트 id (반복 지정 가능)')
+        parser.add_argument('--fix', action='store_true', help='차이가 있는 프로젝트의 카운터 재생성')
+    
+    def handle(self, *args, **options):
+        drift = reconcile_status_counters(options['projects'], fix=options['fix'])
+        
+        for project_id, status, counted, actual in drift:
+            self.stdout.write(f"  {project_id} {status}: 카운터 {counted} / 실제 {actual} ({counted - actual:+d})")
+        
+        if not drift:
+            self.stdout.write(self.style.SUCCESS('카운터가 모두 일치합니다.'))
+        elif options['fix']:
+            self.stdout.write(self.style.SUCCESS(f'{len(drift)}개 항목의 카운터를 재생성했습니다.'))
+        else:
+            self.stdout.write(self.style.WARNING(f'{len(drift)}개 항목이 일치하지 않습니다. --fix 로 재생성하세요.'))
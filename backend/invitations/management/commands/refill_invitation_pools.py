@@ -0,0 +1,49 @@
+# invitations/management/commands/refill_invitation_pools.py
+"""
+초대 토큰 풀 보충 명령
+사용법:
+    python manage.py refill_invitation_pools [--force]
+    python manage.py refill_invitation_pools --interval 30   # 주기적으로 반복
+    python manage.py refill_invitation_pools --stats
+"""
+
+import time
+from django.core.management.base import BaseCommand
+
+from invitations.pool import REFILL_BATCH_SIZE, pool_stats, refill_pools
+
+
+class Command(BaseCommand):
+    help = '남은 수가 low_water 이하인 초대 토큰 풀을 target_size 까지 보충합니다'
+    
+    def add_arguments(self, parser):
+        parser.add_argument('--force', action='store_true', help='low_water 와 무관하게 target_size 까지 보충')
+        parser.add_argument('--batch-size', type=int, default=REFILL_BATCH_SIZE, help='배치당 삽입 행 수')
+        parser.add_argument('--interval', type=float, default=None, help='지정 시 이 간격(초)으로 반복 실행')
+        parser.add_argument('--stats', action='store_true', help='보충하지 않고 풀 상태만 출력')
+    
+    def handle(self, *args, **options):
+        if options['stats']:
+            self.report_stats()
+            return
+        
+        while True:
+            started = time.monotonic()
+            added = refill_pools(force=options['force'], batch_size=options['batch_size'])
+            for project_id, count in added.items():
+                if count:
+                    self.stdout.write(self.style.SUCCESS(f"프로젝트 {project_id}: {count}건 보충"))
+            self.stdout.write(
+                f"풀 {len(added)}개 확인, {sum(added.values())}건 보충 ({time.monotonic() - started:.2f}초)"
+            )
+            if options['interval'] is None:
+                break
+            time.sleep(options['interval'])
+    
+    def report_stats(self):
+        for pool in pool_stats()['pools']:
+            line = (
+                f"프로젝트 {pool['project_id']}: {pool['size']}/{pool['target_size']} "
+                f"(low_water {pool['low_water']}, 마지막 보충 {pool['last_refilled_at'] or '-'})"
+            )
+            self.stdout.write(self.style.WARNING(line) if pool['below_low_water'] else line)
@@ -0,0 +1,25 @@
+# invitations/management/commands/restore_invitations.py
+"""
+보관된 프로젝트 초대 복원 명령
+사용법: python manage.py restore_invitations <project_id> [<project_id> ...]
+"""
+
+from django.core.management.base import BaseCommand
+
+from invitations.archive import ARCHIVE_BATCH_SIZE, restore_project
+
+
+class Command(BaseCommand):
+    help = '보관 테이블의 프로젝트 초대와 활동 로그를 원본 테이블로 복원합니다'
+    
+    def add_arguments(self, parser):
+        parser.add_argument('project_ids', nargs='+', help='복원할 프로젝트 id')
+        parser.add_argument('--batch-size', type=int, default=ARCHIVE_BATCH_SIZE, help='배치당 초대 수')
+    
+    def handle(self, *args, **options):
+        for project_id in options['project_ids']:
+            stats = restore_project(project_id, batch_size=options['batch_size'])
+            self.stdout.write(self.style.SUCCESS(
+                f"프로젝트 {project_id}: 초대 {stats['invitations']}건, 활동 {stats['activities']}건 복원 "
+                f"({stats['batches']}배치)"
+            ))
@@ -0,0 +1,109 @@
+# invitations/management/commands/run_workload.py
+"""
+합성 워크로드 생성/재생 명령
+사용법:
+    python manage.py run_workload --projects 50 --invitations 2000 --users 20000 \
+        --concurrency 16 --duration 60 --output after.json [--baseline before.json]
+    python manage.py run_workload --skip-populate --profile 'view=50,accept=20,permission_check=30'
+    python manage.py run_workload --cleanup
+
+replay 는 여러 DB 연결에서 동시에 실행되므로 데이터는 커밋된 상태로 남는다 (--cleanup 으로 삭제).
+동시 쓰기를 지원하는 PostgreSQL 에서 실행하는 것을 권장한다.
+"""
+
+import json
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from invitations import benchmarks, workload
+
+
+class Command(BaseCommand):
+    help = '운영과 비슷한 분포의 데이터를 만들고 혼합 트래픽을 동시에 재생해 작업별 처리량/지연을 측정합니다'
+    
+    def add_arguments(self, parser):
+        parser.add_argument('--projects', type=int, default=20, help='프로젝트 수')
+        parser.add_argument('--invitations', type=int, default=2000, help='프로젝트당 평균 초대 수')
+        parser.add_argument('--users', type=int, default=5000, help='가입 사용자 수')
+        parser.add_argument('--activities', type=float, default=2, help='초대당 평균 열람 로그 수')
+        parser.add_argument('--skip-populate', action='store_true', help='이전에 생성한 데이터로 재생만 실행')
+        parser.add_argument('--profile', help="트래픽 프로필 'view=30,accept=10,...' (기본 DEFAULT_TRAFFIC_PROFILE)")
+        parser.add_argument('--concurrency', type=int, default=8, help='동시 스레드 수 (= DB 연결 수)')
+        parser.add_argument('--duration', type=float, default=30.0, help='재생 시간(초)')
+        parser.add_argument('--operations', type=int, default=None, help='최대 작업 수')
+        parser.add_argument('--seed', type=int, default=None, help='난수 시드 (같은 값이면 같은 데이터/트래픽)')
+        parser.add_argument('--output', help='결과 JSON 경로')
+        parser.add_argument('--baseline', help='비교할 이전 결과 JSON 경로')
+        parser.add_argument('--tolerance', type=float, default=0.2, help='기준 대비 허용 p95 증가/처리량 감소 비율')
+        parser.add_argument('--cleanup', action='store_true', help='생성한 워크로드 데이터를 삭제하고 종료')
+    
+    def handle(self, *args, **options):
+        if options['cleanup']:
+            count = workload.cleanup()
+            self.stdout.write(self.style.SUCCESS(f"워크로드 프로젝트 {count}개 삭제"))
+            return
+        
+        try:
+            profile = workload.parse_profile(options['profile'])
+        except ValueError as e:
+            raise CommandError(str(e))
+        scale = {key: options[key] for key in ('projects', 'invitations', 'users', 'activities', 'seed')}
+        
+        if options['skip_populate']:
+            try:
+                state = workload.load_state()
+            except ValueError as e:
+                raise CommandError(str(e))
+        else:
+            self.stdout.write(f"데이터 생성: {scale}")
+            state = workload.populate(
+                options['projects'], options['invitations'], options['users'], options['activities'],
+                seed=options['seed'], progress=self.report_progress
+            )
+        self.stdout.write(
+            f"재생: 프로젝트 {len(state.project_ids)}개, 수락 토큰 {len(state.tokens)}개, "
+            f"동시 {options['concurrency']}, {options['duration']}초"
+        )
+        connection.close()
+        result = workload.replay(
+            state, profile, options['concurrency'], options['duration'], options['operations'], options['seed']
+        )
+        
+        self.stdout.write(f"{'작업':<18}{'건수':>8}{'ops/s':>9}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'오류':>6}")
+        for name, summary in result['operations'].items():
+            self.stdout.write(
+                f"{name:<18}{summary['count']:>8}{summary['throughput_ops']:>9.1f}{summary['p50_ms']:>9.2f}"
+                f"{summary['p95_ms']:>9.2f}{summary['p99_ms']:>9.2f}{summary['errors']:>6}"
+            )
+            if summary['histogram']:
+                self.stdout.write('    ' + ' '.join(f"{label}:{count}" for label, count in summary['histogram'].items()))
+        self.stdout.write(f"전체 {result['total_ops']}건, {result['throughput_ops']:.1f} ops/s")
+        for error, count in result['errors'].items():
+            self.stderr.write(f"  {count}× {error}")
+        
+        report = benchmarks.build_report({}, scale)
+        del report['scenarios']
+        report['replay'] = result
+        if options['output']:
+            benchmarks.dump_report(report, options['output'])
+            self.stdout.write(f"결과 저장: {options['output']}")
+        
+        if options['baseline']:
+            with open(options['baseline'], encoding='utf-8') as f:
+                baseline = json.load(f)
+            rows, regressions = workload.compare_reports(report, baseline, options['tolerance'])
+            for name, before_p95, after_p95, before_ops, after_ops in rows:
+                self.stdout.write(
+                    f"  {name:<18} p95 {before_p95:.2f} → {after_p95:.2f}ms, "
+                    f"{before_ops:.1f} → {after_ops:.1f} ops/s"
+                )
+            if regressions:
+                for regression in regressions:
+                    self.stderr.write(f"  {regression}")
+                raise CommandError(f'성능 회귀 {len(regressions)}건')
+            self.stdout.write(self.style.SUCCESS('기준 대비 회귀가 없습니다.'))
+    
+    def report_progress(self, stats):
+        self.stdout.write(
+            f"  초대 {stats['invitations']}건, 활동 {stats['activities']}건, 권한 {stats['permissions']}건"
+        )
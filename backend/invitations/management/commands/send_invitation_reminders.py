@@ -0,0 +1,49 @@
+# invitations/management/commands/send_invitation_reminders.py
+"""
+초대 리마인더 일괄 발송 명령
+사용법: python manage.py send_invitation_reminders --base-url https://example.com --workers 4 --rate 10
+
+로컬 테스트: python -m aiosmtpd -n -l localhost:1025 실행 후
+            --smtp-host localhost --smtp-port 1025 지정
+"""
+
+from django.core.management.base import BaseCommand
+
+from invitations.reminders import DEFAULT_REMINDER_BATCH_SIZE, send_due_reminders
+
+
+class Command(BaseCommand):
+    help = '리마인더 발송 대상 초대에 리마인더 이메일을 일괄 발송합니다'
+    
+    def add_arguments(self, parser):
+        parser.add_argument('--base-url', default='', help='수락 URL 기본 주소')
+        parser.add_argument('--batch-size', type=int, default=DEFAULT_REMINDER_BATCH_SIZE,
+                            help='배치당 조회 건수')
+        parser.add_argument('--workers', type=int, default=4, help='발송 워커 수')
+        parser.add_argument('--rate', type=float, default=10.0, help='초당 최대 발송 수 (0: 제한 없음)')
+        parser.add_argument('--smtp-host', default=None, help='SMTP 호스트 (기본: EMAIL_HOST 설정)')
+        parser.add_argument('--smtp-port', type=int, default=None, help='SMTP 포트 (기본: EMAIL_PORT 설정)')
+    
+    def handle(self, *args, **options):
+        connection_kwargs = {}
+        if options['smtp_host'] or options['smtp_port']:
+            connection_kwargs = {
+                'backend': 'django.core.mail.backends.smtp.EmailBackend',
+                'host': options['smtp_host'] or 'localhost',
+                'port': options['smtp_port'] or 25,
+                'use_tls': False,
+                'use_ssl': False
+            }
+        
+        stats = send_due_reminders(
+            base_url=options['base_url'],
+            batch_size=options['batch_size'],
+            workers=options['workers'],
+            rate_limit=options['rate'],
+            connection_kwargs=connection_kwargs
+        )
+        
+        self.stdout.write(self.style.SUCCESS(
+            f"리마인더 발송: 대상 {stats['eligible']}건, 성공 {stats['sent']}건, "
+            f"실패 {stats['failed']}건 ({stats['elapsed']:.2f}초)"
+        ))
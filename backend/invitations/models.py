@@ -6,17 +6,171 @@ AHP 평가 초대 시스템 Django 모델
 """
 
 import uuid
+import hmac
 import secrets
 import hashlib
 from datetime import timedelta
-from django.db import models
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connections, models, router, transaction
 from django.contrib.auth import get_user_model
 from django.utils import timezone
 from django.contrib.postgres.fields import JSONField
+from django.core.exceptions import ValidationError
 from django.core.validators import EmailValidator, MinValueValidator, MaxValueValidator
 
+from .bulk_copy import write_instances
+from .cache import get_token_negative_cache
+from .routers import read_from
+
 User = get_user_model()
 
+# 초대 기본 유효 기간
+DEFAULT_INVITATION_TTL = timedelta(days=7)
+
+# 대량 초대 시 bulk_create 청크 크기
+BULK_INVITE_BATCH_SIZE = 500
+
+# 프로젝트/상태별 카운터 샤드 수 (동시 상태 전이 시 같은 행 경합 방지)
+STATUS_COUNTER_SHARDS = 8
+
+
+# 세부 권한 비트 (ParticipantPermission.permission_bits)
+CAN_VIEW_PROJECT = 1 << 0
+CAN_VIEW_CRITERIA = 1 << 1
+CAN_VIEW_EVALUATIONS = 1 << 2
+CAN_VIEW_RESULTS = 1 << 3
+CAN_CREATE_EVALUATION = 1 << 4
+CAN_EDIT_OWN_EVALUATION = 1 << 5
+CAN_EDIT_ALL_EVALUATIONS = 1 << 6
+CAN_MANAGE_CRITERIA = 1 << 7
+CAN_INVITE_OTHERS = 1 << 8
+CAN_EXPORT_DATA = 1 << 9
+CAN_DELETE_PROJECT = 1 << 10
+
+PERMISSION_BITS = {
+    'can_view_project': CAN_VIEW_PROJECT,
+    'can_view_criteria': CAN_VIEW_CRITERIA,
+    'can_view_evaluations': CAN_VIEW_EVALUATIONS,
+    'can_view_results': CAN_VIEW_RESULTS,
+    'can_create_evaluation': CAN_CREATE_EVALUATION,
+    'can_edit_own_evaluation': CAN_EDIT_OWN_EVALUATION,
+    'can_edit_all_evaluations': CAN_EDIT_ALL_EVALUATIONS,
+    'can_manage_criteria': CAN_MANAGE_CRITERIA,
+    'can_invite_others': CAN_INVITE_OTHERS,
+    'can_export_data': CAN_EXPORT_DATA,
+    'can_delete_project': CAN_DELETE_PROJECT
+}
+
+
+def permissions_to_bits(permissions):
+    """권한 딕셔너리를 비트마스크로 변환"""
+    bits = 0
+    for field, bit in PERMISSION_BITS.items():
+        if permissions.get(field):
+            bits |= bit
+    return bits
+
+
+def bits_to_permissions(bits):
+    """비트마스크를 권한 딕셔너리로 변환"""
+    return {field: bool(bits & bit) for field, bit in PERMISSION_BITS.items()}
+
+
+# 역할별 기본 권한 (같은 이름의 PermissionTemplate 이 있으면 지정한 키만 덮어씀)
+ROLE_PERMISSIONS = {
+    'owner': {
+        'role_priority': 0,
+        'can_view_project': True,
+        'can_view_criteria': True,
+        'can_view_evaluations': True,
+        'can_view_results': True,
+        'can_create_evaluation': True,
+        'can_edit_own_evaluation': True,
+        'can_edit_all_evaluations': True,
+        'can_manage_criteria': True,
+        'can_invite_others': True,
+        'can_export_data': True,
+        'can_delete_project': True
+    },
+    'admin': {
+        'role_priority': 10,
+        'can_view_project': True,
+        'can_view_criteria': True,
+        'can_view_evaluations': True,
+        'can_view_results': True,
+        'can_create_evaluation': True,
+        'can_edit_own_evaluation': True,
+        'can_edit_all_evaluations': True,
+        'can_manage_criteria': True,
+        'can_invite_others': True,
+        'can_export_data': True,
+        'can_delete_project': False
+    },
+    'evaluator': {
+        'role_priority': 50,
+        'can_view_project': True,
+        'can_view_criteria': True,
+        'can_view_evaluations': False,
+        'can_view_results': False,
+        'can_create_evaluation': True,
+        'can_edit_own_evaluation': True,
+        'can_edit_all_evaluations': False,
+        'can_manage_criteria': False,
+        'can_invite_others': False,
+        'can_export_data': False,
+        'can_delete_project': False
+    },
+    'viewer': {
+        'role_priority': 100,
+        'can_view_project': True,
+        'can_view_criteria': True,
+        'can_view_evaluations': True,
+        'can_view_results': True,
+        'can_create_evaluation': False,
+        'can_edit_own_evaluation': False,
+        'can_edit_all_evaluations': False,
+        'can_manage_criteria': False,
+        'can_invite_others': False,
+        'can_export_data': True,
+        'can_delete_project': False
+    }
+}
+
+# 역할 일괄 부여 시 충돌 행에서 갱신할 필드 (invitation 은 연결할 초대를 찾은 경우만)
+ROLE_UPSERT_FIELDS = [
+    'role', 'role_priority', *PERMISSION_BITS, 'permission_bits',
+    'assigned_by', 'updated_at'
+]
+
+# 역할 일괄 부여 시 bulk_create 청크 크기
+BULK_ASSIGN_BATCH_SIZE = 500
+
+
+def normalize_email(email):
+    """이메일 정규화 (대소문자/공백 차이를 같은 주소로 취급)"""
+    return (email or '').strip().lower()
+
+
+def hash_invitation_token(token):
+    """초대 토큰 해시"""
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+def mint_invitation_token():
+    """초대 토큰과 토큰 해시 생성"""
+    token = secrets.token_urlsafe(32)
+    return token, hash_invitation_token(token)
+
+
+def store_plaintext_tokens():
+    """평문 토큰 컬럼 저장 여부 (settings.INVITATIONS_STORE_PLAINTEXT_TOKEN, 기본 True)
+    
+    False 면 token_hash 만 저장하고 평문 토큰은 생성 직후 인스턴스(raw_token)에만 남는다.
+    이 경우 리마인더 발송 시 새 토큰이 재발급된다.
+    """
+    return getattr(settings, 'INVITATIONS_STORE_PLAINTEXT_TOKEN', True)
+
 
 class PermissionTemplate(models.Model):
     """사전 정의된 권한 템플릿"""
@@ -41,6 +195,186 @@ class PermissionTemplate(models.Model):
         return f"{self.name} ({'System' if self.is_system else 'Custom'})"
 
 
+class EvaluationInvitationQuerySet(models.QuerySet):
+    """평가 초대 쿼리셋"""
+    
+    def with_related(self):
+        """__str__ 및 상세 화면에서 참조하는 연관 객체 함께 조회"""
+        return self.select_related('project', 'inviter')
+    
+    def for_listing(self):
+        """목록 화면용 (필요한 컬럼만 조회)"""
+        return self.select_related('project').only(
+            'id', 'project', 'project__name', 'invitee_email', 'invitee_name',
+            'role', 'status', 'expires_at', 'reminder_count', 'created_at'
+        )
+    
+    def reminder_eligible(self, now=None):
+        """리마인더 발송 대상 (send_reminder 와 동일한 규칙을 SQL 로 평가)"""
+        now = now or timezone.now()
+        return self.filter(
+            status='pending',
+            reminder_count__lt=self.model.MAX_REMINDERS,
+            expires_at__gte=now
+        ).filter(
+            models.Q(last_reminder_at__isnull=True) |
+            models.Q(last_reminder_at__lte=now - self.model.REMINDER_INTERVAL)
+        )
+    
+    def inbox_for(self, email, now=None):
+        """이메일 주소로 받은 전체 프로젝트의 수락 가능한 초대 (초대함)
+        
+        정규화 이메일 + created_at, id 부분 인덱스(invitation_inbox_idx) 한 번으로 조회하며
+        keyset_paginate(field='created_at') 와 함께 사용한다.
+        """
+        normalized = normalize_email(email)
+        if not normalized:
+            return self.none()
+        now = now or timezone.now()
+        return self.filter(
+            invitee_email_normalized=normalized,
+            status='pending',
+            expires_at__gt=now
+        ).select_related('project').only(
+            'id', 'project', 'project__name', 'inviter', 'invitee_email', 'invitee_name',
+            'role', 'custom_message', 'status', 'expires_at', 'created_at'
+        )
+
+
+class EvaluationInvitationManager(models.Manager):
+    """평가 초대 매니저"""
+    
+    def bulk_invite(self, project, invitees, role='evaluator', inviter=None,
+                    custom_message='', permissions=None, expires_at=None,
+                    batch_size=BULK_INVITE_BATCH_SIZE, seen=None):
+        """대량 초대 생성
+        
+        invitees 는 이메일 문자열 또는 (email, name) 튜플의 목록.
+        기존 대기중 초대는 batch_size 청크마다 해당 이메일만 한 번의 쿼리로 확인하고,
+        초대와 'created' 활동 로그를 하나의 트랜잭션 안에서 청크 단위 bulk_create 로 삽입한다.
+        입력 순서대로 {'email', 'status', 'invitation'} 결과 목록을 반환하며
+        status 는 'created', 'skipped_duplicate', 'invalid_email' 중 하나.
+        이메일 중복은 정규화 주소(normalize_email) 기준으로 판단하며,
+        여러 번 나눠 호출할 때 같은 seen 집합을 넘기면 호출 간 중복도 제거된다.
+        """
+        # 필드 자체 검증기 (EmailValidator + max_length) 로 확인해 삽입 단계 실패를 막음
+        email_field = self.model._meta.get_field('invitee_email')
+        # 대기중 중복 확인과 삽입 모두 주 DB 에서 (복제본 라우팅 시 복제 지연 회피)
+        using = self._db or router.db_for_write(self.model)
+        now = timezone.now()
+        expires_at = expires_at or now + DEFAULT_INVITATION_TTL
+        permissions = permissions or {}
+        store_token = store_plaintext_tokens()
+        
+        results = []
+        candidates = []
+        seen = set() if seen is None else seen
+        for invitee in invitees:
+            if isinstance(invitee, str):
+                email, name = invitee, ''
+            else:
+                email, name = invitee[0], invitee[1] or ''
+            email = (email or '').strip()
+            
+            try:
+                if not email:
+                    raise ValidationError('이메일이 비어 있습니다')
+                email_field.run_validators(email)
+            except ValidationError:
+                results.append({'email': email, 'status': 'invalid_email', 'invitation': None})
+                continue
+            
+            normalized = normalize_email(email)
+            if normalized in seen:
+                results.append({'email': email, 'status': 'skipped_duplicate', 'invitation': None})
+                continue
+            seen.add(normalized)
+            
+            result = {'email': email, 'status': 'created', 'invitation': None}
+            results.append(result)
+            candidates.append((result, normalized, name))
+        
+        invitations = []
+        for start in range(0, len(candidates), batch_size):
+            chunk = candidates[start:start + batch_size]
+            # 청크 이메일 중 이미 대기중인 초대 (unique_pending_invitation_per_project 사전 확인)
+            pending = set(
+                self.db_manager(using).filter(project=project, status='pending',
+                            invitee_email_normalized__in=[normalized for _, normalized, _ in chunk])
+                .values_list('invitee_email_normalized', flat=True)
+            )
+            for result, normalized, name in chunk:
+                if normalized in pending:
+                    result['status'] = 'skipped_duplicate'
+                    continue
+                
+                token, token_hash = mint_invitation_token()
+                invitation = self.model(
+                    project=project,
+                    inviter=inviter,
+                    invitee_email=result['email'],
+                    invitee_email_normalized=normalized,
+                    invitee_name=name[:100],
+                    token=token if store_token else None,
+                    token_hash=token_hash,
+                    role=role,
+                    custom_message=custom_message,
+                    permissions=permissions,
+                    expires_at=expires_at,
+                    created_at=now
+                )
+                invitation.raw_token = token
+                invitations.append(invitation)
+                result['invitation'] = invitation
+        
+        with transaction.atomic(using=using):
+            for start in range(0, len(invitations), batch_size):
+                chunk = invitations[start:start + batch_size]
+                # PostgreSQL 은 COPY 로 삽입 (created_at 은 위에서 직접 설정)
+                write_instances(self.model, chunk, using=using)
+                for invitation in chunk:
+                    invitation._loaded_status = invitation.status
+                write_instances(InvitationActivity, [
+                    InvitationActivity(
+                        invitation=invitation,
+                        action='created',
+                        actor=inviter,
+                        metadata={'bulk': True},
+                        created_at=now
+                    )
+                    for invitation in chunk
+                ], using=using)
+            adjust_status_counters(project.pk, {'pending': len(invitations)}, using=using)
+        
+        return results
+    
+    def get_acceptable_by_token(self, raw_token):
+        """토큰으로 수락 가능한 초대 조회
+        
+        토큰을 해시해 token_hash 고유 인덱스만 조회하고 상수 시간 비교한다.
+        없거나 수락할 수 없는(처리됨/만료) 토큰은 부정 캐시에 기록해
+        같은 링크가 반복 요청되어도 DB 에 닿지 않게 한다.
+        """
+        if not raw_token:
+            return None
+        token_hash = hash_invitation_token(raw_token)
+        negative_cache = get_token_negative_cache()
+        if negative_cache.get(token_hash):
+            return None
+        
+        # 복제 지연으로 방금 만든 초대를 못 찾아 부정 캐시에 남기지 않도록 주 DB 에서 조회
+        with read_from('primary'):
+            invitation = self.filter(token_hash=token_hash).first()
+        if (invitation is None
+                or not hmac.compare_digest(invitation.token_hash, token_hash)
+                or not invitation.can_accept()):
+            negative_cache.set(token_hash, True)
+            return None
+        
+        invitation.raw_token = raw_token
+        return invitation
+
+
 class EvaluationInvitation(models.Model):
     """평가 초대 모델"""
     
@@ -49,9 +383,17 @@ class EvaluationInvitation(models.Model):
         ('accepted', '수락됨'),
         ('rejected', '거절됨'),
         ('expired', '만료됨'),
-        ('revoked', '철회됨')
+        ('revoked', '철회됨'),
+        ('pooled', '발급 대기')  # 미리 발급해 둔 풀 토큰 (invitations/pool.py)
     ]
     
+    # 상태 전이 시 기록할 타임스탬프 필드
+    STATUS_TIMESTAMP_FIELDS = {
+        'accepted': 'accepted_at',
+        'rejected': 'rejected_at',
+        'revoked': 'revoked_at'
+    }
+    
     ROLE_CHOICES = [
         ('owner', '소유자'),
         ('admin', '관리자'),
@@ -74,11 +416,13 @@ class EvaluationInvitation(models.Model):
     
     # 초대 대상 정보
     invitee_email = models.EmailField(validators=[EmailValidator()])
+    invitee_email_normalized = models.CharField(max_length=254, editable=False)  # save 에서 설정
     invitee_name = models.CharField(max_length=100, blank=True)
     
     # 토큰 관련
-    token = models.CharField(max_length=512, unique=True)
-    token_hash = models.CharField(max_length=256, db_index=True)
+    # 평문 토큰은 선택 저장 (store_plaintext_tokens), 조회는 token_hash 로만
+    token = models.CharField(max_length=512, null=True, blank=True)
+    token_hash = models.CharField(max_length=64, unique=True)
     
     # 역할 및 권한
     role = models.CharField(max_length=50, choices=ROLE_CHOICES, default='evaluator')
@@ -99,20 +443,31 @@ class EvaluationInvitation(models.Model):
     rejected_at = models.DateTimeField(null=True, blank=True)
     revoked_at = models.DateTimeField(null=True, blank=True)
     
+    # 리마인더 발송 규칙
+    MAX_REMINDERS = 3
+    REMINDER_INTERVAL = timedelta(hours=24)
+    
+    objects = EvaluationInvitationManager.from_queryset(EvaluationInvitationQuerySet)()
+    
     class Meta:
         db_table = 'evaluation_invitations'
         ordering = ['-created_at']
         indexes = [
-            models.Index(fields=['token_hash']),
             models.Index(fields=['project', 'status']),
-            models.Index(fields=['invitee_email']),
+            # 초대함(inbox_for): 정규화 이메일의 대기 초대를 최신순 키셋 조회
+            models.Index(
+                fields=['invitee_email_normalized', '-created_at', '-id'],
+                condition=models.Q(status='pending'),
+                name='invitation_inbox_idx'
+            ),
             models.Index(fields=['expires_at']),
             models.Index(fields=['status', 'expires_at'])
         ]
         constraints = [
             models.UniqueConstraint(
-                fields=['project', 'invitee_email'],
-                condition=models.Q(status='pending'),
+                fields=['project', 'invitee_email_normalized'],
+                # 이메일 없는 익명(QR) 초대는 여러 개 허용
+                condition=models.Q(status='pending') & ~models.Q(invitee_email_normalized=''),
                 name='unique_pending_invitation_per_project'
             )
         ]
@@ -120,36 +475,107 @@ class EvaluationInvitation(models.Model):
     def __str__(self):
         return f"Invitation to {self.invitee_email} for {self.project.name}"
     
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """DB 로드 시 상태 스냅샷 저장"""
+        instance = super().from_db(db, field_names, values)
+        # 지연 로딩된 경우 None
+        instance._loaded_status = instance.__dict__.get('status')
+        return instance
+    
+    def refresh_from_db(self, using=None, fields=None, **kwargs):
+        """다시 읽은 status 로 스냅샷 갱신 (지연 로딩된 status 접근 포함)"""
+        super().refresh_from_db(using=using, fields=fields, **kwargs)
+        if fields is None or 'status' in fields:
+            self._loaded_status = self.__dict__.get('status')
+    
     def save(self, *args, **kwargs):
         """저장 시 자동 처리"""
+        counter_deltas = {}
         
-        # 새 객체인 경우
-        if not self.pk:
-            # 토큰 생성
-            if not self.token:
-                self.token = secrets.token_urlsafe(32)
+        self.invitee_email_normalized = normalize_email(self.invitee_email)
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and 'invitee_email' in update_fields:
+            kwargs['update_fields'] = {*update_fields, 'invitee_email_normalized'}
+        
+        # 새 객체인 경우 (UUID 기본값으로 pk 가 항상 있으므로 _state.adding 으로 판단)
+        adding = self._state.adding
+        if adding:
+            counter_deltas = {self.status: 1}
             
-            # 토큰 해시 생성
-            if not self.token_hash:
-                self.token_hash = hashlib.sha256(self.token.encode()).hexdigest()
+            # 토큰 생성
+            if self.token:
+                self.raw_token = self.token
+                self.token_hash = self.token_hash or hash_invitation_token(self.token)
+                if not store_plaintext_tokens():
+                    self.token = None
+            elif not self.token_hash:
+                self.issue_token()
             
             # 만료 시간 설정 (기본 7일)
             if not self.expires_at:
-                self.expires_at = timezone.now() + timedelta(days=7)
+                self.expires_at = timezone.now() + DEFAULT_INVITATION_TTL
+        
+        # 상태 카운터는 같은 트랜잭션에서 갱신
+        using = kwargs.get('using') or router.db_for_write(type(self), instance=self)
+        with transaction.atomic(using=using):
+            # 상태 변경 시 타임스탬프/카운터 갱신 (로드 시점 스냅샷과 같으면 추가 쿼리 없음)
+            update_fields = kwargs.get('update_fields')
+            status_saved = 'status' in self.__dict__ and (update_fields is None or 'status' in update_fields)
+            if not adding and status_saved and getattr(self, '_loaded_status', None) != self.status:
+                # 행을 잠그고 실제 현재 상태와 비교 (스냅샷이 없거나, 같은 상태에서 출발한
+                # 동시 저장이 카운터를 두 번 반영하지 않도록)
+                timestamp_fields = list(self.STATUS_TIMESTAMP_FIELDS.values())
+                row = (
+                    type(self)._default_manager.db_manager(using)
+                    .select_for_update().filter(pk=self.pk)
+                    .values_list('status', *timestamp_fields).first()
+                )
+                timestamp_field = self.STATUS_TIMESTAMP_FIELDS.get(self.status)
+                if row is not None and row[0] != self.status:
+                    counter_deltas = {row[0]: -1, self.status: 1}
+                    if timestamp_field:
+                        setattr(self, timestamp_field, timezone.now())
+                elif row is not None and timestamp_field:
+                    # 다른 저장/전이가 먼저 같은 상태로 바꿈, 그 시각을 유지
+                    setattr(self, timestamp_field, row[1 + timestamp_fields.index(timestamp_field)])
+                if timestamp_field and update_fields is not None:
+                    kwargs['update_fields'] = {*kwargs['update_fields'], timestamp_field}
+            
+            super().save(*args, **kwargs)
+            adjust_status_counters(self.project_id, counter_deltas, using=using)
+        if 'status' in self.__dict__:
+            self._loaded_status = self.status
+    
+    def transition_to(self, status, expected_status='pending'):
+        """조건부 UPDATE 로 상태 전이
         
-        # 상태 변경 시 타임스탬프 업데이트
-        if self.pk:
-            old_instance = EvaluationInvitation.objects.filter(pk=self.pk).first()
-            if old_instance:
-                if old_instance.status != self.status:
-                    if self.status == 'accepted':
-                        self.accepted_at = timezone.now()
-                    elif self.status == 'rejected':
-                        self.rejected_at = timezone.now()
-                    elif self.status == 'revoked':
-                        self.revoked_at = timezone.now()
+        expected_status 상태인 행만 갱신하므로 동시에 수락/거절이 들어와도
+        하나만 성공한다. 수락은 만료 전인 경우에만 허용. 성공 여부를 반환한다.
+        """
+        now = timezone.now()
+        changes = {'status': status}
+        timestamp_field = self.STATUS_TIMESTAMP_FIELDS.get(status)
+        if timestamp_field:
+            changes[timestamp_field] = now
         
-        super().save(*args, **kwargs)
+        using = router.db_for_write(type(self), instance=self)
+        queryset = type(self)._default_manager.db_manager(using).filter(
+            pk=self.pk,
+            status=expected_status
+        )
+        if status == 'accepted':
+            queryset = queryset.filter(expires_at__gt=now)
+        
+        with transaction.atomic(using=queryset.db):
+            if not queryset.update(**changes):
+                return False
+            adjust_status_counters(self.project_id, {expected_status: -1, status: 1}, using=queryset.db)
+        
+        for field, value in changes.items():
+            setattr(self, field, value)
+        self._loaded_status = status
+        return True
     
     def is_expired(self):
         """만료 여부 확인"""
@@ -161,20 +587,162 @@ class EvaluationInvitation(models.Model):
     
     def send_reminder(self):
         """리마인더 발송 가능 여부"""
-        if self.status != 'pending' or self.reminder_count >= 3:
+        if not self.can_accept() or self.reminder_count >= self.MAX_REMINDERS:
             return False
         
         if self.last_reminder_at:
             # 마지막 리마인더로부터 최소 24시간 경과
             time_since_last = timezone.now() - self.last_reminder_at
-            if time_since_last < timedelta(hours=24):
+            if time_since_last < self.REMINDER_INTERVAL:
                 return False
         
         return True
     
+    def issue_token(self):
+        """새 토큰 발급 (저장은 호출자가 수행)"""
+        self.raw_token, self.token_hash = mint_invitation_token()
+        self.token = self.raw_token if store_plaintext_tokens() else None
+        return self.raw_token
+    
+    def get_effective_permissions(self):
+        """역할 템플릿에 권한 JSON 재정의를 적용한 (permission_bits, role_priority)"""
+        from .permission_registry import get_permission_registry
+        return get_permission_registry().resolve_invitation(self)
+    
     def get_accept_url(self, base_url=''):
         """수락 URL 생성"""
-        return f"{base_url}/invitations/accept?token={self.token}"
+        token = self.token or getattr(self, 'raw_token', None)
+        if not token:
+            raise ValueError('평문 토큰이 저장되지 않은 초대입니다. issue_token() 으로 재발급하세요.')
+        return f"{base_url}/invitations/accept?token={token}"
+
+
+class InvitationStatusCounterQuerySet(models.QuerySet):
+    """초대 상태 카운터 쿼리셋"""
+    
+    def for_project(self, project):
+        """프로젝트의 상태별 초대 수 (샤드 합계)"""
+        counts = {status: 0 for status, _ in EvaluationInvitation.STATUS_CHOICES}
+        rows = (
+            self.filter(project=project)
+            .values('status')
+            .annotate(total=models.Sum('count'))
+            .values_list('status', 'total')
+        )
+        counts.update(rows)
+        return counts
+
+
+class InvitationStatusCounter(models.Model):
+    """프로젝트/상태별 초대 수 (상태 전이와 같은 트랜잭션에서 증분 갱신)
+    
+    같은 프로젝트의 동시 전이가 한 행에 몰리지 않도록 STATUS_COUNTER_SHARDS 개
+    샤드로 나누어 저장하고 조회 시 합산한다.
+    """
+    
+    project = models.ForeignKey(
+        'projects.Project',
+        on_delete=models.CASCADE,
+        related_name='invitation_status_counters'
+    )
+    status = models.CharField(max_length=50, choices=EvaluationInvitation.STATUS_CHOICES)
+    shard = models.SmallIntegerField(default=0)
+    count = models.IntegerField(default=0)
+    
+    objects = InvitationStatusCounterQuerySet.as_manager()
+    
+    class Meta:
+        db_table = 'invitation_status_counters'
+        constraints = [
+            models.UniqueConstraint(
+                fields=['project', 'status', 'shard'],
+                name='unique_invitation_status_counter_shard'
+            )
+        ]
+    
+    def __str__(self):
+        return f"{self.project_id} {self.status}[{self.shard}] = {self.count}"
+
+
+# 카운터 샤드 증가 (PostgreSQL/SQLite 3.24+ 의 ON CONFLICT)
+COUNTER_UPSERT_SQL = (
+    f'INSERT INTO "{InvitationStatusCounter._meta.db_table}" (project_id, status, shard, count) '
+    f'VALUES (%s, %s, %s, %s) '
+    f'ON CONFLICT (project_id, status, shard) DO UPDATE SET '
+    f'count = "{InvitationStatusCounter._meta.db_table}".count + EXCLUDED.count'
+)
+
+
+def adjust_status_counters(project_id, deltas, using=None):
+    """프로젝트 상태 카운터 증감 (deltas: {status: delta})
+    
+    호출자의 트랜잭션 안에서 상태마다 한 문장으로 무작위 샤드 한 행을 갱신한다 (샤드 값은
+    음수일 수 있고 합계만 의미가 있다). 증가는 INSERT ... ON CONFLICT DO UPDATE 로 샤드 행을
+    만들거나 더하고, 감소는 같은 샤드가 없으면 기존 샤드 중 하나에 반영하며 기존 행이
+    전혀 없으면 무시한다 (reconcile_invitation_counters 로 보정).
+    """
+    using = using or router.db_for_write(InvitationStatusCounter)
+    manager = InvitationStatusCounter.objects.db_manager(using)
+    shard = secrets.randbelow(STATUS_COUNTER_SHARDS)
+    for status, delta in deltas.items():
+        if not delta:
+            continue
+        if delta < 0:
+            # 프로젝트 삭제 중일 수 있으므로 새 행을 만들지 않음
+            target = (
+                manager.filter(project_id=project_id, status=status)
+                .order_by(models.Case(models.When(shard=shard, then=0), default=1))
+                .values('pk')[:1]
+            )
+            manager.filter(pk=models.Subquery(target)).update(count=models.F('count') + delta)
+            continue
+        
+        with connections[using].cursor() as cursor:
+            cursor.execute(COUNTER_UPSERT_SQL, [project_id, status, shard, delta])
+
+
+class ParticipantPermissionQuerySet(models.QuerySet):
+    """참여자 권한 쿼리셋"""
+    
+    def with_related(self):
+        """__str__ 및 상세 화면에서 참조하는 연관 객체 함께 조회"""
+        return self.select_related('user', 'project', 'assigned_by')
+    
+    def for_listing(self):
+        """목록 화면용 (필요한 컬럼만 조회)"""
+        return self.select_related('user', 'project').only(
+            'id', 'user', 'user__email', 'project', 'project__name',
+            'role', 'role_priority', 'permission_bits', 'expires_at', 'created_at'
+        )
+    
+    def with_permissions(self, mask):
+        """mask 의 모든 권한을 가진 행 (단일 비트 연산 조건)"""
+        return self.alias(
+            granted_bits=models.F('permission_bits').bitand(mask)
+        ).filter(granted_bits=mask)
+    
+    def active(self, now=None):
+        """만료되지 않은 권한 (expires_at 을 SQL 에서 평가)"""
+        now = now or timezone.now()
+        return self.filter(models.Q(expires_at__isnull=True) | models.Q(expires_at__gt=now))
+    
+    def granting(self, permission):
+        """권한 이름 또는 비트마스크를 모두 가진 활성 권한"""
+        mask = PERMISSION_BITS[permission] if isinstance(permission, str) else permission
+        return self.active().with_permissions(mask)
+    
+    def projects_for(self, user, permission, after=None, limit=100):
+        """사용자가 권한을 가진 프로젝트 id 목록 (project_id 키셋 페이지)
+        
+        (ids, next_after) 를 반환하며 마지막 페이지면 next_after 는 None.
+        """
+        queryset = self.filter(user=user).granting(permission)
+        if after is not None:
+            queryset = queryset.filter(project_id__gt=after)
+        ids = list(queryset.order_by('project_id').values_list('project_id', flat=True)[:limit + 1])
+        if len(ids) <= limit:
+            return ids, None
+        return ids[:limit], ids[limit - 1]
 
 
 class ParticipantPermission(models.Model):
@@ -198,6 +766,14 @@ class ParticipantPermission(models.Model):
         blank=True,
         related_name='resulting_permission'
     )
+    # 초대가 보관 테이블로 옮겨진 경우의 참조 (invitation 은 NULL 이 된다)
+    archived_invitation = models.ForeignKey(
+        'ArchivedInvitation',
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='resulting_permission'
+    )
     
     # 역할 정의
     role = models.CharField(max_length=50, default='evaluator')
@@ -216,6 +792,11 @@ class ParticipantPermission(models.Model):
     can_export_data = models.BooleanField(default=False)
     can_delete_project = models.BooleanField(default=False)
     
+    # 세부 권한 비트마스크 (저장 시 위 필드들로부터 계산)
+    permission_bits = models.IntegerField(
+        default=CAN_VIEW_PROJECT | CAN_VIEW_CRITERIA | CAN_VIEW_EVALUATIONS
+    )
+    
     # 메타데이터
     assigned_by = models.ForeignKey(
         User,
@@ -228,6 +809,8 @@ class ParticipantPermission(models.Model):
     updated_at = models.DateTimeField(auto_now=True)
     expires_at = models.DateTimeField(null=True, blank=True)
     
+    objects = ParticipantPermissionQuerySet.as_manager()
+    
     class Meta:
         db_table = 'participant_permissions'
         ordering = ['role_priority', 'created_at']
@@ -235,12 +818,36 @@ class ParticipantPermission(models.Model):
         indexes = [
             models.Index(fields=['user', 'project']),
             models.Index(fields=['project', 'role']),
-            models.Index(fields=['expires_at'])
+            models.Index(fields=['project', 'permission_bits']),
+            models.Index(fields=['expires_at']),
+            # 활성 권한 조회용 부분/커버링 인덱스 (include 는 PostgreSQL 에서만 적용)
+            models.Index(
+                fields=['user', 'project'],
+                include=['permission_bits'],
+                condition=models.Q(expires_at__isnull=True),
+                name='perm_user_project_noexp_idx'
+            ),
+            models.Index(
+                fields=['user', 'expires_at'],
+                include=['project', 'permission_bits'],
+                condition=models.Q(expires_at__isnull=False),
+                name='perm_user_expiring_idx'
+            )
         ]
     
     def __str__(self):
         return f"{self.user.email} - {self.role} in {self.project.name}"
     
+    def save(self, *args, **kwargs):
+        """저장 시 권한 비트마스크 동기화"""
+        self.permission_bits = permissions_to_bits(
+            {field: getattr(self, field) for field in PERMISSION_BITS}
+        )
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None:
+            kwargs['update_fields'] = {*update_fields, 'permission_bits'}
+        super().save(*args, **kwargs)
+    
     def is_expired(self):
         """권한 만료 여부"""
         if not self.expires_at:
@@ -251,82 +858,21 @@ class ParticipantPermission(models.Model):
         """특정 권한 확인"""
         if self.is_expired():
             return False
-        return getattr(self, permission_name, False)
+        bit = PERMISSION_BITS.get(permission_name)
+        if bit is None:
+            return getattr(self, permission_name, False)
+        return bool(self.permission_bits & bit)
     
     def get_all_permissions(self):
         """모든 권한 딕셔너리로 반환"""
-        permission_fields = [
-            'can_view_project', 'can_view_criteria', 'can_view_evaluations',
-            'can_view_results', 'can_create_evaluation', 'can_edit_own_evaluation',
-            'can_edit_all_evaluations', 'can_manage_criteria', 'can_invite_others',
-            'can_export_data', 'can_delete_project'
-        ]
-        return {field: getattr(self, field) for field in permission_fields}
+        return bits_to_permissions(self.permission_bits)
     
     @classmethod
     def create_from_role(cls, user, project, role, assigned_by=None):
         """역할 기반 권한 생성"""
         
-        ROLE_PERMISSIONS = {
-            'owner': {
-                'role_priority': 0,
-                'can_view_project': True,
-                'can_view_criteria': True,
-                'can_view_evaluations': True,
-                'can_view_results': True,
-                'can_create_evaluation': True,
-                'can_edit_own_evaluation': True,
-                'can_edit_all_evaluations': True,
-                'can_manage_criteria': True,
-                'can_invite_others': True,
-                'can_export_data': True,
-                'can_delete_project': True
-            },
-            'admin': {
-                'role_priority': 10,
-                'can_view_project': True,
-                'can_view_criteria': True,
-                'can_view_evaluations': True,
-                'can_view_results': True,
-                'can_create_evaluation': True,
-                'can_edit_own_evaluation': True,
-                'can_edit_all_evaluations': True,
-                'can_manage_criteria': True,
-                'can_invite_others': True,
-                'can_export_data': True,
-                'can_delete_project': False
-            },
-            'evaluator': {
-                'role_priority': 50,
-                'can_view_project': True,
-                'can_view_criteria': True,
-                'can_view_evaluations': False,
-                'can_view_results': False,
-                'can_create_evaluation': True,
-                'can_edit_own_evaluation': True,
-                'can_edit_all_evaluations': False,
-                'can_manage_criteria': False,
-                'can_invite_others': False,
-                'can_export_data': False,
-                'can_delete_project': False
-            },
-            'viewer': {
-                'role_priority': 100,
-                'can_view_project': True,
-                'can_view_criteria': True,
-                'can_view_evaluations': True,
-                'can_view_results': True,
-                'can_create_evaluation': False,
-                'can_edit_own_evaluation': False,
-                'can_edit_all_evaluations': False,
-                'can_manage_criteria': False,
-                'can_invite_others': False,
-                'can_export_data': True,
-                'can_delete_project': False
-            }
-        }
-        
-        permissions = ROLE_PERMISSIONS.get(role, ROLE_PERMISSIONS['viewer'])
+        from .permission_registry import get_permission_registry
+        permissions = get_permission_registry().get(role).field_values
         
         return cls.objects.create(
             user=user,
@@ -335,10 +881,94 @@ class ParticipantPermission(models.Model):
             assigned_by=assigned_by,
             **permissions
         )
+    
+    @classmethod
+    def bulk_assign_roles(cls, project, assignments, assigned_by=None, batch_size=BULK_ASSIGN_BATCH_SIZE):
+        """역할 일괄 부여
+        
+        assignments 는 (user, role) 튜플 목록. (user, project) 고유키 기준으로
+        bulk_create(update_conflicts=True) upsert 하며, 같은 이메일로 수락된
+        EvaluationInvitation 이 있으면 invitation 으로 연결한다. 찾지 못하면 기존 행의
+        invitation 은 그대로 둔다 (다른 이메일로 수락했거나 보관된 초대).
+        하나의 트랜잭션 안에서 청크 단위로 처리한다.
+        """
+        from .permission_registry import get_permission_registry
+        registry = get_permission_registry()
+        
+        # 수락된 초대 (정규화 이메일 → 초대 id, 최근 수락 우선)
+        accepted = dict(
+            EvaluationInvitation.objects.filter(project=project, status='accepted')
+            .order_by('accepted_at')
+            .values_list('invitee_email_normalized', 'pk')
+        )
+        
+        # 같은 사용자는 마지막 역할만 반영 (upsert 한 문장에서 같은 행을 두 번 갱신할 수 없음)
+        by_user = {}
+        for user, role in assignments:
+            by_user[user.pk] = cls(
+                user=user,
+                project=project,
+                role=role,
+                assigned_by=assigned_by,
+                invitation_id=accepted.get(normalize_email(user.email)),
+                **registry.get(role).field_values
+            )
+        permissions = list(by_user.values())
+        
+        with transaction.atomic():
+            for start in range(0, len(permissions), batch_size):
+                chunk = permissions[start:start + batch_size]
+                linked = [permission for permission in chunk if permission.invitation_id]
+                unlinked = [permission for permission in chunk if not permission.invitation_id]
+                for group, update_fields in ((linked, [*ROLE_UPSERT_FIELDS, 'invitation']),
+                                             (unlinked, ROLE_UPSERT_FIELDS)):
+                    if group:
+                        cls.objects.bulk_create(
+                            group,
+                            update_conflicts=True,
+                            unique_fields=['user', 'project'],
+                            update_fields=update_fields
+                        )
+            
+            # bulk_create 는 post_save 시그널을 보내지 않으므로 권한 캐시를 직접 무효화
+            transaction.on_commit(lambda: invalidate_permissions(permissions))
+        
+        return permissions
+
+
+def invalidate_permissions(permissions):
+    """권한 캐시 무효화 (시그널 없이 일괄 저장한 경우)"""
+    from .permissions import get_permission_resolver
+    resolver = get_permission_resolver()
+    for permission in permissions:
+        resolver.invalidate(permission.user_id, permission.project_id)
+
+
+class InvitationActivityQuerySet(models.QuerySet):
+    """초대 활동 로그 쿼리셋"""
+    
+    def with_related(self):
+        """__str__ 및 상세 화면에서 참조하는 연관 객체 함께 조회"""
+        return self.select_related('invitation', 'actor')
+    
+    def for_listing(self):
+        """목록 화면용 (필요한 컬럼만 조회)"""
+        return self.select_related('invitation').only(
+            'id', 'invitation', 'invitation__invitee_email', 'invitation__project_id',
+            'action', 'actor_id', 'actor_ip', 'created_at'
+        )
+    
+    def recent(self, days=30):
+        """최근 활동 (created_at 하한으로 최신 파티션만 조회)"""
+        return self.filter(created_at__gte=timezone.now() - timedelta(days=days))
 
 
 class InvitationActivity(models.Model):
-    """초대 활동 로그"""
+    """초대 활동 로그
+    
+    PostgreSQL 에서는 created_at 기준 월별 RANGE 파티션 테이블로 운영한다.
+    (manage_activity_partitions 명령 참고)
+    """
     
     ACTION_CHOICES = [
         ('created', '생성됨'),
@@ -369,6 +999,8 @@ class InvitationActivity(models.Model):
     metadata = models.JSONField(default=dict)
     created_at = models.DateTimeField(auto_now_add=True)
     
+    objects = InvitationActivityQuerySet.as_manager()
+    
     class Meta:
         db_table = 'invitation_activities'
         ordering = ['-created_at']
@@ -379,4 +1011,103 @@ class InvitationActivity(models.Model):
         ]
     
     def __str__(self):
-        return f"{self.action} - {self.invitation.invitee_email} at {self.created_at}"
\ No newline at end of file
+        return f"{self.action} - {self.invitation.invitee_email} at {self.created_at}"
+
+
+class InvitationActivitySummary(models.Model):
+    """보존 기간이 지난 초대 활동 로그의 월별 요약"""
+    
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    invitation = models.ForeignKey(
+        EvaluationInvitation,
+        on_delete=models.CASCADE,
+        related_name='activity_summaries'
+    )
+    action = models.CharField(max_length=50, choices=InvitationActivity.ACTION_CHOICES)
+    month = models.DateField()
+    count = models.IntegerField(default=0)
+    first_at = models.DateTimeField()
+    last_at = models.DateTimeField()
+    
+    class Meta:
+        db_table = 'invitation_activity_summaries'
+        ordering = ['-month']
+        constraints = [
+            models.UniqueConstraint(
+                fields=['invitation', 'action', 'month'],
+                name='unique_activity_summary_per_month'
+            )
+        ]
+    
+    def __str__(self):
+        return f"{self.action} x{self.count} - {self.invitation_id} ({self.month:%Y-%m})"
+
+
+class ArchivedInvitation(models.Model):
+    """종료된 프로젝트의 보관된 초대 (cold storage)
+    
+    원본 행은 payload, 활동 로그/월별 요약은 activities/activity_summaries 에
+    JSON 으로 보관해 evaluation_invitations 와 그 인덱스를 작업 집합 크기로 유지한다.
+    id 는 원본 초대 id 와 같다. (invitations/archive.py 참고)
+    """
+    
+    id = models.UUIDField(primary_key=True, editable=False)
+    project = models.ForeignKey(
+        'projects.Project',
+        on_delete=models.CASCADE,
+        related_name='archived_invitations'
+    )
+    status = models.CharField(max_length=50, choices=EvaluationInvitation.STATUS_CHOICES)
+    created_at = models.DateTimeField()
+    payload = models.JSONField(encoder=DjangoJSONEncoder)
+    activities = models.JSONField(encoder=DjangoJSONEncoder, default=list)
+    activity_summaries = models.JSONField(encoder=DjangoJSONEncoder, default=list)
+    archived_at = models.DateTimeField(auto_now_add=True)
+    
+    class Meta:
+        db_table = 'evaluation_invitations_archive'
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['project', 'status'])
+        ]
+    
+    def __str__(self):
+        return f"Archived invitation to {self.payload.get('invitee_email')} ({self.project_id})"
+    
+    def to_invitation(self):
+        """보관 payload 로 (저장되지 않은) EvaluationInvitation 인스턴스 복원"""
+        invitation = EvaluationInvitation(**{
+            field.attname: field.to_python(self.payload[field.attname])
+            for field in EvaluationInvitation._meta.concrete_fields
+            if field.attname in self.payload
+        })
+        invitation.is_archived = True
+        return invitation
+
+
+class InvitationPool(models.Model):
+    """프로젝트별 미리 발급한 초대 토큰 풀 설정
+    
+    QR/익명 평가자 배정 시 요청 안에서 토큰 생성·INSERT 없이 status='pooled' 행
+    하나를 선점한다. 풀 크기는 상태 카운터의 'pooled' 값이며, 남은 수가 low_water
+    이하로 떨어지면 refill_invitation_pools 가 target_size 까지 일괄 보충한다.
+    """
+    
+    project = models.OneToOneField(
+        'projects.Project',
+        on_delete=models.CASCADE,
+        related_name='invitation_pool'
+    )
+    role = models.CharField(max_length=50, choices=EvaluationInvitation.ROLE_CHOICES, default='evaluator')
+    permissions = models.JSONField(default=dict)
+    target_size = models.PositiveIntegerField(default=500)
+    low_water = models.PositiveIntegerField(default=100)
+    enabled = models.BooleanField(default=True)
+    last_refilled_at = models.DateTimeField(null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    
+    class Meta:
+        db_table = 'invitation_pools'
+    
+    def __str__(self):
+        return f"Invitation pool for {self.project_id} ({self.role}, {self.target_size})"
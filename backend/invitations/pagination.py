@@ -0,0 +1,91 @@
+# invitations/pagination.py
+"""
+대형 테이블 목록 페이지네이션
+"""
+
+import base64
+import json
+from datetime import datetime, timezone as dt_timezone
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.core.paginator import Paginator
+from django.db import connections
+from django.db.models import Q
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from django.utils.functional import cached_property
+
+# 이 건수 이상이면 COUNT(*) 대신 통계 추정치 사용
+ESTIMATED_COUNT_THRESHOLD = 100000
+
+
+class EstimatedCountPaginator(Paginator):
+    """필터 없는 PostgreSQL 대형 테이블은 pg_class.reltuples 추정치로 전체 건수 계산"""
+    
+    @cached_property
+    def count(self):
+        queryset = self.object_list
+        connection = connections[queryset.db]
+        if connection.vendor == 'postgresql' and not queryset.query.where:
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    "SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass",
+                    [queryset.model._meta.db_table]
+                )
+                row = cursor.fetchone()
+            if row and row[0] >= ESTIMATED_COUNT_THRESHOLD:
+                return row[0]
+        return super().count
+
+
+def encode_cursor(value, pk):
+    """키셋 커서 인코딩"""
+    payload = json.dumps([value.isoformat() if hasattr(value, 'isoformat') else value, str(pk)])
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+def decode_cursor(cursor, model=None, field='created_at'):
+    """키셋 커서 디코딩, 잘못된 값이면 None
+    
+    model 을 주면 값과 pk 를 model 의 field/pk 필드 형식으로 검증·변환한다.
+    시간대 없는 datetime 은 UTC 로 간주한다.
+    """
+    try:
+        value, pk = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        if model is not None:
+            value = model._meta.get_field(field).to_python(value)
+            pk = model._meta.pk.to_python(pk)
+        elif isinstance(value, str):
+            value = parse_datetime(value) or value
+    except (ValueError, TypeError, ValidationError):
+        return None
+    if value is None or pk is None:
+        return None
+    if isinstance(value, datetime) and settings.USE_TZ and timezone.is_naive(value):
+        value = timezone.make_aware(value, dt_timezone.utc)
+    return value, pk
+
+
+def keyset_paginate(queryset, field='created_at', cursor=None, limit=50, descending=True):
+    """(field, pk) 키셋 페이지네이션
+    
+    OFFSET 없이 직전 페이지의 마지막 (field, pk) 이후만 조회한다.
+    (items, next_cursor) 를 반환하며 마지막 페이지면 next_cursor 는 None.
+    잘못된 커서는 커서가 없는 것으로 보고 첫 페이지를 반환한다.
+    """
+    if cursor:
+        decoded = decode_cursor(cursor, queryset.model, field)
+        if decoded:
+            value, pk = decoded
+            lookup = 'lt' if descending else 'gt'
+            queryset = queryset.filter(
+                Q(**{f'{field}__{lookup}': value}) | Q(**{field: value, f'pk__{lookup}': pk})
+            )
+    
+    prefix = '-' if descending else ''
+    items = list(queryset.order_by(f'{prefix}{field}', f'{prefix}pk')[:limit + 1])
+    if len(items) <= limit:
+        return items, None
+    items = items[:limit]
+    last = items[-1]
+    return items, encode_cursor(getattr(last, field), last.pk)
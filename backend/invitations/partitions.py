@@ -0,0 +1,249 @@
+# invitations/partitions.py
+"""
+invitation_activities 월별 파티션 관리 (PostgreSQL 전용)
+
+월 파티션이 없는 시각의 행은 DEFAULT 파티션에 들어가므로, 파티션 생성 작업이
+밀려도 활동 로그 삽입(수락/발급/대량 초대)은 실패하지 않는다. DEFAULT 에 쌓인 행은
+해당 월 파티션을 만들 때 그 파티션으로 옮긴다 (drain_default_partition).
+"""
+
+import re
+from datetime import date
+from django.db import connections, transaction
+from django.utils import timezone
+
+from .models import InvitationActivity, InvitationActivitySummary
+
+PARENT_TABLE = InvitationActivity._meta.db_table
+SUMMARY_TABLE = InvitationActivitySummary._meta.db_table
+LEGACY_TABLE = f'{PARENT_TABLE}_legacy'
+DEFAULT_PARTITION = f'{PARENT_TABLE}_default'
+PARTITION_NAME_RE = re.compile(rf'^{PARENT_TABLE}_p(\d{{4}})(\d{{2}})$')
+
+
+def month_start(value):
+    return date(value.year, value.month, 1)
+
+
+def add_months(value, months):
+    month_index = value.year * 12 + value.month - 1 + months
+    return date(month_index // 12, month_index % 12 + 1, 1)
+
+
+def partition_name(month):
+    return f'{PARENT_TABLE}_p{month:%Y%m}'
+
+
+def check_postgresql(using):
+    if connections[using].vendor != 'postgresql':
+        raise NotImplementedError('활동 로그 파티셔닝은 PostgreSQL 에서만 지원합니다.')
+
+
+def is_partitioned(using='default'):
+    """invitation_activities 가 파티션 테이블인지 여부"""
+    check_postgresql(using)
+    with connections[using].cursor() as cursor:
+        cursor.execute(
+            "SELECT c.relkind FROM pg_class c "
+            "JOIN pg_namespace n ON n.oid = c.relnamespace "
+            "WHERE c.relname = %s AND n.nspname = current_schema()",
+            [PARENT_TABLE]
+        )
+        row = cursor.fetchone()
+    return bool(row) and row[0] == 'p'
+
+
+def list_partitions(using='default'):
+    """연결된 월별 파티션 [(month, table_name)] (오래된 순)"""
+    check_postgresql(using)
+    with connections[using].cursor() as cursor:
+        cursor.execute(
+            "SELECT c.relname FROM pg_inherits i "
+            "JOIN pg_class c ON c.oid = i.inhrelid "
+            "JOIN pg_class p ON p.oid = i.inhparent "
+            "WHERE p.relname = %s",
+            [PARENT_TABLE]
+        )
+        names = [row[0] for row in cursor.fetchall()]
+    
+    partitions = []
+    for name in names:
+        match = PARTITION_NAME_RE.match(name)
+        if match:
+            partitions.append((date(int(match.group(1)), int(match.group(2)), 1), name))
+    return sorted(partitions)
+
+
+def create_default_partition(cursor):
+    cursor.execute(f'CREATE TABLE IF NOT EXISTS "{DEFAULT_PARTITION}" PARTITION OF "{PARENT_TABLE}" DEFAULT')
+
+
+def create_partition(cursor, month):
+    """월 파티션 생성 (있으면 무시), DEFAULT 파티션에 있던 그 달 행을 옮기고 건수 반환"""
+    name = partition_name(month)
+    bounds = [month.isoformat(), add_months(month, 1).isoformat()]
+    cursor.execute('SELECT to_regclass(%s), to_regclass(%s)', [name, DEFAULT_PARTITION])
+    exists, default = cursor.fetchone()
+    if exists:
+        return 0
+    
+    has_rows = False
+    if default:
+        cursor.execute(
+            f'SELECT EXISTS (SELECT 1 FROM "{DEFAULT_PARTITION}" WHERE created_at >= %s AND created_at < %s)',
+            bounds
+        )
+        has_rows = cursor.fetchone()[0]
+    
+    create_sql = (
+        f'CREATE TABLE IF NOT EXISTS "{name}" '
+        f'PARTITION OF "{PARENT_TABLE}" FOR VALUES FROM (%s) TO (%s)'
+    )
+    if not has_rows:
+        cursor.execute(create_sql, bounds)
+        return 0
+    
+    # DEFAULT 에 겹치는 행이 있으면 파티션을 만들 수 없으므로 잠시 분리해 옮긴다
+    cursor.execute(f'ALTER TABLE "{PARENT_TABLE}" DETACH PARTITION "{DEFAULT_PARTITION}"')
+    cursor.execute(create_sql, bounds)
+    cursor.execute(
+        f'INSERT INTO "{name}" SELECT * FROM "{DEFAULT_PARTITION}" WHERE created_at >= %s AND created_at < %s',
+        bounds
+    )
+    moved = cursor.rowcount
+    cursor.execute(f'DELETE FROM "{DEFAULT_PARTITION}" WHERE created_at >= %s AND created_at < %s', bounds)
+    cursor.execute(f'ALTER TABLE "{PARENT_TABLE}" ATTACH PARTITION "{DEFAULT_PARTITION}" DEFAULT')
+    return moved
+
+
+def ensure_partitions(months_ahead=3, using='default'):
+    """이번 달부터 months_ahead 개월 뒤까지 파티션 생성, 생성 대상 이름 목록 반환"""
+    check_postgresql(using)
+    current = month_start(timezone.now())
+    months = [add_months(current, offset) for offset in range(months_ahead + 1)]
+    with transaction.atomic(using=using), connections[using].cursor() as cursor:
+        create_default_partition(cursor)
+        for month in months:
+            create_partition(cursor, month)
+    return [partition_name(month) for month in months]
+
+
+def drain_default_partition(using='default'):
+    """DEFAULT 파티션에 쌓인 행을 월 파티션으로 옮김, [(table_name, moved_rows)] 반환
+    
+    행이 있다면 파티션 생성 작업이 밀렸다는 뜻이다.
+    """
+    check_postgresql(using)
+    with transaction.atomic(using=using), connections[using].cursor() as cursor:
+        cursor.execute('SELECT to_regclass(%s)', [DEFAULT_PARTITION])
+        if cursor.fetchone()[0] is None:
+            return []
+        cursor.execute(
+            f"SELECT DISTINCT date_trunc('month', created_at)::date FROM \"{DEFAULT_PARTITION}\" ORDER BY 1"
+        )
+        months = [row[0] for row in cursor.fetchall()]
+        return [(partition_name(month), create_partition(cursor, month)) for month in months]
+
+
+def convert_to_partitioned(months_ahead=3, using='default'):
+    """기존 일반 테이블을 created_at 월별 RANGE 파티션 테이블로 전환
+    
+    인덱스/외래키 정의와 이름을 그대로 옮기고 기본키는 (id, created_at) 로 바꾼다.
+    기존 데이터 범위의 파티션과 DEFAULT 파티션을 만든 뒤 한 트랜잭션 안에서 데이터를 옮긴다.
+    """
+    check_postgresql(using)
+    if is_partitioned(using):
+        return False
+    
+    with transaction.atomic(using=using), connections[using].cursor() as cursor:
+        cursor.execute(f'LOCK TABLE "{PARENT_TABLE}" IN ACCESS EXCLUSIVE MODE')
+        
+        # 기존 인덱스/외래키 정의 수집 (기본키 제외)
+        cursor.execute(
+            "SELECT c.relname, pg_get_indexdef(i.indexrelid) FROM pg_index i "
+            "JOIN pg_class c ON c.oid = i.indexrelid "
+            "WHERE i.indrelid = %s::regclass AND NOT i.indisprimary",
+            [PARENT_TABLE]
+        )
+        indexes = cursor.fetchall()
+        cursor.execute(
+            "SELECT conname, pg_get_constraintdef(oid) FROM pg_constraint "
+            "WHERE conrelid = %s::regclass AND contype = 'f'",
+            [PARENT_TABLE]
+        )
+        foreign_keys = cursor.fetchall()
+        cursor.execute(
+            "SELECT conname FROM pg_constraint WHERE conrelid = %s::regclass AND contype = 'p'",
+            [PARENT_TABLE]
+        )
+        primary_key = cursor.fetchone()[0]
+        cursor.execute(f'SELECT MIN(created_at) FROM "{PARENT_TABLE}"')
+        oldest = cursor.fetchone()[0]
+        
+        # 기존 테이블과 인덱스/제약 이름을 비워 둔다
+        cursor.execute(f'ALTER TABLE "{PARENT_TABLE}" RENAME TO "{LEGACY_TABLE}"')
+        cursor.execute(f'ALTER TABLE "{LEGACY_TABLE}" RENAME CONSTRAINT "{primary_key}" TO "{primary_key}_legacy"')
+        for name, _ in indexes:
+            cursor.execute(f'ALTER INDEX "{name}" RENAME TO "{name}_legacy"')
+        for name, _ in foreign_keys:
+            cursor.execute(f'ALTER TABLE "{LEGACY_TABLE}" RENAME CONSTRAINT "{name}" TO "{name}_legacy"')
+        
+        cursor.execute(
+            f'CREATE TABLE "{PARENT_TABLE}" (LIKE "{LEGACY_TABLE}" INCLUDING DEFAULTS) '
+            f'PARTITION BY RANGE (created_at)'
+        )
+        cursor.execute(f'ALTER TABLE "{PARENT_TABLE}" ADD CONSTRAINT "{primary_key}" PRIMARY KEY (id, created_at)')
+        for name, definition in foreign_keys:
+            cursor.execute(f'ALTER TABLE "{PARENT_TABLE}" ADD CONSTRAINT "{name}" {definition}')
+        # 이름 변경 전에 수집한 정의이므로 새 부모 테이블에 같은 이름으로 생성된다
+        for _, definition in indexes:
+            cursor.execute(definition)
+        
+        first = month_start(oldest) if oldest else month_start(timezone.now())
+        month = first
+        last = add_months(month_start(timezone.now()), months_ahead)
+        while month <= last:
+            create_partition(cursor, month)
+            month = add_months(month, 1)
+        create_default_partition(cursor)
+        
+        cursor.execute(f'INSERT INTO "{PARENT_TABLE}" SELECT * FROM "{LEGACY_TABLE}"')
+        cursor.execute(f'DROP TABLE "{LEGACY_TABLE}"')
+    return True
+
+
+def compact_partitions(retain_months=12, drop=True, using='default'):
+    """보존 기간이 지난 파티션을 월별 요약으로 집계한 뒤 분리(및 삭제)
+    
+    이번 달 기준 retain_months 개월 이전의 파티션을 대상으로
+    (invitation, action, month) 단위 건수/최초/최종 시각을 요약 테이블에 누적한다.
+    처리한 파티션 [(month, table_name, summarized_rows)] 를 반환한다.
+    요약 행 id 의 gen_random_uuid() 는 PostgreSQL 13 이상 내장 함수다
+    (12 이하는 pgcrypto 확장 필요).
+    """
+    check_postgresql(using)
+    cutoff = add_months(month_start(timezone.now()), -retain_months)
+    compacted = []
+    
+    for month, name in list_partitions(using):
+        if month >= cutoff:
+            break
+        with transaction.atomic(using=using), connections[using].cursor() as cursor:
+            cursor.execute(
+                f'INSERT INTO "{SUMMARY_TABLE}" '
+                f'(id, invitation_id, action, month, count, first_at, last_at) '
+                f'SELECT gen_random_uuid(), invitation_id, action, %s, COUNT(*), MIN(created_at), MAX(created_at) '
+                f'FROM "{name}" '
+                f'GROUP BY invitation_id, action '
+                f'ON CONFLICT (invitation_id, action, month) DO UPDATE SET '
+                f'count = "{SUMMARY_TABLE}".count + EXCLUDED.count, '
+                f'first_at = LEAST("{SUMMARY_TABLE}".first_at, EXCLUDED.first_at), '
+                f'last_at = GREATEST("{SUMMARY_TABLE}".last_at, EXCLUDED.last_at)',
+                [month.isoformat()]
+            )
+            summarized = cursor.rowcount
+            cursor.execute(f'ALTER TABLE "{PARENT_TABLE}" DETACH PARTITION "{name}"')
+            if drop:
+                cursor.execute(f'DROP TABLE "{name}"')
+        compacted.append((month, name, summarized))
+    return compacted
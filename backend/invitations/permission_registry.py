@@ -0,0 +1,168 @@
+# invitations/permission_registry.py
+"""
+PermissionTemplate 컴파일 레지스트리
+"""
+
+import logging
+import threading
+import time
+from types import MappingProxyType
+from typing import NamedTuple
+from django.core.cache import cache
+
+from .models import (
+    PERMISSION_BITS,
+    ROLE_PERMISSIONS,
+    PermissionTemplate,
+    bits_to_permissions,
+    permissions_to_bits
+)
+from .routers import read_from
+
+log = logging.getLogger(__name__)
+
+# 다른 프로세스의 템플릿 변경 확인 주기(초)와 공유 버전 키
+VERSION_CHECK_INTERVAL = 5.0
+VERSION_CACHE_KEY = 'invitations:permission_templates:version'
+
+# 템플릿에 우선순위가 없을 때의 기본값 (ParticipantPermission.role_priority 기본값과 동일)
+DEFAULT_ROLE_PRIORITY = 100
+
+# 알 수 없는 역할의 대체 템플릿
+FALLBACK_TEMPLATE = 'viewer'
+
+# 템플릿 JSON 에 허용되는 키
+TEMPLATE_KEYS = frozenset(PERMISSION_BITS) | {'role_priority'}
+
+
+class CompiledTemplate(NamedTuple):
+    """컴파일된 권한 템플릿 (불변)"""
+    name: str
+    permission_bits: int
+    role_priority: int
+    field_values: MappingProxyType
+    
+    @classmethod
+    def compile(cls, name, permissions):
+        bits = permissions_to_bits(permissions)
+        priority = permissions.get('role_priority', DEFAULT_ROLE_PRIORITY)
+        return cls(name, bits, priority, permission_field_values(bits, priority))
+    
+    def apply(self, overrides):
+        """(set_mask, clear_mask) 재정의를 적용한 비트마스크"""
+        set_mask, clear_mask = overrides
+        return (self.permission_bits | set_mask) & ~clear_mask
+
+
+def permission_field_values(bits, role_priority):
+    """ParticipantPermission 생성용 필드 값"""
+    return MappingProxyType({
+        'role_priority': role_priority,
+        **bits_to_permissions(bits),
+        'permission_bits': bits
+    })
+
+
+def compile_overrides(overrides):
+    """초대 권한 JSON({플래그: bool}) → (set_mask, clear_mask), 알 수 없는 키는 무시"""
+    set_mask = 0
+    clear_mask = 0
+    for field, value in (overrides or {}).items():
+        bit = PERMISSION_BITS.get(field)
+        if bit is None:
+            continue
+        if value:
+            set_mask |= bit
+        else:
+            clear_mask |= bit
+    return set_mask, clear_mask
+
+
+class PermissionTemplateRegistry:
+    """전체 PermissionTemplate 을 한 번에 읽어 컴파일해 두는 레지스트리
+    
+    기본 역할표(ROLE_PERMISSIONS) 위에 DB 템플릿을 덮어쓴 불변 매핑을 유지하고,
+    템플릿 저장/삭제 시그널(invalidate)과 공유 캐시 버전으로 다시 읽는다.
+    역할과 같은 이름의 템플릿은 그 역할의 기본값 위에 지정한 키만 덮어쓴다.
+    
+    다른 프로세스의 변경 감지는 'default' 캐시가 프로세스 간에 공유될 때(Redis,
+    Memcached 등)만 동작한다. LocMemCache 에서는 각 프로세스가 변경된 버전을 보지
+    못하므로 저장한 프로세스 외에는 재시작 전까지 이전 템플릿을 사용한다.
+    """
+    
+    def __init__(self):
+        self.templates = None
+        self.version = None
+        self.checked_at = 0.0
+        self.lock = threading.Lock()
+    
+    def load(self):
+        compiled = {
+            name: CompiledTemplate.compile(name, values)
+            for name, values in ROLE_PERMISSIONS.items()
+        }
+        # 새 버전으로 캐시되므로 복제 지연된 이전 행을 읽지 않도록 주 DB 에서 조회
+        with read_from('primary'):
+            rows = list(PermissionTemplate.objects.values_list('name', 'permissions'))
+        for name, permissions in rows:
+            permissions = permissions or {}
+            unknown = sorted(set(permissions) - TEMPLATE_KEYS)
+            if unknown:
+                log.warning('권한 템플릿 %s 의 알 수 없는 키 무시: %s', name, ', '.join(unknown))
+            # 기본 역할을 통째로 대체하지 않고 지정한 키만 덮어씀
+            compiled[name] = CompiledTemplate.compile(name, {
+                **ROLE_PERMISSIONS.get(name, {}),
+                **{key: value for key, value in permissions.items() if key in TEMPLATE_KEYS}
+            })
+        return MappingProxyType(compiled)
+    
+    def get_templates(self):
+        now = time.monotonic()
+        if self.templates is not None and now - self.checked_at >= VERSION_CHECK_INTERVAL:
+            self.checked_at = now
+            if cache.get(VERSION_CACHE_KEY) != self.version:
+                self.templates = None
+        
+        templates = self.templates
+        if templates is None:
+            with self.lock:
+                if self.templates is None:
+                    self.version = cache.get(VERSION_CACHE_KEY)
+                    self.templates = self.load()
+                    self.checked_at = time.monotonic()
+                templates = self.templates
+        return templates
+    
+    def get(self, name):
+        """이름(역할)으로 컴파일된 템플릿 조회, 없으면 viewer"""
+        templates = self.get_templates()
+        return templates.get(name) or templates[FALLBACK_TEMPLATE]
+    
+    def resolve_invitation(self, invitation):
+        """초대의 역할 템플릿 + 권한 JSON 재정의를 적용한 (permission_bits, role_priority)
+        
+        컴파일 결과를 인스턴스에 보관하므로 같은 인스턴스의 반복 호출은 O(1) 이다.
+        """
+        templates = self.get_templates()
+        cached = getattr(invitation, '_compiled_permissions', None)
+        if cached is not None and cached[0] is templates:
+            return cached[1]
+        
+        template = templates.get(invitation.role) or templates[FALLBACK_TEMPLATE]
+        resolved = (template.apply(compile_overrides(invitation.permissions)), template.role_priority)
+        invitation._compiled_permissions = (templates, resolved)
+        return resolved
+    
+    def invalidate(self):
+        """템플릿 변경 시 호출, 다른 프로세스에도 버전 변경을 알린다"""
+        with self.lock:
+            self.templates = None
+        cache.set(VERSION_CACHE_KEY, time.time(), None)
+
+
+_registry = PermissionTemplateRegistry()
+
+
+def get_permission_registry():
+    """프로세스 공용 PermissionTemplateRegistry"""
+    return _registry
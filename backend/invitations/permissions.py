@@ -0,0 +1,234 @@
+# invitations/permissions.py
+"""
+ParticipantPermission 조회 캐시
+"""
+
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime
+from typing import NamedTuple, Optional
+from django.conf import settings
+from django.core.cache import caches
+from django.utils import timezone
+
+from .cache import LRUCache
+from .models import PERMISSION_BITS, ParticipantPermission, bits_to_permissions
+from .routers import read_from
+
+# 기본 캐시 설정 (settings.INVITATIONS_PERMISSION_CACHE 로 재정의)
+DEFAULT_PERMISSION_CACHE = {
+    'BACKEND': 'local',      # 'local' | 'shared'
+    'MAXSIZE': 10000,
+    'TTL': 60,               # 초
+    'CACHE_ALIAS': 'default',
+    'KEY_PREFIX': 'invitations:perm'
+}
+
+# 요청 범위 캐시 (PermissionCacheMiddleware / request_scope 안에서만 활성화)
+_request_cache = ContextVar('invitations_permission_request_cache', default=None)
+
+
+class PermissionSnapshot(NamedTuple):
+    """캐시되는 권한 스냅샷 (권한 행이 없으면 role 이 None)"""
+    role: Optional[str]
+    permission_bits: int
+    expires_at: Optional[datetime]
+    
+    def is_expired(self, now=None):
+        if not self.expires_at:
+            return False
+        return (now or timezone.now()) > self.expires_at
+    
+    def has_permission(self, permission_name):
+        if self.role is None or self.is_expired():
+            return False
+        return bool(self.permission_bits & PERMISSION_BITS.get(permission_name, 0))
+
+
+NO_PERMISSION = PermissionSnapshot(None, 0, None)
+
+
+class LocalPermissionCache:
+    """프로세스 내 LRU 백엔드"""
+    
+    def __init__(self, maxsize, ttl):
+        self.cache = LRUCache(maxsize, ttl)
+    
+    def get(self, key):
+        return self.cache.get(key)
+    
+    def set(self, key, snapshot):
+        self.cache.set(key, snapshot)
+    
+    def delete(self, key):
+        self.cache.delete(key)
+    
+    def clear(self):
+        self.cache.clear()
+    
+    def info(self):
+        return {'size': len(self.cache), 'maxsize': self.cache.maxsize, 'evictions': self.cache.evictions}
+
+
+class SharedPermissionCache:
+    """Django 캐시(Redis/Memcached 등)를 사용하는 프로세스 간 공유 백엔드"""
+    
+    def __init__(self, ttl, cache_alias='default', key_prefix='invitations:perm'):
+        self.ttl = ttl
+        self.cache = caches[cache_alias]
+        self.key_prefix = key_prefix
+    
+    def make_key(self, key):
+        return f'{self.key_prefix}:{key[0]}:{key[1]}'
+    
+    def get(self, key):
+        value = self.cache.get(self.make_key(key))
+        return PermissionSnapshot(*value) if value is not None else None
+    
+    def set(self, key, snapshot):
+        self.cache.set(self.make_key(key), tuple(snapshot), self.ttl)
+    
+    def delete(self, key):
+        self.cache.delete(self.make_key(key))
+    
+    def clear(self):
+        # 공유 캐시는 TTL 만료에 맡긴다
+        pass
+    
+    def info(self):
+        return {}
+
+
+class PermissionResolver:
+    """(user_id, project_id) 단위 권한 조회기
+    
+    요청 범위 캐시 → 백엔드(로컬 LRU 또는 공유 캐시) → DB 순으로 조회하며,
+    ParticipantPermission 저장/삭제 시그널로 해당 항목을 무효화한다.
+    expires_at 은 캐시된 스냅샷에서도 매 조회 시 확인한다.
+    """
+    
+    def __init__(self, backend):
+        self.backend = backend
+        self.hits = 0
+        self.misses = 0
+        self.stats_lock = threading.Lock()
+    
+    @classmethod
+    def from_settings(cls):
+        config = {**DEFAULT_PERMISSION_CACHE, **getattr(settings, 'INVITATIONS_PERMISSION_CACHE', {})}
+        if config['BACKEND'] == 'shared':
+            backend = SharedPermissionCache(config['TTL'], config['CACHE_ALIAS'], config['KEY_PREFIX'])
+        else:
+            backend = LocalPermissionCache(config['MAXSIZE'], config['TTL'])
+        return cls(backend)
+    
+    @staticmethod
+    def make_key(user, project):
+        return (getattr(user, 'pk', user), getattr(project, 'pk', project))
+    
+    def load(self, key):
+        # 무효화 직후 복제본의 이전 행을 다시 캐시하지 않도록 주 DB 에서 조회
+        with read_from('primary'):
+            row = (
+                ParticipantPermission.objects.filter(user_id=key[0], project_id=key[1])
+                .values_list('role', 'permission_bits', 'expires_at')
+                .first()
+            )
+        if row is None:
+            return NO_PERMISSION
+        return PermissionSnapshot(*row)
+    
+    def get(self, user, project):
+        """권한 스냅샷 조회"""
+        key = self.make_key(user, project)
+        request_cache = _request_cache.get()
+        if request_cache is not None and key in request_cache:
+            with self.stats_lock:
+                self.hits += 1
+            return request_cache[key]
+        
+        snapshot = self.backend.get(key)
+        if snapshot is None:
+            with self.stats_lock:
+                self.misses += 1
+            snapshot = self.load(key)
+            self.backend.set(key, snapshot)
+        else:
+            with self.stats_lock:
+                self.hits += 1
+        
+        if request_cache is not None:
+            request_cache[key] = snapshot
+        return snapshot
+    
+    def has_permission(self, user, project, permission_name):
+        """특정 권한 확인"""
+        return self.get(user, project).has_permission(permission_name)
+    
+    def get_all_permissions(self, user, project):
+        """모든 권한 딕셔너리로 반환 (만료 시 빈 딕셔너리)"""
+        snapshot = self.get(user, project)
+        if snapshot.role is None or snapshot.is_expired():
+            return {}
+        return bits_to_permissions(snapshot.permission_bits)
+    
+    def invalidate(self, user, project):
+        key = self.make_key(user, project)
+        self.backend.delete(key)
+        request_cache = _request_cache.get()
+        if request_cache is not None:
+            request_cache.pop(key, None)
+    
+    def clear(self):
+        self.backend.clear()
+        with self.stats_lock:
+            self.hits = 0
+            self.misses = 0
+    
+    def stats(self):
+        """캐시 적중/미스 통계"""
+        with self.stats_lock:
+            hits, misses = self.hits, self.misses
+        total = hits + misses
+        return {
+            'hits': hits,
+            'misses': misses,
+            'hit_rate': hits / total if total else 0.0,
+            **self.backend.info()
+        }
+
+
+_resolver = None
+_resolver_lock = threading.Lock()
+
+
+def get_permission_resolver():
+    """프로세스 공용 PermissionResolver"""
+    global _resolver
+    if _resolver is None:
+        with _resolver_lock:
+            if _resolver is None:
+                _resolver = PermissionResolver.from_settings()
+    return _resolver
+
+
+@contextmanager
+def request_scope():
+    """요청 범위 권한 캐시 활성화"""
+    token = _request_cache.set({})
+    try:
+        yield
+    finally:
+        _request_cache.reset(token)
+
+
+class PermissionCacheMiddleware:
+    """요청마다 요청 범위 권한 캐시를 활성화하는 미들웨어"""
+    
+    def __init__(self, get_response):
+        self.get_response = get_response
+    
+    def __call__(self, request):
+        with request_scope():
+            return self.get_response(request)
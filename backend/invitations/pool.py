@@ -0,0 +1,201 @@
+# invitations/pool.py
+"""
+미리 발급한 초대 토큰 풀 (QR/익명 평가자 배정)
+
+refill_pool 이 status='pooled' 초대 행을 토큰·해시까지 만들어 일괄 삽입해 두고,
+claim_invitation 은 SELECT ... FOR UPDATE SKIP LOCKED 로 그중 한 행을 선점해
+pending 으로 바꾼다. 동시 발급 요청은 서로 다른 행을 잠그므로 기다리지 않는다.
+풀 행은 발급 시 평문 토큰을 돌려줘야 하므로 평문 토큰을 보관하며,
+INVITATIONS_STORE_PLAINTEXT_TOKEN=False 면 발급과 함께 지운다.
+"""
+
+import threading
+import time
+from collections import deque
+from django.db import router, transaction
+from django.db.models import Sum
+from django.utils import timezone
+
+from .bulk_copy import write_instances
+from .models import (
+    DEFAULT_INVITATION_TTL,
+    EvaluationInvitation,
+    InvitationActivity,
+    InvitationPool,
+    InvitationStatusCounter,
+    adjust_status_counters,
+    mint_invitation_token,
+    normalize_email,
+    store_plaintext_tokens
+)
+
+REFILL_BATCH_SIZE = 1000
+
+# 발급 시 읽는 컬럼
+CLAIM_FIELDS = ('id', 'project', 'token', 'token_hash', 'role', 'permissions', 'status')
+
+
+class PoolMetrics:
+    """프로세스 내 발급 지표 (발급 수, 풀 고갈로 직접 생성한 수, 최근 지연 분포)"""
+    
+    def __init__(self, window=1000):
+        self.lock = threading.Lock()
+        self.claims = 0
+        self.misses = 0
+        self.latencies = deque(maxlen=window)
+    
+    def record(self, elapsed, missed):
+        with self.lock:
+            self.claims += 1
+            self.misses += missed
+            self.latencies.append(elapsed)
+    
+    def stats(self):
+        with self.lock:
+            latencies = sorted(self.latencies)
+            claims, misses = self.claims, self.misses
+        
+        def percentile(fraction):
+            if not latencies:
+                return 0.0
+            return latencies[min(len(latencies) - 1, int(fraction * len(latencies)))] * 1000
+        
+        return {
+            'claims': claims,
+            'misses': misses,
+            'p50_ms': percentile(0.5),
+            'p95_ms': percentile(0.95),
+            'max_ms': latencies[-1] * 1000 if latencies else 0.0
+        }
+
+
+_metrics = PoolMetrics()
+
+
+def get_pool_metrics():
+    return _metrics
+
+
+def claim_invitation(project, invitee_email='', invitee_name='', inviter=None, ttl=DEFAULT_INVITATION_TTL):
+    """풀에서 초대 하나를 발급 (raw_token 포함), 풀이 비어 있으면 즉시 생성"""
+    started = time.perf_counter()
+    project_id = getattr(project, 'pk', project)
+    using = router.db_for_write(EvaluationInvitation)
+    now = timezone.now()
+    changes = {
+        'status': 'pending',
+        'inviter': inviter,
+        'invitee_email': invitee_email,
+        'invitee_email_normalized': normalize_email(invitee_email),
+        'invitee_name': invitee_name,
+        'expires_at': now + ttl,
+        'created_at': now
+    }
+    
+    with transaction.atomic(using=using):
+        # 정렬 없이 LIMIT 1 로 (project, status) 인덱스에서 잠기지 않은 첫 행
+        rows = list(
+            EvaluationInvitation.objects.using(using)
+            .select_for_update(skip_locked=True, of=('self',))
+            .filter(project_id=project_id, status='pooled')
+            .only(*CLAIM_FIELDS)
+            .order_by()[:1]
+        )
+        if not rows:
+            pool = InvitationPool.objects.using(using).filter(project_id=project_id).first()
+            invitation = EvaluationInvitation(
+                project_id=project_id,
+                role=pool.role if pool else 'evaluator',
+                permissions=pool.permissions if pool else {},
+                **changes
+            )
+            invitation.save(using=using)
+            _metrics.record(time.perf_counter() - started, True)
+            return invitation
+        
+        invitation = rows[0]
+        raw_token = invitation.token
+        if not store_plaintext_tokens():
+            changes['token'] = None
+        EvaluationInvitation.objects.using(using).filter(pk=invitation.pk).update(**changes)
+        InvitationActivity.objects.using(using).bulk_create([InvitationActivity(
+            invitation_id=invitation.pk,
+            action='created',
+            actor=inviter,
+            metadata={'pooled': True},
+            created_at=now
+        )])
+        adjust_status_counters(project_id, {'pooled': -1, 'pending': 1}, using=using)
+    
+    for field, value in changes.items():
+        setattr(invitation, field, value)
+    invitation._loaded_status = 'pending'
+    invitation.raw_token = raw_token
+    _metrics.record(time.perf_counter() - started, False)
+    return invitation
+
+
+def refill_pool(pool, force=False, batch_size=REFILL_BATCH_SIZE):
+    """풀을 target_size 까지 보충, 추가한 행 수 반환
+    
+    남은 수가 low_water 보다 많으면 force 가 아닌 한 건너뛴다.
+    """
+    using = router.db_for_write(EvaluationInvitation)
+    available = EvaluationInvitation.objects.using(using).filter(project_id=pool.project_id, status='pooled').count()
+    if available > pool.low_water and not force:
+        return 0
+    
+    needed = max(pool.target_size - available, 0)
+    now = timezone.now()
+    for start in range(0, needed, batch_size):
+        invitations = []
+        for _ in range(min(batch_size, needed - start)):
+            token, token_hash = mint_invitation_token()
+            invitations.append(EvaluationInvitation(
+                project_id=pool.project_id,
+                invitee_email='',
+                invitee_email_normalized='',
+                token=token,
+                token_hash=token_hash,
+                role=pool.role,
+                permissions=pool.permissions,
+                status='pooled',
+                expires_at=now + DEFAULT_INVITATION_TTL,  # 발급 시 다시 설정
+                created_at=now
+            ))
+        with transaction.atomic(using=using):
+            write_instances(EvaluationInvitation, invitations, using=using)
+            adjust_status_counters(pool.project_id, {'pooled': len(invitations)}, using=using)
+    
+    InvitationPool.objects.using(using).filter(pk=pool.pk).update(last_refilled_at=now)
+    return needed
+
+
+def refill_pools(force=False, batch_size=REFILL_BATCH_SIZE):
+    """활성화된 모든 풀 보충, {project_id: 추가 행 수}"""
+    return {
+        pool.project_id: refill_pool(pool, force=force, batch_size=batch_size)
+        for pool in InvitationPool.objects.filter(enabled=True)
+    }
+
+
+def pool_stats():
+    """풀별 크기/임계값과 이 프로세스의 발급 지연 지표"""
+    sizes = dict(
+        InvitationStatusCounter.objects.filter(status='pooled')
+        .values('project_id')
+        .annotate(total=Sum('count'))
+        .values_list('project_id', 'total')
+    )
+    pools = [
+        {
+            'project_id': pool.project_id,
+            'size': sizes.get(pool.project_id, 0),
+            'target_size': pool.target_size,
+            'low_water': pool.low_water,
+            'below_low_water': sizes.get(pool.project_id, 0) <= pool.low_water,
+            'last_refilled_at': pool.last_refilled_at
+        }
+        for pool in InvitationPool.objects.filter(enabled=True).order_by('project_id')
+    ]
+    return {'pools': pools, 'claims': _metrics.stats()}
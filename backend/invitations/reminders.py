@@ -0,0 +1,241 @@
+# invitations/reminders.py
+"""
+초대 리마인더 일괄 발송
+"""
+
+import logging
+import smtplib
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
+from django.db import transaction
+from django.db.models import Case, DateTimeField, F, Value, When
+from django.db.models.functions import Cast
+from django.template import Context, Engine
+from django.utils import timezone
+
+from .models import EvaluationInvitation, InvitationActivity
+
+log = logging.getLogger(__name__)
+
+# 한 번에 조회/갱신할 초대 수
+DEFAULT_REMINDER_BATCH_SIZE = 500
+
+REMINDER_SUBJECT = '[AHP] {project_name} 평가 참여 요청 리마인더'
+
+REMINDER_BODY = """{% if invitee_name %}{{ invitee_name }}님{% else %}안녕하세요{% endif %},
+
+{{ project_name }} 프로젝트 평가에 아직 참여하지 않으셨습니다.
+아래 링크에서 초대를 수락해 주세요. (만료: {{ expires_at|date:"Y-m-d H:i" }})
+
+{{ accept_url }}
+{% if custom_message %}
+{{ custom_message }}
+{% endif %}"""
+
+
+@lru_cache(maxsize=None)
+def get_reminder_template():
+    """리마인더 본문 템플릿 (최초 1회 컴파일)"""
+    return Engine(autoescape=False).from_string(REMINDER_BODY)
+
+
+class RateLimiter:
+    """스레드 간 공유되는 초당 발송 제한"""
+    
+    def __init__(self, rate):
+        self.interval = 1.0 / rate if rate else 0.0
+        self.next_slot = time.monotonic()
+        self.lock = threading.Lock()
+    
+    def wait(self):
+        if not self.interval:
+            return
+        with self.lock:
+            now = time.monotonic()
+            slot = max(now, self.next_slot)
+            self.next_slot = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+class ReminderSender:
+    """워커 스레드별 SMTP 연결을 재사용하는 발송기"""
+    
+    def __init__(self, workers=4, rate_limit=10.0, connection_kwargs=None, from_email=None):
+        self.workers = workers
+        self.rate_limiter = RateLimiter(rate_limit)
+        self.connection_kwargs = connection_kwargs or {}
+        self.from_email = from_email or settings.DEFAULT_FROM_EMAIL
+        self.local = threading.local()
+        self.connections = []
+        self.lock = threading.Lock()
+    
+    def get_connection(self):
+        connection = getattr(self.local, 'connection', None)
+        if connection is None:
+            connection = get_connection(**self.connection_kwargs)
+            connection.open()
+            self.local.connection = connection
+            with self.lock:
+                self.connections.append(connection)
+        return connection
+    
+    def render(self, invitation, base_url):
+        context = Context({
+            'invitee_name': invitation.invitee_name,
+            'project_name': invitation.project.name,
+            'expires_at': invitation.expires_at,
+            'accept_url': invitation.get_accept_url(base_url),
+            'custom_message': invitation.custom_message
+        })
+        return EmailMessage(
+            subject=REMINDER_SUBJECT.format(project_name=invitation.project.name),
+            body=get_reminder_template().render(context),
+            from_email=self.from_email,
+            to=[invitation.invitee_email]
+        )
+    
+    def send_one(self, invitation, base_url):
+        """단일 발송, 성공 시 초대 id 반환 (실패는 로그만 남기고 None)"""
+        try:
+            message = self.render(invitation, base_url)
+        except Exception:
+            log.exception('리마인더 본문 생성 실패 (초대 %s)', invitation.pk)
+            return None
+        self.rate_limiter.wait()
+        try:
+            sent = self.get_connection().send_messages([message])
+        except (smtplib.SMTPException, OSError):
+            log.exception('리마인더 발송 실패 (초대 %s)', invitation.pk)
+            # 연결 오류이므로 다음 발송에서 새로 연결
+            self.local.connection = None
+            return None
+        except Exception:
+            log.exception('리마인더 발송 실패 (초대 %s)', invitation.pk)
+            return None
+        return invitation.pk if sent else None
+    
+    def send_all(self, invitations, base_url, on_sent=None):
+        """발송 성공 초대 id 목록 반환, on_sent(pk) 는 성공할 때마다 호출 스레드에서 실행"""
+        sent_ids = []
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            for pk in executor.map(lambda invitation: self.send_one(invitation, base_url), invitations):
+                if pk is not None:
+                    sent_ids.append(pk)
+                    if on_sent is not None:
+                        on_sent(pk)
+        return sent_ids
+    
+    def close(self):
+        with self.lock:
+            for connection in self.connections:
+                try:
+                    connection.close()
+                except Exception:
+                    pass
+            self.connections = []
+
+
+def send_due_reminders(base_url='', batch_size=DEFAULT_REMINDER_BATCH_SIZE, workers=4,
+                       rate_limit=10.0, connection_kwargs=None, from_email=None, now=None, max_batches=None):
+    """발송 대상 초대를 한 쿼리로 선별해 리마인더 발송
+    
+    대상은 EvaluationInvitation.objects.reminder_eligible() 로 배치 단위(pk 키셋) 조회하고,
+    발송 전에 select_for_update(skip_locked) 로 잠근 행의 last_reminder_at 을 now 로 바꿔
+    선점한다. 겹쳐 실행된 다른 작업은 선점된 행을 대상으로 보지 않는다.
+    제한된 워커 풀에서 SMTP 연결을 재사용하며 발송한 뒤 성공 건만
+    reminder_count 증가와 'reminder_sent' 로그를 일괄 처리하고,
+    실패 건은 last_reminder_at 을 이전 값으로 되돌려 다음 실행에서 다시 시도한다.
+    max_batches 를 지정하면 그 배치 수만큼만 처리한다.
+    
+    평문 토큰을 저장하지 않는 경우(INVITATIONS_STORE_PLAINTEXT_TOKEN=False) 새 토큰으로
+    링크를 만들고, 발송에 성공한 초대만 즉시 새 토큰 해시를 저장한다. 이때부터 이전에
+    받은 링크는 동작하지 않으며, 발송에 실패한 초대는 기존 링크가 그대로 유효하다.
+    """
+    now = now or timezone.now()
+    started = time.monotonic()
+    sender = ReminderSender(workers, rate_limit, connection_kwargs, from_email)
+    eligible = 0
+    sent = 0
+    batches = 0
+    last_pk = None
+    
+    try:
+        while True:
+            queryset = EvaluationInvitation.objects.reminder_eligible(now).select_related('project')
+            if last_pk is not None:
+                queryset = queryset.filter(pk__gt=last_pk)
+            # 발송 전 선점: 다른 실행이 잠근 행은 건너뛰고, 잠근 행은 last_reminder_at 으로 표시
+            with transaction.atomic():
+                invitations = list(
+                    queryset.select_for_update(skip_locked=True, of=('self',)).order_by('pk')[:batch_size]
+                )
+                if invitations:
+                    EvaluationInvitation.objects.filter(
+                        pk__in=[invitation.pk for invitation in invitations]
+                    ).update(last_reminder_at=now)
+            if not invitations:
+                break
+            eligible += len(invitations)
+            last_pk = invitations[-1].pk
+            
+            # 평문 토큰을 저장하지 않는 경우 새 링크 발급 (저장은 발송 성공 후)
+            reissued = {}
+            for invitation in invitations:
+                if not invitation.token:
+                    invitation.issue_token()
+                    reissued[invitation.pk] = invitation
+            
+            def save_token(pk):
+                invitation = reissued.get(pk)
+                if invitation is not None:
+                    EvaluationInvitation.objects.filter(pk=pk, status='pending').update(
+                        token=invitation.token,
+                        token_hash=invitation.token_hash
+                    )
+            
+            sent_ids = sender.send_all(invitations, base_url, on_sent=save_token if reissued else None)
+            sent_set = set(sent_ids)
+            # 실패 건은 선점 이전의 last_reminder_at 으로 복구 (값별로 묶어 UPDATE 한 번)
+            released = {}
+            for invitation in invitations:
+                if invitation.pk not in sent_set:
+                    released.setdefault(invitation.last_reminder_at, []).append(invitation.pk)
+            with transaction.atomic():
+                if sent_ids:
+                    EvaluationInvitation.objects.filter(pk__in=sent_ids, last_reminder_at=now).update(
+                        reminder_count=F('reminder_count') + 1
+                    )
+                    InvitationActivity.objects.bulk_create([
+                        InvitationActivity(invitation_id=pk, action='reminder_sent')
+                        for pk in sent_ids
+                    ])
+                if released:
+                    EvaluationInvitation.objects.filter(
+                        pk__in=[pk for pks in released.values() for pk in pks],
+                        last_reminder_at=now
+                    ).update(last_reminder_at=Case(
+                        *[
+                            When(pk__in=pks, then=Cast(Value(previous), DateTimeField()))
+                            for previous, pks in released.items()
+                        ],
+                        output_field=DateTimeField()
+                    ))
+            sent += len(sent_ids)
+            batches += 1
+            
+            if len(invitations) < batch_size or (max_batches is not None and batches >= max_batches):
+                break
+    finally:
+        sender.close()
+    
+    return {
+        'eligible': eligible,
+        'sent': sent,
+        'failed': eligible - sent,
+        'elapsed': time.monotonic() - started
+    }
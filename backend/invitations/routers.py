@@ -0,0 +1,168 @@
+# invitations/routers.py
+"""
+초대 앱 읽기 전용 복제본(replica) 라우터
+
+읽기(목록, 활동 로그, 대시보드 카운터)는 복제본으로 보내고 쓰기는
+주 DB 로 보낸다. 결과를 캐시하는 토큰 조회, 권한 캐시 적재, 권한 템플릿
+레지스트리 적재는 복제 지연을 캐시에 남기지 않도록 read_from('primary') 로
+주 DB 에서 읽는다. 요청 안에서 한 번이라도 쓰기를 라우팅하면 그 요청의 이후 읽기는
+주 DB 로 고정(read-your-writes)되며, ReplicaRoutingMiddleware 가 쿠키로
+PIN_SECONDS 동안 다음 요청까지 고정을 이어 복제 지연을 가린다.
+
+설정 예:
+    DATABASES = {
+        'default': {...},
+        'replica': {..., 'TEST': {'MIRROR': 'default'}},
+    }
+    DATABASE_ROUTERS = ['invitations.routers.InvitationsRouter']
+    INVITATIONS_DATABASE_ROUTER = {
+        'REPLICAS': ['replica'],
+        'MODELS': {'invitations.permissiontemplate': 'primary'},
+        'VIEWS': {'invitations:my-invitations': 'primary'},
+    }
+로컬에서는 SQLite/PostgreSQL DB 두 개를 주 DB/복제본으로 두고 확인할 수 있다.
+"""
+
+import random
+from contextlib import contextmanager
+from contextvars import ContextVar
+from django.conf import settings
+
+# 기본 설정 (settings.INVITATIONS_DATABASE_ROUTER 로 재정의)
+DEFAULT_DATABASE_ROUTER = {
+    'PRIMARY': 'default',
+    'REPLICAS': [],              # 비어 있으면 모든 읽기를 주 DB 로
+    'DEFAULT_READ': 'replica',   # 모델별 기본 읽기 대상 'replica' | 'primary'
+    'MODELS': {},                # {'invitations.<model>': 'replica' | 'primary'}
+    'VIEWS': {},                 # {'<namespace:url_name>': 'replica' | 'primary'}
+    'PIN_SECONDS': 5,            # 쓰기 후 다음 요청까지 주 DB 고정 유지(초), 0 이면 요청 안에서만
+    'PIN_COOKIE': 'invitations_primary_pin'
+}
+
+APP_LABEL = 'invitations'
+
+
+def get_router_config():
+    return {**DEFAULT_DATABASE_ROUTER, **getattr(settings, 'INVITATIONS_DATABASE_ROUTER', {})}
+
+
+class RoutingState:
+    """요청(또는 실행 컨텍스트) 단위 라우팅 상태
+    
+    sync_to_async 작업 스레드에도 같은 객체가 전달되도록 ContextVar 에는
+    값 대신 이 가변 객체를 둔다.
+    """
+    __slots__ = ('pinned', 'wrote', 'forced')
+    
+    def __init__(self, pinned=False):
+        self.pinned = pinned
+        self.wrote = False
+        self.forced = None
+
+
+_routing_state = ContextVar('invitations_routing_state', default=None)
+
+
+def get_routing_state():
+    state = _routing_state.get()
+    if state is None:
+        # 요청 밖(명령, 작업 스레드): 이 컨텍스트 전용 상태
+        state = RoutingState()
+        _routing_state.set(state)
+    return state
+
+
+@contextmanager
+def routing_scope(pinned=False):
+    """새 라우팅 상태 범위 (미들웨어/테스트용)"""
+    state = RoutingState(pinned)
+    token = _routing_state.set(state)
+    try:
+        yield state
+    finally:
+        _routing_state.reset(token)
+
+
+@contextmanager
+def read_from(target):
+    """블록 안의 읽기 대상을 'primary' 또는 'replica' 로 강제"""
+    state = get_routing_state()
+    previous = state.forced
+    state.forced = target
+    try:
+        yield
+    finally:
+        state.forced = previous
+
+
+def use_primary(view_func):
+    """뷰의 모든 읽기를 주 DB 로 보내는 데코레이터"""
+    view_func.invitations_read_from = 'primary'
+    return view_func
+
+
+def use_replica(view_func):
+    """뷰의 읽기를 (쓰기 고정 전까지) 복제본으로 보내는 데코레이터"""
+    view_func.invitations_read_from = 'replica'
+    return view_func
+
+
+class InvitationsRouter:
+    """invitations 앱 모델의 읽기를 복제본으로, 쓰기를 주 DB 로 라우팅"""
+    
+    def __init__(self):
+        self.config = get_router_config()
+        self.primary = self.config['PRIMARY']
+        self.replicas = list(self.config['REPLICAS'])
+        self.databases = {self.primary, *self.replicas}
+    
+    def db_for_read(self, model, **hints):
+        if model._meta.app_label != APP_LABEL:
+            return None
+        if not self.replicas:
+            return self.primary
+        
+        state = get_routing_state()
+        if state.pinned:
+            return self.primary
+        target = state.forced or self.config['MODELS'].get(model._meta.label_lower, self.config['DEFAULT_READ'])
+        if target == 'primary':
+            return self.primary
+        return random.choice(self.replicas)
+    
+    def db_for_write(self, model, **hints):
+        if model._meta.app_label != APP_LABEL:
+            return None
+        state = get_routing_state()
+        state.pinned = True
+        state.wrote = True
+        return self.primary
+    
+    def allow_relation(self, obj1, obj2, **hints):
+        if obj1._state.db in self.databases and obj2._state.db in self.databases:
+            return True
+        return None
+
+
+class ReplicaRoutingMiddleware:
+    """요청마다 라우팅 상태를 만들고 뷰별 읽기 대상/쓰기 후 고정을 적용하는 미들웨어"""
+    
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.config = get_router_config()
+    
+    def __call__(self, request):
+        cookie = self.config['PIN_COOKIE']
+        with routing_scope(pinned=cookie in request.COOKIES) as state:
+            response = self.get_response(request)
+            if state.wrote and self.config['PIN_SECONDS']:
+                response.set_cookie(cookie, '1', max_age=self.config['PIN_SECONDS'], httponly=True, samesite='Lax')
+        return response
+    
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        target = getattr(view_func, 'invitations_read_from', None)
+        if target is None and request.resolver_match:
+            target = self.config['VIEWS'].get(request.resolver_match.view_name)
+        if target:
+            get_routing_state().forced = target
+        return None
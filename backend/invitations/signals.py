@@ -0,0 +1,37 @@
+# invitations/signals.py
+"""
+초대 앱 시그널 핸들러
+"""
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import EvaluationInvitation, ParticipantPermission, PermissionTemplate, adjust_status_counters
+from .permission_registry import get_permission_registry
+from .permissions import get_permission_resolver
+
+
+@receiver([post_save, post_delete], sender=ParticipantPermission)
+def invalidate_permission_cache(sender, instance, using, **kwargs):
+    """권한 변경 시 캐시 무효화
+    
+    커밋 전에만 지우면 그 사이 다른 요청이 커밋된 이전 행을 읽어 TTL 동안 캐시하므로
+    커밋 후에 한 번 더 무효화한다. (즉시 무효화는 같은 트랜잭션 안의 이후 조회용)
+    """
+    resolver = get_permission_resolver()
+    user_id, project_id = instance.user_id, instance.project_id
+    resolver.invalidate(user_id, project_id)
+    transaction.on_commit(lambda: resolver.invalidate(user_id, project_id), using=using)
+
+
+@receiver(post_delete, sender=EvaluationInvitation)
+def decrement_status_counter(sender, instance, using, **kwargs):
+    """초대 삭제 시 상태 카운터 감소"""
+    adjust_status_counters(instance.project_id, {instance.status: -1}, using=using)
+
+
+@receiver([post_save, post_delete], sender=PermissionTemplate)
+def reload_permission_templates(sender, **kwargs):
+    """권한 템플릿 변경 시 레지스트리 갱신"""
+    transaction.on_commit(get_permission_registry().invalidate)
@@ -0,0 +1 @@
+# invitations/tests/__init__.py
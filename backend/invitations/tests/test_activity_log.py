@@ -0,0 +1,44 @@
+# invitations/tests/test_activity_log.py
+"""
+ActivityLogger flush 오류 처리 테스트
+"""
+
+from unittest import mock
+from django.db import OperationalError
+from django.test import TransactionTestCase
+
+from invitations import activity_log
+from invitations.activity_log import ActivityLogger
+from invitations.models import EvaluationInvitation, InvitationActivity
+from invitations.tests.test_models import InvitationTestMixin
+
+
+class ActivityLoggerFlushTests(InvitationTestMixin, TransactionTestCase):
+    
+    def setUp(self):
+        self.project = self.create_project()
+        self.kept, self.removed = self.invite(self.project, ['a@example.com', 'b@example.com'])
+        self.logger = ActivityLogger(max_buffer=100, flush_interval=60)
+    
+    def tearDown(self):
+        self.logger.stop_event.set()
+    
+    def test_rows_of_deleted_invitation_do_not_block_flush(self):
+        self.logger.log(self.kept, 'viewed')
+        self.logger.log(self.removed, 'viewed', actor_ip='127.0.0.1')
+        self.logger.log(self.kept, 'reminder_sent')
+        # 보관(archive_project)처럼 활동 로그와 초대 행을 직접 삭제
+        InvitationActivity.objects.filter(invitation=self.removed).delete()
+        EvaluationInvitation.objects.filter(pk=self.removed.pk)._raw_delete('default')
+        
+        self.assertEqual(self.logger.flush(), 2)
+        stats = self.logger.stats()
+        self.assertEqual((stats['buffered'], stats['rejected'], stats['lost']), (0, 1, 0))
+        self.assertEqual(InvitationActivity.objects.filter(invitation=self.kept, action__in=['viewed', 'reminder_sent']).count(), 2)
+    
+    def test_transient_error_requeues_rows(self):
+        self.logger.log(self.kept, 'viewed')
+        with mock.patch.object(activity_log, 'write_activities', side_effect=OperationalError('down')):
+            self.assertEqual(self.logger.flush(), 0)
+        self.assertEqual(self.logger.stats()['buffered'], 1)
+        self.assertEqual(self.logger.flush(), 1)
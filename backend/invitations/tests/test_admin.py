@@ -0,0 +1,86 @@
+# invitations/tests/test_admin.py
+"""
+목록 쿼리셋/관리자 목록 화면 쿼리 수 테스트 (행 수와 무관해야 함)
+"""
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from invitations.models import EvaluationInvitation, InvitationActivity, ParticipantPermission
+from invitations.tests.test_models import InvitationTestMixin
+
+
+class ListingQueryTestMixin(InvitationTestMixin):
+    """초대/권한/활동 로그 행을 count 개씩 추가"""
+    
+    def add_rows(self, count):
+        User = get_user_model()
+        start = ParticipantPermission.objects.count()
+        for index in range(start, start + count):
+            project = self.create_project(index)
+            invitation = self.invite(project, [f'user{index}@example.com'])[0]
+            user = User.objects.create(username=f'user-{index}', email=f'user{index}@example.com')
+            ParticipantPermission.objects.create(user=user, project=project, invitation=invitation, assigned_by=self.owner)
+            InvitationActivity.objects.create(invitation=invitation, action='viewed', actor=user)
+
+
+class ListingQuerySetTests(ListingQueryTestMixin, TestCase):
+    
+    def setUp(self):
+        self.add_rows(3)
+    
+    def test_invitation_listing(self):
+        with self.assertNumQueries(1):
+            rows = [(str(invitation), invitation.status) for invitation in EvaluationInvitation.objects.for_listing()]
+        self.assertEqual(len(rows), 3)
+        with self.assertNumQueries(1):
+            rows = [(str(invitation), invitation.inviter.email) for invitation in EvaluationInvitation.objects.with_related()]
+        self.assertEqual(len(rows), 3)
+    
+    def test_permission_listing(self):
+        with self.assertNumQueries(1):
+            rows = [str(permission) for permission in ParticipantPermission.objects.for_listing()]
+        self.assertEqual(len(rows), 3)
+        with self.assertNumQueries(1):
+            rows = [
+                (str(permission), permission.assigned_by.email)
+                for permission in ParticipantPermission.objects.with_related()
+            ]
+        self.assertEqual(len(rows), 3)
+    
+    def test_activity_listing(self):
+        activities = InvitationActivity.objects.filter(action='viewed')
+        with self.assertNumQueries(1):
+            rows = [
+                (activity.invitation.invitee_email, activity.invitation.project_id)
+                for activity in activities.for_listing()
+            ]
+        self.assertEqual(len(rows), 3)
+        with self.assertNumQueries(1):
+            rows = [(str(activity), activity.actor.email) for activity in activities.with_related()]
+        self.assertEqual(len(rows), 3)
+
+
+@override_settings(ROOT_URLCONF='invitations.tests.urls')
+class AdminChangelistQueryTests(ListingQueryTestMixin, TestCase):
+    
+    def setUp(self):
+        admin_user = get_user_model().objects.create_superuser('admin', 'admin@example.com', 'password')
+        self.client.force_login(admin_user)
+    
+    def changelist_queries(self, model):
+        url = reverse(f'admin:invitations_{model._meta.model_name}_changelist')
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return len(context.captured_queries)
+    
+    def test_changelist_queries_do_not_grow_with_rows(self):
+        models = [EvaluationInvitation, ParticipantPermission, InvitationActivity]
+        self.add_rows(2)
+        baseline = [self.changelist_queries(model) for model in models]
+        self.add_rows(5)
+        self.assertEqual([self.changelist_queries(model) for model in models], baseline)
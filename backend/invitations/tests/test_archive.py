@@ -0,0 +1,38 @@
+# invitations/tests/test_archive.py
+"""
+프로젝트 초대 보관 테스트
+"""
+
+from unittest import mock
+from django.db.models import QuerySet
+from django.test import TestCase
+
+from invitations.archive import archive_project
+from invitations.counters import reconcile_status_counters
+from invitations.models import ArchivedInvitation, EvaluationInvitation
+from invitations.tests.test_models import InvitationTestMixin
+
+
+class ArchiveProjectTests(InvitationTestMixin, TestCase):
+    
+    def setUp(self):
+        self.project = self.create_project()
+        invitations = self.invite(self.project, ['a@example.com', 'b@example.com'])
+        for invitation in invitations:
+            invitation.transition_to('rejected')
+    
+    def test_pending_created_after_check_aborts_archive(self):
+        pending = self.invite(self.project, ['late@example.com'])[0]
+        # 사전 확인 이후 대기 초대가 생긴 상황
+        with mock.patch.object(QuerySet, 'exists', return_value=False):
+            with self.assertRaises(ValueError):
+                archive_project(self.project.pk, batch_size=10)
+        
+        self.assertTrue(EvaluationInvitation.objects.filter(pk=pending.pk, status='pending').exists())
+        self.assertFalse(ArchivedInvitation.objects.filter(project=self.project).exists())
+        self.assertEqual(reconcile_status_counters([self.project.pk]), [])
+    
+    def test_archive_without_pending(self):
+        stats = archive_project(self.project.pk)
+        self.assertEqual(stats['invitations'], 2)
+        self.assertEqual(reconcile_status_counters([self.project.pk]), [])
@@ -0,0 +1,27 @@
+# invitations/tests/test_bulk_copy.py
+"""
+COPY 일괄 삽입 값 보존 테스트
+"""
+
+from unittest import skipUnless
+from django.db import connection
+from django.test import TestCase
+
+from invitations.models import EvaluationInvitation
+from invitations.tests.test_models import InvitationTestMixin
+
+
+@skipUnless(connection.vendor == 'postgresql', 'COPY 경로는 PostgreSQL 전용')
+class CopyInstancesTests(InvitationTestMixin, TestCase):
+    
+    def test_text_values_are_not_read_as_null(self):
+        project = self.create_project()
+        names = [r'\N', '', 'a,"b"', '줄\n바꿈']
+        invitations = self.invite(project, [(f'user{i}@example.com', name) for i, name in enumerate(names)])
+        
+        stored = dict(EvaluationInvitation.objects.filter(
+            pk__in=[invitation.pk for invitation in invitations]
+        ).values_list('invitee_email', 'invitee_name'))
+        self.assertEqual([stored[f'user{i}@example.com'] for i in range(len(names))], names)
+        # NULL 허용 컬럼은 그대로 NULL
+        self.assertTrue(EvaluationInvitation.objects.filter(pk=invitations[0].pk, accepted_at__isnull=True).exists())
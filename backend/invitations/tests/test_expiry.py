@@ -0,0 +1,47 @@
+# invitations/tests/test_expiry.py
+"""
+대기중 초대 만료 처리 테스트
+"""
+
+from datetime import timedelta
+from unittest import mock
+from django.db.models import QuerySet
+from django.test import TestCase
+from django.utils import timezone
+
+from invitations.counters import reconcile_status_counters
+from invitations.expiry import expire_pending_invitations
+from invitations.models import EvaluationInvitation
+from invitations.tests.test_models import InvitationTestMixin
+
+
+class ExpirePendingInvitationsTests(InvitationTestMixin, TestCase):
+    
+    def setUp(self):
+        self.project = self.create_project()
+        self.invitations = self.invite(self.project, ['a@example.com', 'b@example.com', 'c@example.com'])
+        self.now = timezone.now() + timedelta(days=365)
+    
+    def test_rows_skipped_by_lock_are_retried(self):
+        select_for_update = QuerySet.select_for_update
+        locked = self.invitations[0]
+        calls = []
+        
+        def skip_locked_once(queryset, *args, **kwargs):
+            # 첫 배치에서는 다른 실행이 잠근 것처럼 건너뜀
+            calls.append(True)
+            if len(calls) == 1:
+                queryset = queryset.exclude(pk=locked.pk)
+            return select_for_update(queryset, *args, **kwargs)
+        
+        with mock.patch.object(QuerySet, 'select_for_update', skip_locked_once):
+            stats = expire_pending_invitations(batch_size=10, now=self.now)
+        
+        self.assertEqual(stats['expired'], 3)
+        self.assertFalse(EvaluationInvitation.objects.filter(project=self.project, status='pending').exists())
+        self.assertEqual(reconcile_status_counters([self.project.pk]), [])
+    
+    def test_not_yet_expired_rows_are_kept(self):
+        stats = expire_pending_invitations(batch_size=1, now=timezone.now())
+        self.assertEqual(stats['expired'], 0)
+        self.assertEqual(EvaluationInvitation.objects.filter(project=self.project, status='pending').count(), 3)
@@ -0,0 +1,104 @@
+# invitations/tests/test_models.py
+"""
+EvaluationInvitation 상태 스냅샷/카운터 테스트
+"""
+
+from django.apps import apps
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+
+from invitations.benchmarks import project_kwargs
+from invitations.counters import reconcile_status_counters
+from invitations.models import EvaluationInvitation, InvitationStatusCounter, adjust_status_counters
+
+
+class InvitationTestMixin:
+    """프로젝트 1개와 대기 초대 생성"""
+    
+    def create_project(self, index=0):
+        Project = apps.get_model('projects', 'Project')
+        self.owner = get_user_model().objects.create(username=f'owner-{index}', email=f'owner-{index}@example.com')
+        return Project.objects.create(**project_kwargs(f'test-{index}', self.owner))
+    
+    def invite(self, project, emails):
+        results = EvaluationInvitation.objects.bulk_invite(project, emails, inviter=self.owner)
+        return [result['invitation'] for result in results]
+
+
+class StatusSnapshotTests(InvitationTestMixin, TestCase):
+    
+    def setUp(self):
+        self.project = self.create_project()
+        self.invitation = self.invite(self.project, ['a@example.com'])[0]
+    
+    def test_refresh_then_save_does_not_repeat_transition(self):
+        stale = EvaluationInvitation.objects.get(pk=self.invitation.pk)
+        other = EvaluationInvitation.objects.get(pk=self.invitation.pk)
+        self.assertTrue(other.transition_to('accepted'))
+        accepted_at = EvaluationInvitation.objects.get(pk=self.invitation.pk).accepted_at
+        
+        stale.refresh_from_db()
+        self.assertEqual(stale._loaded_status, 'accepted')
+        stale.custom_message = '변경'
+        stale.save()
+        
+        self.assertEqual(EvaluationInvitation.objects.get(pk=self.invitation.pk).accepted_at, accepted_at)
+        counts = InvitationStatusCounter.objects.for_project(self.project)
+        self.assertEqual((counts['pending'], counts['accepted']), (0, 1))
+        self.assertEqual(reconcile_status_counters([self.project.pk]), [])
+    
+    def test_refresh_deferred_status(self):
+        invitation = EvaluationInvitation.objects.defer('status').get(pk=self.invitation.pk)
+        self.assertIsNone(invitation._loaded_status)
+        self.assertEqual(invitation.status, 'pending')
+        self.assertEqual(invitation._loaded_status, 'pending')
+    
+    def test_save_status_change_adjusts_counters_once(self):
+        invitation = EvaluationInvitation.objects.get(pk=self.invitation.pk)
+        invitation.status = 'rejected'
+        invitation.save()
+        
+        invitation = EvaluationInvitation.objects.get(pk=self.invitation.pk)
+        self.assertIsNotNone(invitation.rejected_at)
+        self.assertEqual(reconcile_status_counters([self.project.pk]), [])
+    
+    def test_saves_from_same_snapshot_adjust_counters_once(self):
+        first = EvaluationInvitation.objects.get(pk=self.invitation.pk)
+        second = EvaluationInvitation.objects.get(pk=self.invitation.pk)
+        first.status = second.status = 'rejected'
+        first.save()
+        rejected_at = EvaluationInvitation.objects.get(pk=self.invitation.pk).rejected_at
+        second.save()
+        
+        self.assertEqual(EvaluationInvitation.objects.get(pk=self.invitation.pk).rejected_at, rejected_at)
+        self.assertEqual(reconcile_status_counters([self.project.pk]), [])
+    
+    def test_save_status_change_query_count(self):
+        invitation = EvaluationInvitation.objects.get(pk=self.invitation.pk)
+        invitation.status = 'revoked'
+        # SAVEPOINT, 행 잠금 조회, UPDATE, 카운터 감소/증가 각 1문장, RELEASE
+        with self.assertNumQueries(6):
+            invitation.save()
+        
+        invitation.custom_message = '상태 변경 없음'
+        # SAVEPOINT, UPDATE, RELEASE
+        with self.assertNumQueries(3):
+            invitation.save()
+
+
+class StatusCounterTests(InvitationTestMixin, TestCase):
+    
+    def setUp(self):
+        self.project = self.create_project()
+    
+    def test_adjust_uses_one_statement_per_status(self):
+        with self.assertNumQueries(2):
+            adjust_status_counters(self.project.pk, {'pending': 3, 'accepted': 2})
+        with self.assertNumQueries(2):
+            adjust_status_counters(self.project.pk, {'pending': -1, 'accepted': 1})
+        counts = InvitationStatusCounter.objects.for_project(self.project)
+        self.assertEqual((counts['pending'], counts['accepted']), (2, 3))
+    
+    def test_decrement_without_rows_is_ignored(self):
+        adjust_status_counters(self.project.pk, {'expired': -1})
+        self.assertFalse(InvitationStatusCounter.objects.filter(project=self.project).exists())
@@ -0,0 +1,61 @@
+# invitations/tests/test_reminders.py
+"""
+리마인더 일괄 발송 선점/복구 테스트
+"""
+
+from unittest import mock
+from django.core import mail
+from django.test import TestCase
+from django.utils import timezone
+
+from invitations.models import EvaluationInvitation, InvitationActivity
+from invitations.reminders import ReminderSender, send_due_reminders
+from invitations.tests.test_models import InvitationTestMixin
+
+
+class SendDueRemindersTests(InvitationTestMixin, TestCase):
+    
+    def setUp(self):
+        self.project = self.create_project()
+        self.invitation = self.invite(self.project, ['a@example.com'])[0]
+        self.now = timezone.now()
+    
+    def test_sent_once_and_counted_once(self):
+        stats = send_due_reminders(now=self.now, workers=1, rate_limit=0)
+        self.assertEqual((stats['eligible'], stats['sent']), (1, 1))
+        # 같은 시각으로 다시 실행해도 이미 발송한 초대는 대상이 아님
+        stats = send_due_reminders(now=self.now, workers=1, rate_limit=0)
+        self.assertEqual(stats['eligible'], 0)
+        
+        invitation = EvaluationInvitation.objects.get(pk=self.invitation.pk)
+        self.assertEqual((invitation.reminder_count, invitation.last_reminder_at), (1, self.now))
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(InvitationActivity.objects.filter(invitation=invitation, action='reminder_sent').count(), 1)
+    
+    def test_overlapping_run_skips_claimed_invitations(self):
+        send_all = ReminderSender.send_all
+        started = []
+        overlapping = {}
+        
+        def send_all_with_overlap(sender, invitations, base_url, on_sent=None):
+            # 첫 실행의 발송 도중 두 번째 실행이 시작된 상황
+            if not started:
+                started.append(True)
+                overlapping.update(send_due_reminders(now=self.now, workers=1, rate_limit=0))
+            return send_all(sender, invitations, base_url, on_sent)
+        
+        with mock.patch.object(ReminderSender, 'send_all', send_all_with_overlap):
+            stats = send_due_reminders(now=self.now, workers=1, rate_limit=0)
+        self.assertEqual(stats['sent'], 1)
+        self.assertEqual(overlapping['eligible'], 0)
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(EvaluationInvitation.objects.get(pk=self.invitation.pk).reminder_count, 1)
+    
+    def test_failed_send_releases_claim(self):
+        with mock.patch.object(ReminderSender, 'send_one', return_value=None):
+            stats = send_due_reminders(now=self.now, workers=1, rate_limit=0)
+        self.assertEqual((stats['eligible'], stats['failed']), (1, 1))
+        
+        invitation = EvaluationInvitation.objects.get(pk=self.invitation.pk)
+        self.assertEqual((invitation.reminder_count, invitation.last_reminder_at), (0, None))
+        self.assertEqual(send_due_reminders(now=self.now, workers=1, rate_limit=0)['sent'], 1)
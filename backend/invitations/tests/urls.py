@@ -0,0 +1,11 @@
+# invitations/tests/urls.py
+"""
+관리자 화면 테스트용 URL 설정
+"""
+
+from django.contrib import admin
+from django.urls import path
+
+urlpatterns = [
+    path('admin/', admin.site.urls)
+]
@@ -0,0 +1,10 @@
+# invitations/urls.py
+from django.urls import path
+
+from . import views
+
+app_name = 'invitations'
+
+urlpatterns = [
+    path('me/', views.my_invitations, name='my-invitations')
+]
@@ -0,0 +1,50 @@
+# invitations/views.py
+"""
+초대 API 뷰
+"""
+
+from django.contrib.auth.decorators import login_required
+from django.http import JsonResponse
+from django.views.decorators.http import require_GET
+
+from .models import EvaluationInvitation
+from .pagination import keyset_paginate
+
+# 초대함 페이지 크기 상한
+MAX_INBOX_LIMIT = 100
+
+
+@login_required
+@require_GET
+def my_invitations(request):
+    """로그인 사용자의 이메일로 받은 수락 가능한 초대 목록 (키셋 페이지네이션)
+    
+    GET ?cursor=<next_cursor>&limit=<n>
+    """
+    try:
+        limit = min(max(int(request.GET.get('limit', 20)), 1), MAX_INBOX_LIMIT)
+    except ValueError:
+        limit = 20
+    
+    invitations, next_cursor = keyset_paginate(
+        EvaluationInvitation.objects.inbox_for(request.user.email),
+        field='created_at',
+        cursor=request.GET.get('cursor'),
+        limit=limit
+    )
+    return JsonResponse({
+        'results': [
+            {
+                'id': str(invitation.pk),
+                'project_id': invitation.project_id,
+                'project_name': invitation.project.name,
+                'role': invitation.role,
+                'invitee_name': invitation.invitee_name,
+                'custom_message': invitation.custom_message,
+                'expires_at': invitation.expires_at.isoformat(),
+                'created_at': invitation.created_at.isoformat()
+            }
+            for invitation in invitations
+        ],
+        'next_cursor': next_cursor
+    })
@@ -0,0 +1,528 @@
+# invitations/workload.py
+"""
+합성 워크로드 생성 및 재생 (로컬에서 운영 부하 재현)
+
+populate 는 프로젝트/초대/권한/활동 로그를 운영과 비슷한 분포로 만든다.
+프로젝트 규모는 로그정규 분포, 상태는 STATUS_MIX 비율을 따르고 생성 시각은 최근 쪽으로 치우친다.
+큰 테이블(초대, 권한, 활동)은 PostgreSQL 에서 COPY 로 일괄 삽입하고(그 외 bulk_create)
+상태 카운터는 생성한 분포로 직접 계산해 넣는다.
+replay 는 혼합 트래픽 프로필(초대/목록/초대함/수락/리마인더/만료/권한 확인)을 동시 스레드로 실행하고
+작업별 처리량과 지연 히스토그램을 기록한다. 결과 JSON 을 compare_reports 로 비교해 변경 전후를 확인한다.
+"""
+
+import math
+import random
+import threading
+import time
+from collections import deque
+from datetime import timedelta
+from django.apps import apps
+from django.contrib.auth import get_user_model
+from django.db import connection, connections, transaction
+from django.utils import timezone
+
+from .acceptance import accept_invitation
+from .archive import insert_preserving_timestamps
+from .benchmarks import percentile, project_kwargs
+from .expiry import expire_pending_invitations
+from .models import (
+    DEFAULT_INVITATION_TTL,
+    EvaluationInvitation,
+    InvitationActivity,
+    InvitationStatusCounter,
+    ParticipantPermission,
+    mint_invitation_token,
+    normalize_email,
+    store_plaintext_tokens
+)
+from .pagination import keyset_paginate
+from .partitions import create_partition, is_partitioned, month_start
+from .permission_registry import get_permission_registry
+from .permissions import get_permission_resolver
+from .reminders import send_due_reminders
+
+WORKLOAD_PREFIX = 'load'
+
+# 생성 데이터 분포
+STATUS_MIX = {'pending': 0.35, 'accepted': 0.40, 'rejected': 0.05, 'expired': 0.15, 'revoked': 0.05}
+ROLE_MIX = {'evaluator': 0.80, 'viewer': 0.15, 'admin': 0.05}
+HISTORY_DAYS = 180
+RECENT_DAYS = 30             # 생성 시각 지수 분포의 평균(일)
+REGISTERED_RATIO = 0.6       # 가입한 사용자 이메일로 보낸 초대 비율
+OVERDUE_PENDING_RATIO = 0.05 # 만료 시각이 지났지만 아직 pending 인 초대 비율 (만료 작업 대상)
+LOAD_CHUNK_SIZE = 5000
+
+# 재생 트래픽 프로필 (작업별 가중치)
+DEFAULT_TRAFFIC_PROFILE = {
+    'view': 30,
+    'inbox': 15,
+    'permission_check': 30,
+    'invite': 10,
+    'accept': 10,
+    'remind': 3,
+    'expire': 2
+}
+REPLAY_TOKEN_SAMPLE = 5000
+REMIND_BATCH_SIZE = 20
+EXPIRE_BATCH_SIZE = 100
+
+# 지연 히스토그램 구간 상한(ms)
+HISTOGRAM_BOUNDS_MS = (0.5, 1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000)
+
+# 리마인더 재생 시 실제 메일을 보내지 않음
+DUMMY_MAIL_BACKEND = 'django.core.mail.backends.dummy.EmailBackend'
+
+
+class WorkloadState:
+    """재생에 필요한 생성 데이터 참조 (id 와 토큰만 보관)"""
+    
+    def __init__(self, owner_id, project_ids, users, tokens, permission_keys):
+        self.owner_id = owner_id
+        self.project_ids = project_ids
+        self.users = users                      # [(user_id, email)]
+        self.tokens = deque(tokens)             # [(raw_token, email)] 수락 대상
+        self.permission_keys = permission_keys  # [(user_id, project_id)]
+        self.user_ids = {normalize_email(email): user_id for user_id, email in users}
+
+
+def weighted_choice(rng, weights):
+    return rng.choices(list(weights), weights=list(weights.values()))[0]
+
+
+def parse_profile(value):
+    """'view=30,accept=10' 형식의 트래픽 프로필 파싱"""
+    if not value:
+        return dict(DEFAULT_TRAFFIC_PROFILE)
+    profile = {}
+    for item in value.split(','):
+        name, _, weight = item.partition('=')
+        name = name.strip()
+        if name not in OPERATIONS:
+            raise ValueError(f'알 수 없는 작업입니다: {name} (가능: {", ".join(OPERATIONS)})')
+        profile[name] = float(weight or 1)
+    return profile
+
+
+def project_sizes(projects, mean_invitations, rng):
+    """로그정규 분포 프로젝트 규모 (평균 mean_invitations, 소수의 큰 프로젝트)"""
+    sigma = 1.0
+    return [
+        max(1, int(mean_invitations * rng.lognormvariate(0, sigma) / math.exp(sigma ** 2 / 2)))
+        for _ in range(projects)
+    ]
+
+
+def ensure_activity_partitions(start, end, using):
+    """활동 테이블이 파티션 테이블이면 start~end 월 파티션 생성"""
+    if connections[using].vendor != 'postgresql' or not is_partitioned(using):
+        return
+    month = month_start(start)
+    with connections[using].cursor() as cursor:
+        while month <= end:
+            create_partition(cursor, month)
+            month = month_start(month + timedelta(days=32))
+
+
+def populate(projects=20, invitations=2000, users=5000, activities=2, seed=None,
+             prefix=WORKLOAD_PREFIX, progress=None):
+    """합성 데이터 생성, WorkloadState 반환
+    
+    invitations 는 프로젝트당 평균 초대 수, activities 는 초대당 평균 열람 로그 수.
+    """
+    rng = random.Random(seed)
+    User = get_user_model()
+    Project = apps.get_model('projects', 'Project')
+    using = 'default'
+    now = timezone.now()
+    run_id = f'{prefix}-{int(time.time())}'
+    registry = get_permission_registry()
+    store_token = store_plaintext_tokens()
+    ensure_activity_partitions(now - timedelta(days=HISTORY_DAYS + 7), now, using)
+    
+    owner = User.objects.create(**{
+        User.USERNAME_FIELD: f'{run_id}-owner@example.com',
+        'email': f'{run_id}-owner@example.com'
+    })
+    user_list = []
+    for start in range(0, users, LOAD_CHUNK_SIZE):
+        user_list += User.objects.bulk_create([
+            User(**{User.USERNAME_FIELD: f'{run_id}-user-{i}@example.com',
+                    'email': f'{run_id}-user-{i}@example.com', 'password': '!'})
+            for i in range(start, min(start + LOAD_CHUNK_SIZE, users))
+        ])
+    if not user_list or user_list[0].pk is None:
+        # pk 를 돌려주지 않는 DB
+        user_list = list(User.objects.filter(email__startswith=f'{run_id}-user-').order_by('pk'))
+    project_list = Project.objects.bulk_create([
+        Project(**project_kwargs(f'{run_id}-{i}', owner)) for i in range(projects)
+    ])
+    if project_list and project_list[0].pk is None:
+        project_list = list(
+            Project.objects.filter(name__startswith=project_kwargs(f'{run_id}-', owner)['name']).order_by('pk')
+        )
+    
+    statuses, status_weights = list(STATUS_MIX), list(STATUS_MIX.values())
+    roles, role_weights = list(ROLE_MIX), list(ROLE_MIX.values())
+    tokens = []
+    permission_keys = []
+    stats = {'invitations': 0, 'activities': 0, 'permissions': 0}
+    
+    def recent(max_days):
+        return now - timedelta(days=min(rng.expovariate(1 / RECENT_DAYS), max_days))
+    
+    for project, size in zip(project_list, project_sizes(projects, invitations, rng)):
+        # 가입 사용자 초대는 프로젝트 안에서 중복되지 않게 표본 추출
+        members = rng.sample(user_list, min(int(size * REGISTERED_RATIO), len(user_list)))
+        counts = {}
+        for start in range(0, size, LOAD_CHUNK_SIZE):
+            batch, batch_activities, batch_permissions = [], [], []
+            for index in range(start, min(start + LOAD_CHUNK_SIZE, size)):
+                user = members[index] if index < len(members) else None
+                email = user.email if user else f'{run_id}-guest-{project.pk}-{index}@example.com'
+                status = rng.choices(statuses, status_weights)[0]
+                role = rng.choices(roles, role_weights)[0]
+                if status == 'pending':
+                    if rng.random() < OVERDUE_PENDING_RATIO:
+                        created_at = now - DEFAULT_INVITATION_TTL - timedelta(hours=rng.uniform(1, 72))
+                    else:
+                        created_at = now - timedelta(seconds=rng.uniform(0, DEFAULT_INVITATION_TTL.total_seconds()))
+                else:
+                    created_at = recent(HISTORY_DAYS)
+                decided_at = min(created_at + timedelta(hours=rng.uniform(0.1, 72)), now)
+                token, token_hash = mint_invitation_token()
+                reminders = rng.randint(0, 2) if status == 'pending' else 0
+                invitation = EvaluationInvitation(
+                    project_id=project.pk,
+                    inviter_id=owner.pk,
+                    invitee_email=email,
+                    invitee_email_normalized=normalize_email(email),
+                    token=token if store_token else None,
+                    token_hash=token_hash,
+                    role=role,
+                    status=status,
+                    expires_at=created_at + DEFAULT_INVITATION_TTL,
+                    reminder_count=reminders,
+                    last_reminder_at=created_at + timedelta(days=reminders) if reminders else None,
+                    created_at=created_at,
+                    accepted_at=decided_at if status == 'accepted' else None,
+                    rejected_at=decided_at if status == 'rejected' else None,
+                    revoked_at=decided_at if status == 'revoked' else None
+                )
+                batch.append(invitation)
+                counts[status] = counts.get(status, 0) + 1
+                if status == 'pending' and invitation.expires_at > now:
+                    tokens.append((token, email))
+                
+                # created → sent → 열람 N 회 → (종료 상태)
+                views = min(int(rng.expovariate(1 / activities)), 20) if activities else 0
+                actions = ['created', 'sent'] + ['viewed'] * views
+                if status != 'pending':
+                    actions.append(status)
+                for offset, action in enumerate(actions):
+                    batch_activities.append(InvitationActivity(
+                        invitation_id=invitation.pk,
+                        action=action,
+                        actor_id=user.pk if user and action in ('viewed', 'accepted', 'rejected') else None,
+                        metadata={},
+                        created_at=min(created_at + timedelta(minutes=offset * rng.uniform(1, 600)), now)
+                    ))
+                
+                if status == 'accepted' and user:
+                    batch_permissions.append(ParticipantPermission(
+                        user_id=user.pk,
+                        project_id=project.pk,
+                        invitation_id=invitation.pk,
+                        role=role,
+                        assigned_by_id=owner.pk,
+                        created_at=decided_at,
+                        updated_at=decided_at,
+                        **registry.get(role).field_values
+                    ))
+                    permission_keys.append((user.pk, project.pk))
+            
+            # 생성 시각 분포를 유지하도록 auto_now_add 값을 그대로 삽입 (PostgreSQL 은 COPY)
+            with transaction.atomic(using=using):
+                insert_preserving_timestamps(EvaluationInvitation, batch, using)
+                insert_preserving_timestamps(InvitationActivity, batch_activities, using)
+                if batch_permissions:
+                    insert_preserving_timestamps(ParticipantPermission, batch_permissions, using)
+            stats['invitations'] += len(batch)
+            stats['activities'] += len(batch_activities)
+            stats['permissions'] += len(batch_permissions)
+            if progress:
+                progress(stats)
+        
+        # 삽입 경로가 카운터를 거치지 않으므로 생성한 분포로 직접 기록
+        InvitationStatusCounter.objects.bulk_create([
+            InvitationStatusCounter(project_id=project.pk, status=status, shard=0, count=count)
+            for status, count in counts.items()
+        ])
+    
+    rng.shuffle(tokens)
+    return WorkloadState(
+        owner.pk,
+        [project.pk for project in project_list],
+        [(user.pk, user.email) for user in user_list],
+        tokens[:REPLAY_TOKEN_SAMPLE],
+        permission_keys
+    )
+
+
+def load_state(prefix=WORKLOAD_PREFIX, token_sample=REPLAY_TOKEN_SAMPLE):
+    """이전에 populate 한 데이터로 WorkloadState 구성
+    
+    평문 토큰이 저장되지 않으므로 수락 대상 대기 초대 일부에 토큰을 다시 발급한다.
+    """
+    User = get_user_model()
+    owner = User.objects.filter(email__startswith=f'{prefix}-', email__endswith='-owner@example.com') \
+        .order_by('-pk').first()
+    if owner is None:
+        raise ValueError(f"'{prefix}' 워크로드 데이터가 없습니다. 먼저 populate 하세요")
+    run_id = owner.email[:-len('-owner@example.com')]
+    project_ids = list(
+        EvaluationInvitation.objects.filter(inviter=owner).order_by('project_id')
+        .values_list('project_id', flat=True).distinct()
+    )
+    users = list(User.objects.filter(email__startswith=f'{run_id}-user-').order_by('pk').values_list('pk', 'email'))
+    
+    pending = list(
+        EvaluationInvitation.objects.filter(project_id__in=project_ids, status='pending', expires_at__gt=timezone.now())
+        .order_by('?')
+        .only('pk', 'invitee_email')[:token_sample]
+    )
+    for invitation in pending:
+        invitation.issue_token()
+    EvaluationInvitation.objects.bulk_update(pending, ['token', 'token_hash'], batch_size=1000)
+    permission_keys = list(
+        ParticipantPermission.objects.filter(project_id__in=project_ids).values_list('user_id', 'project_id')
+    )
+    return WorkloadState(
+        owner.pk,
+        project_ids,
+        users,
+        [(invitation.raw_token, invitation.invitee_email) for invitation in pending],
+        permission_keys
+    )
+
+
+def cleanup(prefix=WORKLOAD_PREFIX):
+    """생성한 워크로드 데이터 삭제 (프로젝트 삭제로 초대/권한/활동 연쇄 삭제)"""
+    User = get_user_model()
+    Project = apps.get_model('projects', 'Project')
+    owners = User.objects.filter(email__startswith=f'{prefix}-', email__endswith='-owner@example.com')
+    run_ids = [email[:-len('-owner@example.com')] for email in owners.values_list('email', flat=True)]
+    project_ids = list(
+        EvaluationInvitation.objects.filter(inviter__in=owners).order_by()
+        .values_list('project_id', flat=True).distinct()
+    )
+    Project.objects.filter(pk__in=project_ids).delete()
+    for run_id in run_ids:
+        User.objects.filter(email__startswith=f'{run_id}-').delete()
+    return len(project_ids)
+
+
+class OperationContext:
+    """재생 작업에 전달되는 스레드별 컨텍스트"""
+    
+    def __init__(self, state, rng, thread_index):
+        self.state = state
+        self.rng = rng
+        self.thread_index = thread_index
+        self.sequence = 0
+
+
+def op_view(ctx):
+    project_id = ctx.rng.choice(ctx.state.project_ids)
+    items, _ = keyset_paginate(EvaluationInvitation.objects.filter(project_id=project_id).for_listing(), limit=50)
+    return len(items)
+
+
+def op_inbox(ctx):
+    _, email = ctx.rng.choice(ctx.state.users)
+    items, _ = keyset_paginate(EvaluationInvitation.objects.inbox_for(email), limit=20)
+    return len(items)
+
+
+def op_permission_check(ctx):
+    if not ctx.state.permission_keys:
+        return None
+    user_id, project_id = ctx.rng.choice(ctx.state.permission_keys)
+    return get_permission_resolver().has_permission(user_id, project_id, 'can_view_results')
+
+
+def op_invite(ctx):
+    ctx.sequence += 1
+    return EvaluationInvitation.objects.create(
+        project_id=ctx.rng.choice(ctx.state.project_ids),
+        inviter_id=ctx.state.owner_id,
+        invitee_email=f'{WORKLOAD_PREFIX}-replay-{ctx.thread_index}-{ctx.sequence}-{time.time_ns()}@example.com'
+    )
+
+
+def op_accept(ctx):
+    try:
+        raw_token, email = ctx.state.tokens.popleft()
+    except IndexError:
+        return None
+    user_id = ctx.state.user_ids.get(normalize_email(email)) or ctx.rng.choice(ctx.state.users)[0]
+    return accept_invitation(raw_token, get_user_model()(pk=user_id), actor_ip='127.0.0.1').status
+
+
+def op_remind(ctx):
+    return send_due_reminders(
+        batch_size=REMIND_BATCH_SIZE,
+        workers=1,
+        rate_limit=0,
+        connection_kwargs={'backend': DUMMY_MAIL_BACKEND},
+        max_batches=1
+    )['sent']
+
+
+def op_expire(ctx):
+    return expire_pending_invitations(batch_size=EXPIRE_BATCH_SIZE, time_budget=0.5)['expired']
+
+
+OPERATIONS = {
+    'view': op_view,
+    'inbox': op_inbox,
+    'permission_check': op_permission_check,
+    'invite': op_invite,
+    'accept': op_accept,
+    'remind': op_remind,
+    'expire': op_expire
+}
+
+
+class LatencyHistogram:
+    """작업별 지연 히스토그램 (HISTOGRAM_BOUNDS_MS 구간) 과 원시 표본"""
+    
+    def __init__(self):
+        self.buckets = [0] * (len(HISTOGRAM_BOUNDS_MS) + 1)
+        self.samples = []
+        self.errors = 0
+        self.skipped = 0
+    
+    def record(self, elapsed_ms):
+        self.samples.append(elapsed_ms)
+        for index, bound in enumerate(HISTOGRAM_BOUNDS_MS):
+            if elapsed_ms <= bound:
+                self.buckets[index] += 1
+                return
+        self.buckets[-1] += 1
+    
+    def merge(self, other):
+        self.buckets = [a + b for a, b in zip(self.buckets, other.buckets)]
+        self.samples += other.samples
+        self.errors += other.errors
+        self.skipped += other.skipped
+    
+    def summary(self, elapsed):
+        samples = self.samples
+        labels = [f'<={bound}ms' for bound in HISTOGRAM_BOUNDS_MS] + [f'>{HISTOGRAM_BOUNDS_MS[-1]}ms']
+        return {
+            'count': len(samples),
+            'errors': self.errors,
+            'skipped': self.skipped,
+            'throughput_ops': len(samples) / elapsed if elapsed else 0.0,
+            'mean_ms': sum(samples) / len(samples) if samples else 0.0,
+            'p50_ms': percentile(samples, 0.50) if samples else 0.0,
+            'p95_ms': percentile(samples, 0.95) if samples else 0.0,
+            'p99_ms': percentile(samples, 0.99) if samples else 0.0,
+            'max_ms': max(samples) if samples else 0.0,
+            'histogram': {label: count for label, count in zip(labels, self.buckets) if count}
+        }
+
+
+def replay(state, profile=None, concurrency=8, duration=30.0, operations=None, seed=None):
+    """트래픽 프로필을 concurrency 스레드로 재생, 작업별 결과와 전체 처리량 반환
+    
+    duration(초)이 지나거나 전체 작업 수가 operations 에 도달하면 멈춘다.
+    수락할 토큰이 떨어진 accept 는 skipped 로 집계한다.
+    """
+    profile = profile or dict(DEFAULT_TRAFFIC_PROFILE)
+    remaining = [operations if operations is not None else float('inf')]
+    lock = threading.Lock()
+    histograms = []
+    errors = {}
+    start_barrier = threading.Barrier(concurrency + 1)
+    
+    def take():
+        with lock:
+            if remaining[0] <= 0:
+                return False
+            remaining[0] -= 1
+            return True
+    
+    def worker(thread_index):
+        rng = random.Random(None if seed is None else seed + thread_index)
+        ctx = OperationContext(state, rng, thread_index)
+        local = {name: LatencyHistogram() for name in profile}
+        start_barrier.wait()
+        deadline = time.perf_counter() + duration
+        try:
+            while time.perf_counter() < deadline and take():
+                name = weighted_choice(rng, profile)
+                histogram = local[name]
+                started = time.perf_counter()
+                try:
+                    result = OPERATIONS[name](ctx)
+                except Exception as e:
+                    histogram.errors += 1
+                    with lock:
+                        key = f'{name}: {type(e).__name__}: {e}'[:200]
+                        errors[key] = errors.get(key, 0) + 1
+                    continue
+                if result is None:
+                    histogram.skipped += 1
+                    continue
+                histogram.record((time.perf_counter() - started) * 1000)
+        finally:
+            connection.close()
+            with lock:
+                histograms.append(local)
+    
+    threads = [threading.Thread(target=worker, args=(index,)) for index in range(concurrency)]
+    for thread in threads:
+        thread.start()
+    start_barrier.wait()
+    started = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+    
+    merged = {name: LatencyHistogram() for name in profile}
+    for local in histograms:
+        for name, histogram in local.items():
+            merged[name].merge(histogram)
+    results = {name: histogram.summary(elapsed) for name, histogram in merged.items()}
+    total = sum(result['count'] for result in results.values())
+    return {
+        'elapsed_sec': elapsed,
+        'concurrency': concurrency,
+        'profile': profile,
+        'total_ops': total,
+        'throughput_ops': total / elapsed if elapsed else 0.0,
+        'operations': results,
+        'errors': errors
+    }
+
+
+def compare_reports(current, baseline, tolerance=0.2, min_delta_ms=1.0):
+    """작업별 (이름, 기준 p95, 현재 p95, 기준 처리량, 현재 처리량) 비교 행과 회귀 목록 반환
+    
+    p95 가 tolerance 비율과 min_delta_ms 를 모두 넘게 늘거나 처리량이 tolerance 비율 넘게 줄면 회귀.
+    """
+    rows, regressions = [], []
+    previous_operations = (baseline.get('replay') or {}).get('operations', {})
+    for name, result in current['replay']['operations'].items():
+        previous = previous_operations.get(name)
+        if not previous or not previous['count'] or not result['count']:
+            continue
+        rows.append((name, previous['p95_ms'], result['p95_ms'], previous['throughput_ops'], result['throughput_ops']))
+        if result['p95_ms'] > max(previous['p95_ms'] * (1 + tolerance), previous['p95_ms'] + min_delta_ms):
+            regressions.append(f"{name}: p95 {previous['p95_ms']:.2f}ms → {result['p95_ms']:.2f}ms")
+        if result['throughput_ops'] < previous['throughput_ops'] * (1 - tolerance):
+            regressions.append(
+                f"{name}: 처리량 {previous['throughput_ops']:.1f} → {result['throughput_ops']:.1f} ops/s"
+            )
+    return rows, regressions
@@ -5,9 +5,20 @@
 개발 환경에서는 유지하되, 프로덕션에서만 제거
 """
 
+import argparse
+import mmap
 import os
 import re
 import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+SOURCE_EXTENSIONS = ('.tsx', '.ts', '.jsx', '.js')
+EXCLUDED_DIRS = ['node_modules', 'build', '.git', 'dist']
+DEFAULT_SRC_DIR = '/home/user/webapp/src'
+
+# 병렬 모드에서 워커 하나가 처리하는 파일 수
+DEFAULT_BATCH_SIZE = 64
 
 def remove_console_logs(file_path):
     """파일에서 console.log 제거"""
@@ -57,40 +68,125 @@ def remove_console_logs(file_path):
         print(f"Error processing {file_path}: {e}")
         return False
 
+def iter_source_files(directory):
+    """제외 디렉토리를 건너뛰며 대상 소스 파일 경로 생성"""
+    for root, dirs, files in os.walk(directory):
+        # node_modules, build 디렉토리 제외
+        dirs[:] = [d for d in dirs if d not in EXCLUDED_DIRS]
+        for file in files:
+            if file.endswith(SOURCE_EXTENSIONS):
+                yield os.path.join(root, file)
+
+def has_console(file_path):
+    """파일 전체를 디코딩/분할하지 않고 바이트 단위로 'console.' 포함 여부만 확인"""
+    with open(file_path, 'rb') as f:
+        # 빈 파일은 mmap 할 수 없음
+        if os.fstat(f.fileno()).st_size == 0:
+            return False
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return mapped.find(b'console.') != -1
+
+def process_batch(file_paths):
+    """워커 프로세스: 사전 검사를 통과한 파일만 remove_console_logs 처리"""
+    stats = {'files': 0, 'bytes': 0, 'matched': 0, 'modified': []}
+    for file_path in file_paths:
+        stats['files'] += 1
+        try:
+            stats['bytes'] += os.path.getsize(file_path)
+            if not has_console(file_path):
+                continue
+        except OSError as e:
+            print(f"Error processing {file_path}: {e}")
+            continue
+        stats['matched'] += 1
+        if remove_console_logs(file_path):
+            stats['modified'].append(file_path)
+    return stats
+
+def scan_and_remove_parallel(directories, workers=None, batch_size=DEFAULT_BATCH_SIZE):
+    """프로세스 풀로 파일 배치를 나눠 console.log 제거, (수정 파일 목록, 통계) 반환"""
+    started = time.perf_counter()
+    stats = {'files': 0, 'bytes': 0, 'matched': 0, 'modified': 0}
+    modified_files = []
+    
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = []
+        batch = []
+        for directory in directories:
+            for file_path in iter_source_files(directory):
+                batch.append(file_path)
+                if len(batch) >= batch_size:
+                    futures.append(executor.submit(process_batch, batch))
+                    batch = []
+        if batch:
+            futures.append(executor.submit(process_batch, batch))
+        
+        for future in futures:
+            result = future.result()
+            stats['files'] += result['files']
+            stats['bytes'] += result['bytes']
+            stats['matched'] += result['matched']
+            modified_files.extend(result['modified'])
+    
+    stats['modified'] = len(modified_files)
+    stats['elapsed'] = time.perf_counter() - started
+    return modified_files, stats
+
 def scan_and_remove(directory):
-    """디렉토리 스캔하여 console.log 제거"""
+    """디렉토리 스캔하여 console.log 제거 (직렬)"""
     modified_files = []
     total_files = 0
     
-    for root, dirs, files in os.walk(directory):
-        # node_modules, build 디렉토리 제외
-        dirs[:] = [d for d in dirs if d not in ['node_modules', 'build', '.git', 'dist']]
+    for file_path in iter_source_files(directory):
+        total_files += 1
         
-        for file in files:
-            if file.endswith(('.tsx', '.ts', '.jsx', '.js')):
-                file_path = os.path.join(root, file)
-                total_files += 1
-                
-                if remove_console_logs(file_path):
-                    modified_files.append(file_path)
+        if remove_console_logs(file_path):
+            modified_files.append(file_path)
     
     return modified_files, total_files
 
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='프로덕션 빌드용 console.log 제거')
+    parser.add_argument('directories', nargs='*', default=[DEFAULT_SRC_DIR],
+                        help=f'스캔할 디렉토리 (기본: {DEFAULT_SRC_DIR})')
+    parser.add_argument('--parallel', action='store_true',
+                        help='프로세스 풀 + 바이트 사전 검사로 스캔')
+    parser.add_argument('--workers', type=int, default=None, help='병렬 모드 워커 프로세스 수 (기본: CPU 수)')
+    parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE, help='워커당 파일 배치 크기')
+    return parser.parse_args(argv)
+
 if __name__ == '__main__':
+    args = parse_args()
     print("🔍 console.log 제거 스크립트 실행 중...")
     print("=" * 60)
     
-    src_dir = '/home/user/webapp/src'
+    for src_dir in args.directories:
+        if not os.path.exists(src_dir):
+            print(f"❌ 디렉토리를 찾을 수 없습니다: {src_dir}")
+            sys.exit(1)
     
-    if not os.path.exists(src_dir):
-        print(f"❌ 디렉토리를 찾을 수 없습니다: {src_dir}")
-        sys.exit(1)
-    
-    modified_files, total_files = scan_and_remove(src_dir)
+    if args.parallel:
+        modified_files, stats = scan_and_remove_parallel(args.directories, args.workers, args.batch_size)
+        total_files = stats['files']
+    else:
+        started = time.perf_counter()
+        modified_files, total_files = [], 0
+        for src_dir in args.directories:
+            modified, count = scan_and_remove(src_dir)
+            modified_files += modified
+            total_files += count
+        stats = {'elapsed': time.perf_counter() - started}
     
+    elapsed = stats['elapsed']
     print(f"\n📊 스캔 결과:")
     print(f"   - 전체 파일: {total_files}개")
+    if args.parallel:
+        print(f"   - console. 포함 파일: {stats['matched']}개")
     print(f"   - 수정된 파일: {len(modified_files)}개")
+    print(f"   - 소요 시간: {elapsed:.2f}초 ({total_files / elapsed if elapsed else 0:.0f} files/sec)")
+    if args.parallel:
+        print(f"   - 처리량: {stats['bytes'] / elapsed / 1024 / 1024 if elapsed else 0:.1f} MB/sec "
+              f"({stats['bytes']} bytes)")
     
     if modified_files:
         print(f"\n✅ 수정된 파일 목록:")